@@ -6,10 +6,10 @@ from datetime import datetime
 
 sys.path.append(str(Path(__file__).parent))
 
-from scraper.manager import NewsScraper
-from database.repository import DatabaseManager
-from analyzer.sentiment import NewsAnalyzer
-from dashboard.components import DashboardUI
+from dashboard.data import (
+    finish_rerun, get_db, get_job_manager, get_ui, live_articles, load_filter_options,
+    render_auto_refresh, start_rerun
+)
 
 st.set_page_config(
     page_title="News Analyzer",
@@ -65,34 +65,40 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_resource
-def init_components():
-    scraper = NewsScraper(max_workers=4)
-    db = DatabaseManager('news.db')
-    analyzer = NewsAnalyzer()
-    ui = DashboardUI()
-    return scraper, db, analyzer, ui
+start_rerun("MainPage")
 
-scraper, db, analyzer, ui = init_components()
+jobs, db, ui = get_job_manager(), get_db(), get_ui()
 
 st.sidebar.markdown("### 🔄 Veri Toplama")
 
 if st.sidebar.button("🚀 YENİ HABERLER ÇEK", use_container_width=True, type="primary"):
-    with st.spinner("Haberler çekiliyor..."):
-        articles = scraper.scrape_all(db_manager=db)
-        result = db.dbInsertArticlesBulk(articles)
-
-        st.sidebar.success(f"""
-        ✅ **Tamamlandı!**
-        - 🔍 Çekilen: {len(articles)} haber
-        - ✅ YENİ: {result['saved']} haber
-        - 🔄 Duplicate: {result.get('duplicate', 0)} haber
-        - ❌ Başarısız: {result.get('failed', 0)}
-        """)
-
-        time.sleep(2)
+    # Scrape arka planda çalışır; sürmekte olan bir iş varsa ona katılınır
+    st.session_state['scrape_job_id'] = jobs.submit().id
+
+# Bu oturumun işi, yoksa başka bir oturumun başlattığı ve hâlâ süren iş gösterilir
+job = jobs.get(st.session_state.get('scrape_job_id', 0))
+if job is None and jobs.current() is not None and jobs.current().is_running:
+    job = jobs.current()
+
+
+@st.fragment(run_every=1.0 if job is not None and job.is_running else None)
+def scrape_progress():
+    if job is None:
+        return
+
+    snapshot = job.snapshot()
+    st.session_state['scrape_job'] = snapshot
+    ui.render_scrape_progress(snapshot)
+
+    # İş bitince veriyi yenilemek için sayfa bir kez baştan çalıştırılır
+    if not job.is_running and st.session_state.get('scrape_job_refreshed') != job.id:
+        st.session_state['scrape_job_refreshed'] = job.id
         st.rerun()
 
+
+with st.sidebar:
+    scrape_progress()
+
 if st.sidebar.button("🧪 Test Verisi Ekle", use_container_width=True):
     test_articles = [
         {
@@ -131,14 +137,13 @@ if st.sidebar.button("🗑️ VERİTABANINI TEMİZLE", use_container_width=True,
     st.rerun()
 
 st.sidebar.markdown("---")
+render_auto_refresh()
 
-df = db.dbGetAllArticles(limit=1000)
-
-if not df.empty:
-    df = analyzer.analyze_batch(df)
-
-filters = ui.render_sidebar_filters(df)
-df_filtered = ui.apply_filters(df.copy(), filters) if not df.empty else df
+# Filtreler SQL'e gönderilir; limit filtrelenmiş sonuca uygulanır
+filters = ui.render_sidebar_filters(load_filter_options())
+# Pencere oturumlar arasında paylaşılır; yeni haberlerde yalnızca delta okunur
+live = live_articles(limit=1000, filters=filters)
+df_filtered = live.refresh()
 
 st.markdown("""
     <div style='text-align: center; padding: 24px; background: white; border-radius: 15px; margin-bottom: 24px; box-shadow: 0 6px 12px rgba(0,0,0,0.15);'>
@@ -155,7 +160,7 @@ if df_filtered.empty:
     """)
     st.stop()
 
-ui.render_metrics(df_filtered)
+ui.render_metrics(df_filtered, live.summary())
 
 st.markdown("---")
 
@@ -176,4 +181,6 @@ st.markdown("---")
 st.subheader("📈 Son Trendler")
 ui.plot_sentiment_timeline(df_filtered)
 
-ui.render_footer()
\ No newline at end of file
+ui.render_footer()
+
+finish_rerun()
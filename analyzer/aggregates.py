@@ -0,0 +1,168 @@
+import math
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional
+
+DEFAULT_ALPHA = 0.1
+DEFAULT_WINDOW = 100
+
+
+def finite_score(score) -> Optional[float]:
+    """Skoru float'a çevirir; None, NaN ve sonsuz değerler için None"""
+    try:
+        value = float(score)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+class OnlineStats:
+    """
+    Tek bir skor akışı için O(1) güncellenen istatistikler.
+
+    Üstel ağırlıklı ortalama/varyans (EWMA) ve son `window` skorun
+    kayan ortalama/std'si tutulur. Kayan pencere toplamları her
+    güncellemede artırılıp azaltılır; tablo taraması gerekmez.
+    """
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha 0 ile 1 arasında olmalı")
+        if window < 1:
+            raise ValueError("window en az 1 olmalı")
+
+        self.alpha = alpha
+        self.window = window
+        self.count = 0
+        self.ewma = 0.0
+        self.ewvar = 0.0
+        self.values = deque(maxlen=window)
+        self.win_sum = 0.0
+        self.win_sq = 0.0
+        self.last_at: Optional[str] = None
+
+    def update(self, value: float, when=None) -> "OnlineStats":
+        value = float(value)
+
+        if self.count == 0:
+            self.ewma, self.ewvar = value, 0.0
+        else:
+            # West'in artımlı EWMA varyans formülü
+            diff = value - self.ewma
+            incr = self.alpha * diff
+            self.ewma += incr
+            self.ewvar = (1 - self.alpha) * (self.ewvar + diff * incr)
+
+        if len(self.values) == self.window:
+            old = self.values[0]
+            self.win_sum -= old
+            self.win_sq -= old * old
+        self.values.append(value)
+        self.win_sum += value
+        self.win_sq += value * value
+
+        self.count += 1
+        self.last_at = str(when if when is not None else datetime.now())
+        return self
+
+    # ---------------- READ ----------------
+
+    @property
+    def rolling_mean(self) -> float:
+        return self.win_sum / len(self.values) if self.values else 0.0
+
+    @property
+    def rolling_std(self) -> float:
+        # pandas rolling().std() ile aynı şekilde ddof=1
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        var = (self.win_sq - self.win_sum * self.win_sum / n) / (n - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "ewma_mean": round(self.ewma, 4),
+            "ewma_std": round(math.sqrt(max(self.ewvar, 0.0)), 4),
+            "rolling_mean": round(self.rolling_mean, 4),
+            "rolling_std": round(self.rolling_std, 4),
+            "window_size": len(self.values),
+            "last_at": self.last_at,
+        }
+
+    # ---------------- STATE ----------------
+
+    def to_state(self) -> Dict:
+        return {
+            "alpha": self.alpha,
+            "window": self.window,
+            "count": self.count,
+            "ewma": self.ewma,
+            "ewvar": self.ewvar,
+            "values": list(self.values),
+            "last_at": self.last_at,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "OnlineStats":
+        stats = cls(alpha=state["alpha"], window=state["window"])
+        stats.count = state["count"]
+        stats.ewma = state["ewma"]
+        stats.ewvar = state["ewvar"]
+        stats.values.extend(state["values"])
+        # Toplamlar pencereden yeniden hesaplanır; birikmiş kayan nokta hatası sıfırlanır
+        stats.win_sum = math.fsum(stats.values)
+        stats.win_sq = math.fsum(v * v for v in stats.values)
+        stats.last_at = state.get("last_at")
+        return stats
+
+
+class SentimentAggregator:
+    """
+    Kaynak başına ve tüm kaynakların birlikte (overall) canlı sentiment
+    istatistikleri. Genel akış ayrı tutulur; hiçbir kaynak adıyla çakışmaz.
+    """
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW):
+        self.alpha = alpha
+        self.window = window
+        self.stats: Dict[str, OnlineStats] = {}
+        self.overall = OnlineStats(alpha, window)
+
+    def _get(self, key: str) -> OnlineStats:
+        if key not in self.stats:
+            self.stats[key] = OnlineStats(self.alpha, self.window)
+        return self.stats[key]
+
+    def update(self, source: str, score: Optional[float], when=None):
+        """Tek haberin skorunu kaynak ve genel istatistiklere ekler"""
+        score = finite_score(score)
+        if score is None:
+            return
+        self._get(source).update(score, when)
+        self.overall.update(score, when)
+
+    def snapshot(self, source: Optional[str] = None) -> Dict:
+        """source verilirse o kaynağın, verilmezse tüm kaynakların özeti"""
+        if source is not None:
+            return self.stats[source].snapshot() if source in self.stats else {}
+        return {key: stats.snapshot() for key, stats in self.stats.items()}
+
+    def overall_snapshot(self) -> Dict:
+        return self.overall.snapshot() if self.overall.count else {}
+
+    def to_state(self) -> Dict:
+        return {
+            "sources": {key: stats.to_state() for key, stats in self.stats.items()},
+            "overall": self.overall.to_state(),
+        }
+
+    @classmethod
+    def from_state(
+        cls, state: Dict, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW
+    ) -> "SentimentAggregator":
+        aggregator = cls(alpha, window)
+        aggregator.stats = {key: OnlineStats.from_state(s) for key, s in state["sources"].items()}
+        aggregator.overall = OnlineStats.from_state(state["overall"])
+        return aggregator
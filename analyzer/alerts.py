@@ -0,0 +1,194 @@
+import math
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from analyzer.aggregates import OnlineStats, finite_score
+
+# Dedektör başına varsayılan karar sınırı; CUSUM için h=8, k=0.5 ile
+# sakin akışta yanlış alarm binlerce haberde bir kez
+DETECTORS = {"cusum": 8.0, "zscore": 4.0}
+
+
+def _timestamp(when) -> float:
+    if isinstance(when, datetime):
+        return when.timestamp()
+    try:
+        return datetime.fromisoformat(str(when)).timestamp()
+    except ValueError:
+        return datetime.now().timestamp()
+
+
+class SpikeDetector:
+    """
+    Tek kaynak için artımlı sentiment ve hacim sıçrama dedektörü.
+
+    Her haber için yapılan iş sabittir: taban çizgisi OnlineStats ile
+    (kayan pencere + EWMA) tutulur, hacim ise bucket_minutes'lık
+    kovalardaki haber sayısının kayan istatistiğiyle karşılaştırılır.
+
+    method='cusum': standardize skorların iki yönlü CUSUM'u; k kayma
+                    toleransı, threshold karar sınırı (h)
+    method='zscore': kısa vadeli EWMA'nın uzun pencere ortalamasından
+                     z-skoru; threshold aşılınca uyarı
+    """
+
+    def __init__(
+        self,
+        method: str = "cusum",
+        threshold: Optional[float] = None,
+        k: float = 0.5,
+        min_count: int = 30,
+        window: int = 200,
+        fast_alpha: float = 0.3,
+        bucket_minutes: int = 60,
+        volume_threshold: float = 4.0,
+        cooldown: int = 20
+    ):
+        if method not in DETECTORS:
+            raise ValueError(f"Bilinmeyen dedektör: {method}")
+
+        self.method = method
+        self.threshold = DETECTORS[method] if threshold is None else threshold
+        self.k = k
+        self.min_count = min_count
+        self.window = window
+        self.fast_alpha = fast_alpha
+        self.bucket_minutes = bucket_minutes
+        self.volume_threshold = volume_threshold
+        self.cooldown = cooldown
+        self.reset()
+
+    def reset(self):
+        self.baseline = OnlineStats(alpha=self.fast_alpha, window=self.window)
+        self.cusum_hi = 0.0
+        self.cusum_lo = 0.0
+        self.quiet = 0
+        self.volume = OnlineStats(window=min(self.window, 168))
+        self.bucket: Optional[int] = None
+        self.bucket_count = 0
+        self.volume_alerted = False
+
+    # ---------------- DETECTION ----------------
+
+    def observe(self, score: Optional[float], when=None) -> List[Dict]:
+        """Bir haberi işler; tetiklenen uyarıları döndürür"""
+        alerts = []
+        volume_alert = self._observeVolume(when if when is not None else datetime.now())
+        if volume_alert:
+            alerts.append(volume_alert)
+
+        # None/NaN/±inf taban çizgisine girerse EWMA kalıcı olarak NaN olur
+        score = finite_score(score)
+        if score is None:
+            return alerts
+
+        sentiment_alert = self._observeSentiment(score)
+        if sentiment_alert:
+            alerts.append(sentiment_alert)
+        return alerts
+
+    def _observeSentiment(self, score: float) -> Optional[Dict]:
+        base = self.baseline
+        ready = base.count >= self.min_count and len(base.values) >= 2
+        mean, std = base.rolling_mean, max(base.rolling_std, 1e-3)
+        alert = None
+
+        if ready and self.method == "cusum":
+            z = (score - mean) / std
+            self.cusum_hi = max(0.0, self.cusum_hi + z - self.k)
+            self.cusum_lo = max(0.0, self.cusum_lo - z - self.k)
+            if self.cusum_lo > self.threshold or self.cusum_hi > self.threshold:
+                drop = self.cusum_lo > self.threshold
+                alert = self._sentimentAlert(drop, max(self.cusum_hi, self.cusum_lo), mean)
+                self.cusum_hi = self.cusum_lo = 0.0
+
+        base.update(score)
+
+        if ready and self.method == "zscore":
+            # Kısa vadeli EWMA'nın standart hatası: std * sqrt(a / (2 - a))
+            a = self.fast_alpha
+            z = (base.ewma - mean) / (std * math.sqrt(a / (2 - a)))
+            if abs(z) > self.threshold:
+                alert = self._sentimentAlert(z < 0, abs(z), mean)
+
+        # Aynı dalga için art arda uyarı üretilmez
+        if self.quiet > 0:
+            self.quiet -= 1
+            return None
+        if alert:
+            self.quiet = self.cooldown
+        return alert
+
+    def _sentimentAlert(self, drop: bool, score: float, baseline: float) -> Dict:
+        return {
+            "kind": "sentiment_drop" if drop else "sentiment_rise",
+            "detector": self.method,
+            "score": round(score, 3),
+            "value": round(self.baseline.ewma, 4),
+            "baseline": round(baseline, 4),
+        }
+
+    def _observeVolume(self, when) -> Optional[Dict]:
+        bucket = int(_timestamp(when) // (self.bucket_minutes * 60))
+
+        if self.bucket is None:
+            self.bucket = bucket
+        elif bucket > self.bucket:
+            # Biten kova ve aradaki boş kovalar (pencere kadarıyla sınırlı) tabana eklenir
+            self.volume.update(self.bucket_count)
+            for _ in range(min(bucket - self.bucket - 1, self.volume.window)):
+                self.volume.update(0)
+            self.bucket, self.bucket_count, self.volume_alerted = bucket, 0, False
+        elif bucket < self.bucket:
+            # Geç gelen (eski tarihli) haber hacim tabanını etkilemez
+            return None
+
+        self.bucket_count += 1
+        vol = self.volume
+        if self.volume_alerted or vol.count < max(self.min_count // 3, 3):
+            return None
+
+        mean = vol.rolling_mean
+        # Poisson tabanı: std en az sqrt(ortalama)
+        std = max(vol.rolling_std, math.sqrt(max(mean, 1.0)))
+        z = (self.bucket_count - mean) / std
+        if z <= self.volume_threshold:
+            return None
+
+        self.volume_alerted = True
+        return {
+            "kind": "volume_spike",
+            "detector": "zscore",
+            "score": round(z, 3),
+            "value": float(self.bucket_count),
+            "baseline": round(mean, 4),
+        }
+
+    # ---------------- STATE ----------------
+
+    def to_state(self) -> Dict:
+        return {
+            "baseline": self.baseline.to_state(),
+            "cusum_hi": self.cusum_hi,
+            "cusum_lo": self.cusum_lo,
+            "quiet": self.quiet,
+            "volume": self.volume.to_state(),
+            "bucket": self.bucket,
+            "bucket_count": self.bucket_count,
+            "volume_alerted": self.volume_alerted,
+        }
+
+    def load_state(self, state: Dict) -> "SpikeDetector":
+        self.baseline = OnlineStats.from_state(state["baseline"])
+        self.cusum_hi = state["cusum_hi"]
+        self.cusum_lo = state["cusum_lo"]
+        if not all(math.isfinite(v) for v in (self.baseline.ewma, self.baseline.ewvar, self.baseline.win_sum)):
+            # Sonsuz skorla bozulmuş eski durum: taban çizgisi sıfırdan ısınır
+            self.baseline = OnlineStats(alpha=self.fast_alpha, window=self.window)
+            self.cusum_hi = self.cusum_lo = 0.0
+        self.quiet = state["quiet"]
+        self.volume = OnlineStats.from_state(state["volume"])
+        self.bucket = state["bucket"]
+        self.bucket_count = state["bucket_count"]
+        self.volume_alerted = state["volume_alerted"]
+        return self
@@ -0,0 +1,278 @@
+import os
+import sqlite3
+import threading
+import logging
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - duckdb opsiyonel
+    duckdb = None
+
+from analyzer.labels import NEGATIVE_THRESHOLD, POSITIVE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsEngine:
+    """
+    Dashboard agregasyonları için sorgu katmanı.
+
+    engine='duckdb' iken SQLite dosyası (ve varsa Parquet arşivi) gömülü
+    DuckDB içinde okunur, groupby/quantile/histogram hesapları vektörel
+    olarak orada yapılır. duckdb kurulu değilse ya da engine='pandas'
+    seçildiyse mevcut SQLite + pandas yolu kullanılır. Her iki yol da
+    aynı kolonlarla küçük DataFrame'ler döndürür.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        archive_dir: Optional[str] = None,
+        engine: str = "auto"
+    ):
+        if engine not in ("auto", "duckdb", "pandas"):
+            raise ValueError(f"Bilinmeyen engine: {engine}")
+        if engine == "duckdb" and duckdb is None:
+            raise ImportError("duckdb kurulu değil: pip install duckdb")
+
+        self.db_path = db_path
+        self.archive_dir = archive_dir
+        self.engine = "duckdb" if engine == "auto" and duckdb is not None else (
+            "pandas" if engine == "auto" else engine
+        )
+        self._sqlite_scan: Optional[bool] = None
+        self._archive = None
+        self._lock = threading.Lock()
+
+    # ---------------- PUBLIC ----------------
+
+    def sentiment_by_source(self) -> pd.DataFrame:
+        """Kaynak bazında ortalama, std, adet ve etiket sayıları"""
+        if self.engine == "duckdb":
+            df = self._duckdb(f"""
+                SELECT source,
+                       AVG(sentiment) AS mean,
+                       STDDEV_SAMP(sentiment) AS std,
+                       COUNT(*) AS count,
+                       COUNT(*) FILTER (WHERE sentiment > {POSITIVE_THRESHOLD}) AS Positive,
+                       COUNT(*) FILTER (WHERE sentiment BETWEEN {NEGATIVE_THRESHOLD}
+                                                          AND {POSITIVE_THRESHOLD}) AS Neutral,
+                       COUNT(*) FILTER (WHERE sentiment < {NEGATIVE_THRESHOLD}) AS Negative
+                FROM news
+                GROUP BY source
+                ORDER BY source
+            """)
+        else:
+            raw = self._pandas()
+            if raw.empty:
+                return self._empty(["source", "mean", "std", "count",
+                                    "Positive", "Neutral", "Negative"])
+            s = raw["sentiment"]
+            raw = raw.assign(
+                Positive=(s > POSITIVE_THRESHOLD),
+                Neutral=(s >= NEGATIVE_THRESHOLD) & (s <= POSITIVE_THRESHOLD),
+                Negative=(s < NEGATIVE_THRESHOLD)
+            )
+            grouped = raw.groupby("source", sort=True)
+            df = pd.DataFrame({
+                "mean": grouped["sentiment"].mean(),
+                "std": grouped["sentiment"].std(),
+                "count": grouped["sentiment"].size(),
+                "Positive": grouped["Positive"].sum(),
+                "Neutral": grouped["Neutral"].sum(),
+                "Negative": grouped["Negative"].sum(),
+            }).reset_index()
+
+        return self._normalize(df, ints=["count", "Positive", "Neutral", "Negative"])
+
+    def timeline(self) -> pd.DataFrame:
+        """Günlük ortalama sentiment ve haber sayısı"""
+        if self.engine == "duckdb":
+            df = self._duckdb("""
+                SELECT CAST(date AS DATE) AS day,
+                       AVG(sentiment) AS sentiment,
+                       COUNT(*) AS article_count
+                FROM news
+                WHERE date IS NOT NULL
+                GROUP BY day
+                ORDER BY day
+            """)
+        else:
+            raw = self._pandas().dropna(subset=["date"])
+            if raw.empty:
+                return self._empty(["day", "sentiment", "article_count"])
+            grouped = raw.groupby(raw["date"].dt.normalize().rename("day"))
+            df = pd.DataFrame({
+                "sentiment": grouped["sentiment"].mean(),
+                "article_count": grouped["sentiment"].size(),
+            }).reset_index()
+
+        if not df.empty:
+            df["day"] = pd.to_datetime(df["day"]).dt.date
+        return self._normalize(df, ints=["article_count"])
+
+    def histogram(self, bins: int = 30, value_range: Sequence[float] = (-1.0, 1.0)) -> pd.DataFrame:
+        """Sentiment histogramı: [bin_left, bin_right, count]"""
+        lo, hi = float(value_range[0]), float(value_range[1])
+        edges = np.linspace(lo, hi, bins + 1)
+
+        if self.engine == "duckdb":
+            counts_df = self._duckdb(f"""
+                SELECT LEAST(CAST(FLOOR((sentiment - {lo}) * {bins} / ({hi} - {lo})) AS INTEGER),
+                             {bins - 1}) AS bin,
+                       COUNT(*) AS count
+                FROM news
+                WHERE sentiment BETWEEN {lo} AND {hi}
+                GROUP BY bin
+            """)
+            counts = np.zeros(bins, dtype="int64")
+            counts[counts_df["bin"].to_numpy(dtype="int64")] = counts_df["count"].to_numpy()
+        else:
+            raw = self._pandas()
+            counts, _ = np.histogram(raw["sentiment"].dropna().to_numpy(), bins=edges)
+
+        return pd.DataFrame({
+            "bin_left": edges[:-1],
+            "bin_right": edges[1:],
+            "count": counts.astype("int64"),
+        })
+
+    def quantiles(self, qs: Sequence[float] = (0.0, 0.25, 0.5, 0.75, 1.0)) -> pd.DataFrame:
+        """Kaynak bazında sentiment quantile'ları (lineer interpolasyon)"""
+        names = [f"q{int(round(q * 100))}" for q in qs]
+
+        if self.engine == "duckdb":
+            select = ", ".join(
+                f"QUANTILE_CONT(sentiment, {q}) AS {name}"
+                for q, name in zip(qs, names)
+            )
+            df = self._duckdb(f"""
+                SELECT source, {select}
+                FROM news
+                WHERE sentiment IS NOT NULL
+                GROUP BY source
+                ORDER BY source
+            """).round(6)
+        else:
+            raw = self._pandas().dropna(subset=["sentiment"])
+            if raw.empty:
+                return self._empty(["source"] + names)
+            df = raw.groupby("source", sort=True)["sentiment"].quantile(list(qs)).unstack()
+            df.columns = names
+            df = df.round(6).reset_index()
+
+        return self._normalize(df)
+
+    # ---------------- DUCKDB ----------------
+
+    def _duckdb(self, sql: str) -> pd.DataFrame:
+        with self._lock:
+            con = duckdb.connect()
+            try:
+                self._registerSources(con)
+                return con.execute(sql).df()
+            finally:
+                con.close()
+
+    def _registerSources(self, con):
+        hot = self._hotRelation(con)
+        cold = self._coldPattern()
+
+        if cold:
+            con.execute(f"""
+                CREATE VIEW news AS
+                SELECT id, source, sentiment, date FROM {hot}
+                UNION ALL
+                SELECT id, source, sentiment, date
+                FROM read_parquet('{cold}', hive_partitioning = true)
+                WHERE id NOT IN (SELECT id FROM {hot})
+            """)
+        else:
+            con.execute(f"CREATE VIEW news AS SELECT id, source, sentiment, date FROM {hot}")
+
+    def _hotRelation(self, con) -> str:
+        # Önce sqlite eklentisiyle dosyayı doğrudan taramayı dene
+        if self._sqlite_scan is not False:
+            try:
+                con.execute("LOAD sqlite")
+                con.execute(f"""
+                    CREATE VIEW hot AS
+                    SELECT id, source, CAST(sentiment AS DOUBLE) AS sentiment,
+                           TRY_CAST(date AS TIMESTAMP) AS date
+                    FROM sqlite_scan('{self._quote(self.db_path)}', 'articles')
+                """)
+                self._sqlite_scan = True
+                return "hot"
+            except Exception as e:
+                if self._sqlite_scan is None:
+                    logger.info(f"DuckDB sqlite eklentisi yok, Arrow taramasına geçiliyor: {e}")
+                self._sqlite_scan = False
+
+        # Eklenti yoksa yalnızca gereken kolonlar SQLite'dan çekilip kaydedilir
+        con.register("hot_frame", self._readSqlite())
+        return "hot_frame"
+
+    def _coldPattern(self) -> Optional[str]:
+        if not self.archive_dir or not os.path.isdir(self.archive_dir):
+            return None
+        for _, _, files in os.walk(self.archive_dir):
+            if any(f.endswith(".parquet") for f in files):
+                return self._quote(os.path.join(self.archive_dir, "**", "*.parquet"))
+        return None
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace("'", "''")
+
+    # ---------------- PANDAS ----------------
+
+    def _readSqlite(self) -> pd.DataFrame:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            df = pd.read_sql_query(
+                "SELECT id, source, sentiment, date FROM articles", conn
+            )
+        finally:
+            conn.close()
+        df["sentiment"] = df["sentiment"].astype("float64")
+        # Kayıtlı tarihler mikrosaniyeli ve mikrosaniyesiz karışık; format
+        # ilk satırdan tahmin edilirse diğer biçimdeki satırlar NaT olur
+        df["date"] = pd.to_datetime(df["date"], format="ISO8601", errors="coerce")
+        return df
+
+    def _archiveReader(self):
+        # Soğuk okuma veritabanı gerektirmez; okuyucu bir kez kurulur
+        if self._archive is None:
+            from database.archive import ArticleArchive
+            self._archive = ArticleArchive(None, archive_dir=self.archive_dir)
+        return self._archive
+
+    def _pandas(self) -> pd.DataFrame:
+        hot = self._readSqlite()
+        if not self._coldPattern():
+            return hot
+
+        cold = self._archiveReader().readArticles(columns=list(hot.columns), include_hot=False)
+        if cold.empty:
+            return hot
+        # DuckDB görünümüyle aynı: hem arşivde hem SQLite'ta olan satırda sıcak kopya geçerli
+        return pd.concat([cold, hot], ignore_index=True).drop_duplicates(subset="id", keep="last")
+
+    # ---------------- HELPERS ----------------
+
+    @staticmethod
+    def _empty(columns) -> pd.DataFrame:
+        return pd.DataFrame(columns=columns)
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame, ints: Sequence[str] = ()) -> pd.DataFrame:
+        df = df.reset_index(drop=True)
+        if "source" in df.columns:
+            df["source"] = df["source"].astype(object)
+        for col in ints:
+            if col in df.columns:
+                df[col] = df[col].astype("int64")
+        return df
@@ -0,0 +1,110 @@
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from analyzer.scorers import get_scorer
+
+logger = logging.getLogger(__name__)
+
+
+def score_titles(titles: List[str]) -> List[float]:
+    """
+    Başlıkları varsayılan skorlayıcıyla toplu skorlar (process havuzunda
+    çalışabilmesi için modül seviyesinde; alt süreç de aynı ortam
+    değişkenine göre skorlayıcı seçer)
+    """
+    return get_scorer().score_many(titles).polarity.tolist()
+
+
+class SentimentBackfill:
+    """
+    Geçmiş haberleri yeni sentiment modeliyle parça parça yeniden skorlar.
+
+    Satırlar id sırasıyla chunk_size'lık parçalar halinde okunur, toplu
+    skorlanır ve her parça tek transaction'da checkpoint ile birlikte
+    yazılır. İş yarıda kesilirse bir sonraki run() kaldığı yerden devam
+    eder. Transaction'lar kısa tutulduğu için canlı ingest etkilenmez.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        scorer: Callable[[List[str]], List[float]] = score_titles,
+        model_version: Optional[str] = None,
+        chunk_size: int = 500,
+        workers: int = 1,
+        job_name: str = "sentiment"
+    ):
+        self.db = db_manager
+        self.scorer = scorer
+        # Sürüm verilmezse varsayılan skorlayıcınınki kullanılır
+        self.model_version = model_version or get_scorer().version
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.job_name = job_name
+
+    def _startId(self) -> int:
+        checkpoint = self.db.dbGetBackfillCheckpoint(self.job_name)
+        if checkpoint and checkpoint["model_version"] == self.model_version:
+            return checkpoint["last_id"]
+        return 0
+
+    def _score(self, titles: List[str], pool: Optional[ProcessPoolExecutor]) -> List[float]:
+        if pool is None:
+            return list(self.scorer(titles))
+
+        # Parçayı işçi sayısı kadar alt parçaya bölüp paralel skorla
+        step = max(1, -(-len(titles) // self.workers))
+        parts = [titles[i:i + step] for i in range(0, len(titles), step)]
+        return [score for part in pool.map(self.scorer, parts) for score in part]
+
+    def run(self, max_chunks: Optional[int] = None) -> Dict:
+        """Backfill'i çalıştırır; özet ve satır/sn throughput döndürür"""
+        start_id = last_id = self._startId()
+        rows = chunks = 0
+        started = time.perf_counter()
+
+        if start_id:
+            logger.info(f"Backfill '{self.job_name}' id={start_id} sonrasından devam ediyor")
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            while max_chunks is None or chunks < max_chunks:
+                chunk = self.db.dbGetRescoreChunk(last_id, self.chunk_size, self.model_version)
+                if not chunk:
+                    break
+
+                ids = [article_id for article_id, _ in chunk]
+                scores = self._score([title for _, title in chunk], pool)
+
+                last_id = ids[-1]
+                rows += self.db.dbApplySentimentChunk(
+                    self.job_name, self.model_version, list(zip(ids, scores)), last_id
+                )
+                chunks += 1
+
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"Backfill: {rows} satır, son id={last_id}, "
+                    f"{rows / elapsed if elapsed else 0:.0f} satır/sn"
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "job": self.job_name,
+            "model_version": self.model_version,
+            "resumed_from": start_id,
+            "last_id": last_id,
+            "rows": rows,
+            "chunks": chunks,
+            "elapsed_sec": round(elapsed, 3),
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed and rows else 0.0,
+        }
+
+    def reset(self):
+        """Checkpoint'i silerek bir sonraki run()'ın baştan başlamasını sağlar"""
+        self.db.dbResetBackfillCheckpoint(self.job_name)
@@ -0,0 +1,282 @@
+import os
+import re
+import json
+import shutil
+import sqlite3
+import tempfile
+import tracemalloc
+import time
+import random
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from collections import Counter
+from typing import Dict, List, Optional
+
+from analyzer.sentiment import NewsAnalyzer
+from analyzer.scorers import available_scorers, get_scorer
+from analyzer.tokenizer import STOP_WORDS, Tokenizer
+from analyzer.trending import TrendingEngine
+
+WORDS = [
+    'world', 'news', 'government', 'election', 'market', 'economy', 'climate',
+    'health', 'police', 'court', 'minister', 'president', 'trade', 'energy',
+    'football', 'science', 'space', 'storm', 'protest', 'talks', 'budget',
+    'border', 'school', 'crisis', 'technology', 'company', 'shares', 'prices',
+    'inflation', 'military', 'peace', 'summit', 'report', 'study', 'record',
+]
+
+
+def synthetic_titles(n: int, days: int = 30, seed: int = 7) -> pd.DataFrame:
+    """Benchmark'lar için tekrarlanabilir sahte başlık/tarih/kaynak verisi"""
+    rng = random.Random(seed)
+    vocab = WORDS + [f'topic{i:05d}' for i in range(5000)]
+    sources = ['BBC News', 'CNN', 'Al Jazeera', 'NPR']
+    end = datetime(2026, 1, 31, 12)
+    step = timedelta(days=days) / max(n, 1)
+
+    titles = [
+        ' '.join(rng.choice(vocab) if rng.random() < 0.6 else rng.choice(WORDS)
+                 for _ in range(rng.randint(6, 12)))
+        for _ in range(n)
+    ]
+    sentiment = np.round(np.random.default_rng(seed).uniform(-1, 1, n), 3)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'title': titles,
+        'url': [f'https://example.com/{i}' for i in range(n)],
+        'source': [rng.choice(sources) for _ in range(n)],
+        'sentiment': sentiment,
+        'date': [end - step * (n - i) for i in range(n)],
+    })
+
+
+def synthetic_corpus(n: int, seed: int = 7) -> List[str]:
+    """Yalnızca başlık gereken benchmark'lar için hızlı başlık üretici"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array(WORDS + sorted(STOP_WORDS) + ['a', 'of', 'in', 'the']
+                     + [f'topic{i:05d}' for i in range(20000)], dtype=object)
+    picks = vocab[rng.integers(0, len(vocab), size=(n, 9))]
+    return [' '.join(row) for row in picks]
+
+
+def synthetic_articles(n: int, days: int = 30, seed: int = 7) -> pd.DataFrame:
+    """synthetic_titles ile aynı kolonlar; milyon satır için numpy ile üretilir"""
+    rng = np.random.default_rng(seed)
+    sources = np.array([f'Source {i}' for i in range(24)], dtype=object)
+    end = np.datetime64('2026-01-31T12:00:00')
+    offsets = np.sort(rng.integers(0, days * 86400, size=n))[::-1]
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'title': synthetic_corpus(n, seed),
+        'url': [f'https://example.com/{i}' for i in range(n)],
+        'source': sources[rng.integers(0, len(sources), size=n)],
+        'sentiment': np.round(rng.uniform(-1, 1, n), 3),
+        'date': end - offsets.astype('timedelta64[s]'),
+    })
+
+
+POLAR_WORDS = [
+    'great', 'terrible', 'good', 'bad', 'strong', 'weak', 'happy', 'sad',
+    'best', 'worst', 'deadly', 'hopeful', 'angry', 'successful', 'failed', 'not',
+]
+
+
+def synthetic_headlines(n: int, seed: int = 7) -> List[str]:
+    """Skorlayıcı benchmark'ı için duygu kelimesi içeren sahte başlıklar"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array(WORDS + POLAR_WORDS + ['the', 'of', 'in', 'after'], dtype=object)
+    lengths = rng.integers(6, 13, size=n)
+    return [' '.join(vocab[rng.integers(0, len(vocab), size=k)]).capitalize() for k in lengths]
+
+
+def _legacy_keywords(titles: List[str], top_n: int):
+    # Tokenizer modülünden önceki extract_keywords(' '.join(titles)) yolu
+    words = re.findall(r'\b\w{4,}\b', ' '.join(titles).lower())
+    words = [w for w in words if w not in STOP_WORDS]
+    return Counter(words).most_common(top_n)
+
+
+def bench_tokenizer(n_titles: int = 1_000_000, top_n: int = 20) -> Dict:
+    """Eski birleştir-findall-filtrele yolu ile akışlı Tokenizer'ı karşılaştırır"""
+    titles = synthetic_corpus(n_titles)
+    tokenizer = Tokenizer()
+
+    started = time.perf_counter()
+    legacy = _legacy_keywords(titles, top_n)
+    legacy_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    streaming = tokenizer.most_common(iter(titles), top_n)
+    streaming_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    Tokenizer(ngram_range=(1, 2)).count(iter(titles))
+    bigram_sec = time.perf_counter() - started
+
+    return {
+        "benchmark": "tokenizer",
+        "titles": n_titles,
+        "legacy_sec": round(legacy_sec, 4),
+        "streaming_sec": round(streaming_sec, 4),
+        "speedup": round(legacy_sec / streaming_sec, 2),
+        "streaming_bigram_sec": round(bigram_sec, 4),
+        "identical": legacy == streaming,
+    }
+
+
+def bench_analyzer(sizes=(10_000, 100_000, 1_000_000)) -> List[Dict]:
+    """NewsAnalyzer metotlarının satır sayısına göre süreleri"""
+    analyzer = NewsAnalyzer()
+    results = []
+    for n in sizes:
+        df = synthetic_articles(n)
+        labeled = analyzer.analyze_batch(df)
+        methods = {
+            'analyze_batch': lambda: analyzer.analyze_batch(df),
+            'sentiment_by_source': lambda: analyzer.sentiment_by_source(labeled),
+            'sentiment_over_time': lambda: analyzer.sentiment_over_time(df),
+            'get_sentiment_distribution': lambda: analyzer.get_sentiment_distribution(labeled),
+            'get_summary_statistics': lambda: analyzer.get_summary_statistics(labeled),
+            'filter_by_sentiment': lambda: analyzer.filter_by_sentiment(labeled, 'Positive'),
+        }
+        timings = {}
+        for name, call in methods.items():
+            started = time.perf_counter()
+            call()
+            timings[name] = round(time.perf_counter() - started, 4)
+        results.append({"benchmark": "analyzer", "rows": n, "seconds": timings})
+    return results
+
+
+# Sayfaların dbGetAllArticles projeksiyonları (None = tüm kolonlar)
+PAGE_COLUMNS = {
+    'MainPage': None,
+    '1_Genel_Bakış': ['id', 'source', 'sentiment', 'sentiment_label', 'date'],
+    '2_Trend_Analizi': ['id', 'source', 'sentiment', 'sentiment_label', 'date'],
+    '4_Haberler': None,
+}
+
+
+def bench_page_memory(n_rows: int = 5000, limit: int = 1000) -> List[Dict]:
+    """Sayfa başına DataFrame belleği: eski object kolonlar vs categorical/float32/projeksiyon"""
+    from database.repository import DatabaseManager
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, 'news.db')
+        db = DatabaseManager(db_path, use_cache=False)
+        df = synthetic_articles(n_rows)
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO articles (title, url, source, sentiment, date) VALUES (?, ?, ?, ?, ?)",
+            zip(df['title'], df['url'], df['source'], df['sentiment'].astype(float),
+                df['date'].astype(str))
+        )
+        conn.commit()
+
+        # Eski yol: SELECT * + object etiket kolonu
+        legacy = pd.read_sql_query("SELECT * FROM articles ORDER BY date DESC LIMIT ?",
+                                   conn, params=(limit,))
+        conn.close()
+        legacy['date'] = pd.to_datetime(legacy['date'], errors='coerce')
+        legacy['sentiment_label'] = legacy['sentiment'].apply(
+            lambda x: 'Positive' if x > 0.1 else ('Negative' if x < -0.1 else 'Neutral')
+        )
+        before = int(legacy.memory_usage(deep=True).sum())
+
+        analyzer = NewsAnalyzer()
+        results = []
+        for page, columns in PAGE_COLUMNS.items():
+            frame = analyzer.analyze_batch(db.dbGetAllArticles(limit=limit, columns=columns))
+            after = int(frame.memory_usage(deep=True).sum())
+            results.append({
+                "benchmark": "page_memory",
+                "page": page,
+                "rows": len(frame),
+                "before_kb": round(before / 1024, 1),
+                "after_kb": round(after / 1024, 1),
+                "reduction": round(1 - after / before, 3),
+            })
+        return results
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def bench_scorers(
+    n_texts: int = 20_000, batch_size: int = 256, names: Optional[List[str]] = None
+) -> List[Dict]:
+    """Kayıtlı her skorlayıcı için metin/sn, batch gecikmesi p50/p99 ve tepe bellek"""
+    texts = synthetic_headlines(n_texts)
+    batches = [texts[i:i + batch_size] for i in range(0, n_texts, batch_size)]
+    results = []
+
+    for name in names or available_scorers():
+        scorer = get_scorer(name)
+        scorer.score_many(batches[0])  # ısınma (sözlük / model yükleme)
+
+        latencies = []
+        started = time.perf_counter()
+        for batch in batches:
+            t0 = time.perf_counter()
+            scorer.score_many(batch)
+            latencies.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+
+        # Bellek ayrı turda ölçülür; tracemalloc süreyi bozmasın
+        tracemalloc.start()
+        for batch in batches:
+            scorer.score_many(batch)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        latencies_ms = np.array(latencies) * 1000
+        results.append({
+            "benchmark": "scorer",
+            "scorer": name,
+            "version": scorer.version,
+            "texts": n_texts,
+            "batch_size": batch_size,
+            "texts_per_sec": round(n_texts / elapsed, 1),
+            "batch_p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+            "batch_p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+            "peak_mem_kb": round(peak / 1024, 1),
+        })
+    return results
+
+
+def bench_trending(n_titles: int = 100_000, method: str = "zscore") -> Dict:
+    """TrendingEngine.score süresini ölçer"""
+    df = synthetic_titles(n_titles, days=8)
+    engine = TrendingEngine(method=method)
+
+    started = time.perf_counter()
+    result = engine.score(df, top_n=20)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "benchmark": "trending",
+        "method": method,
+        "titles": n_titles,
+        "seconds": round(elapsed, 4),
+        "titles_per_sec": round(n_titles / elapsed, 1),
+        "top_terms": result["term"].head(5).tolist(),
+    }
+
+
+if __name__ == "__main__":
+    for method in ("zscore", "kleinberg"):
+        print(json.dumps(bench_trending(method=method)))
+    print(json.dumps(bench_tokenizer()))
+    for result in bench_analyzer():
+        print(json.dumps(result))
+    for result in bench_page_memory():
+        print(json.dumps(result, ensure_ascii=False))
+    for result in bench_scorers():
+        print(json.dumps(result))
+    for result in bench_chart_payload():
+        print(json.dumps(result))
+    for result in bench_news_list():
+        print(json.dumps(result))
+    for result in bench_figure_cache():
+        print(json.dumps(result))
@@ -0,0 +1,150 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Grafiklere giden nokta/kova sayısının üst sınırları; satır sayısından bağımsız
+DEFAULT_BINS = 30
+MAX_TIMELINE_POINTS = 365
+
+
+def histogram_bins(
+    scores: pd.Series,
+    labels: Optional[pd.Series] = None,
+    bins: int = DEFAULT_BINS,
+    value_range: Tuple[float, float] = (-1.0, 1.0)
+) -> pd.DataFrame:
+    """
+    Skorların sabit aralıklı histogramı; labels verilirse etiket başına.
+    Aralık dışındaki skorlar uç kovalara, NaN'lar hiçbir kovaya sayılmaz.
+    """
+    values = pd.to_numeric(scores, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    valid = ~np.isnan(values)
+    lo, hi = value_range
+    edges = np.linspace(lo, hi, bins + 1)
+    # Kova sınırındaki skorlar np.histogram gibi sağdaki kovaya düşer
+    idx = np.clip(np.searchsorted(edges, values[valid], side='right') - 1, 0, bins - 1)
+
+    if labels is None:
+        keys = np.array(['All'], dtype=object)
+        codes = np.zeros(len(idx), dtype='int64')
+    else:
+        categorical = pd.Categorical(labels)
+        keys = np.asarray(categorical.categories, dtype=object)
+        codes = categorical.codes[valid].astype('int64')
+        idx, codes = idx[codes >= 0], codes[codes >= 0]
+
+    counts = np.bincount(codes * bins + idx, minlength=len(keys) * bins)
+    return pd.DataFrame({
+        'label': np.repeat(keys, bins),
+        'bin_start': np.tile(edges[:-1], len(keys)),
+        'bin_end': np.tile(edges[1:], len(keys)),
+        'count': counts,
+    })
+
+
+def box_summary(df: pd.DataFrame, by: str = 'source', value: str = 'sentiment') -> pd.DataFrame:
+    """
+    Grup başına beş sayı özeti ve Tukey bıyıkları (1.5 IQR içindeki en uç değerler);
+    Plotly go.Box'a ham satır yerine bu özet verilir.
+    """
+    columns = ['min', 'q1', 'median', 'q3', 'max', 'lowerfence', 'upperfence', 'count']
+    if df.empty:
+        return pd.DataFrame(columns=[by] + columns)
+
+    values = df[value].astype('float64')
+    groups = df[by]
+    grouped = values.groupby(groups, observed=True)
+
+    summary = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    summary.columns = ['q1', 'median', 'q3']
+    summary['min'] = grouped.min()
+    summary['max'] = grouped.max()
+    summary['count'] = grouped.count()
+
+    iqr = summary['q3'] - summary['q1']
+    low = (summary['q1'] - 1.5 * iqr).reindex(groups).to_numpy()
+    high = (summary['q3'] + 1.5 * iqr).reindex(groups).to_numpy()
+    inside = values.where((values.to_numpy() >= low) & (values.to_numpy() <= high))
+    fences = inside.groupby(groups, observed=True).agg(['min', 'max'])
+    summary['lowerfence'] = fences['min']
+    summary['upperfence'] = fences['max']
+
+    return summary[columns].rename_axis(by).reset_index()
+
+
+def label_counts(labels: pd.Series, order: Optional[List[str]] = None) -> pd.DataFrame:
+    """Etiket başına haber sayısı; order verilirse sayısı 0 olanlar da o sırayla"""
+    counts = labels.value_counts(sort=False)
+    if order is not None:
+        counts = counts.reindex(order, fill_value=0)
+    return counts.rename_axis('label').reset_index(name='count')
+
+
+def source_counts(sources: pd.Series) -> pd.DataFrame:
+    """Kaynak başına haber sayısı, çoktan aza; boş kategoriler atlanır"""
+    counts = sources.value_counts()
+    counts = counts[counts > 0]
+    return counts.rename_axis('source').reset_index(name='count')
+
+
+def source_label_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """(kaynak, etiket) başına haber sayısı"""
+    return df.groupby(['source', 'sentiment_label'], observed=True).size().reset_index(name='count')
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: serinin görsel şeklini koruyan `threshold`
+    noktanın indeksleri. İlk ve son nokta her zaman seçilir.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    # İç noktalar threshold - 2 kovaya bölünür
+    edges = np.linspace(1, n - 1, threshold - 1).astype('int64')
+    selected = np.empty(threshold, dtype='int64')
+    selected[0], selected[-1] = 0, n - 1
+
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Sonraki kovanın ortalaması üçgenin üçüncü köşesidir
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_start = end if end < next_end else n - 1
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def sentiment_timeline(df: pd.DataFrame, max_points: int = MAX_TIMELINE_POINTS) -> pd.DataFrame:
+    """
+    Günlük ortalama sentiment ve haber sayısı; gün sayısı max_points'i aşarsa
+    ortalama serisi LTTB ile seyreltilir.
+    """
+    if df.empty or 'date' not in df.columns:
+        return pd.DataFrame(columns=['day', 'avg_sentiment', 'count'])
+
+    days = pd.to_datetime(df['date']).dt.normalize().rename('day')
+    daily = df['sentiment'].astype('float64').groupby(days).agg(['mean', 'size']).reset_index()
+    daily.columns = ['day', 'avg_sentiment', 'count']
+    return thin_timeline(daily, max_points)
+
+
+def thin_timeline(daily: pd.DataFrame, max_points: int = MAX_TIMELINE_POINTS) -> pd.DataFrame:
+    """(day, avg_sentiment, count) serisini LTTB ile en fazla max_points güne indirir"""
+    if len(daily) > max_points:
+        x = pd.to_datetime(daily['day']).to_numpy().astype('int64')
+        daily = daily.iloc[lttb_indices(x, daily['avg_sentiment'].fillna(0).to_numpy(), max_points)]
+    return daily.reset_index(drop=True)
@@ -0,0 +1,42 @@
+from typing import Optional
+
+import numpy as np
+
+# Duygu etiketlerinin tek kaynağı. Eşikler değişirse LABEL_VERSION da değişir
+# ve DatabaseManager açılışta kayıtlı etiketleri tek UPDATE ile yeniden hesaplar.
+SENTIMENT_LABELS = ['Positive', 'Neutral', 'Negative']
+POSITIVE_THRESHOLD = 0.1
+NEGATIVE_THRESHOLD = -0.1
+LABEL_VERSION = f"{POSITIVE_THRESHOLD}:{NEGATIVE_THRESHOLD}"
+
+# Skoru olmayan (NULL/NaN) haberler Neutral sayılır
+LABEL_CASE_SQL = (
+    "CASE WHEN {column} > ? THEN 'Positive' "
+    "WHEN {column} < ? THEN 'Negative' ELSE 'Neutral' END"
+)
+LABEL_CASE_PARAMS = (POSITIVE_THRESHOLD, NEGATIVE_THRESHOLD)
+
+
+def label_for(score: Optional[float]) -> str:
+    """Tek skor için etiket"""
+    if score is None or score != score:
+        return 'Neutral'
+    if score > POSITIVE_THRESHOLD:
+        return 'Positive'
+    if score < NEGATIVE_THRESHOLD:
+        return 'Negative'
+    return 'Neutral'
+
+
+def label_codes(values: np.ndarray) -> np.ndarray:
+    """SENTIMENT_LABELS sırasına göre int8 etiket kodları (vektörel)"""
+    if values.dtype.kind != 'f':
+        values = values.astype('float64')
+    # Eşikler skorların dtype'ına çevrilir; float32 0.1, float64 0.1'den
+    # büyük olduğu için aksi halde sınırdaki skorlar Positive sayılırdı
+    upper, lower = np.array([POSITIVE_THRESHOLD, NEGATIVE_THRESHOLD], dtype=values.dtype)
+    return np.select([values > upper, values < lower], [0, 2], default=1).astype('int8')
+
+
+def label_case_sql(column: str = "sentiment") -> str:
+    return LABEL_CASE_SQL.format(column=column)
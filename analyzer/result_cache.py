@@ -0,0 +1,85 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from database.cache import LRUCache, copyValue
+
+_MISSING = object()
+
+DEFAULT_TTL = 600.0
+
+
+def fingerprint(df: pd.DataFrame) -> Hashable:
+    """
+    DataFrame için ucuz parmak izi: satır sayısı, kolonlar, id min/max/toplam
+    ve sentiment toplamı.
+
+    Ekleme, silme, filtreleme ve yeniden skorlama parmak izini değiştirir.
+    Başlık düzenlemesi gibi id/sentiment'i değiştirmeyen güncellemeler TTL
+    ile sınırlı süre eski kalabilir. id kolonu yoksa tüm içerik hash'lenir.
+    """
+    if df is None or df.empty:
+        return (0, tuple(df.columns) if df is not None else ())
+
+    key = [len(df), tuple(df.columns)]
+    if 'id' in df.columns:
+        ids = df['id'].to_numpy(dtype='int64', na_value=0)
+        key += [int(ids.min()), int(ids.max()), int(ids.sum())]
+    else:
+        key.append(int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+    if 'sentiment' in df.columns:
+        scores = df['sentiment'].to_numpy(dtype='float64', na_value=np.nan)
+        key.append(round(float(np.nansum(scores)), 6))
+
+    return tuple(key)
+
+
+class AnalysisCache:
+    """
+    NewsAnalyzer sonuçları için parmak izi anahtarlı, TTL'li LRU önbellek.
+
+    Anahtar (metot, parmak izi, parametreler) üçlüsüdür; aynı veriyi gören
+    sayfalar ve oturumlar aynı sonucu paylaşır.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = 32 * 1024 * 1024,
+        ttl: Optional[float] = DEFAULT_TTL
+    ):
+        self.lru = LRUCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+
+    def get_or_compute(
+        self, method: str, df: pd.DataFrame, compute: Callable[[], Any], params: Hashable = ()
+    ) -> Any:
+        key = (method, fingerprint(df), params)
+        value = self.lru.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.lru.put(key, value)
+        return copyValue(value)
+
+    def clear(self):
+        self.lru.clear()
+
+    def stats(self) -> Dict:
+        stats = self.lru.stats()
+        stats["ttl"] = self.lru.ttl
+        return stats
+
+
+_shared_cache: Optional[AnalysisCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_analysis_cache(**options) -> AnalysisCache:
+    """Süreçteki tüm sayfa ve oturumların paylaştığı analiz önbelleği"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = AnalysisCache(**options)
+        return _shared_cache
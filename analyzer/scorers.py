@@ -0,0 +1,145 @@
+import os
+import re
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional, Protocol, Sequence
+
+import numpy as np
+from textblob import TextBlob
+
+try:
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+except ImportError:
+    SentimentIntensityAnalyzer = None
+
+logger = logging.getLogger(__name__)
+
+# Skorlayıcı seçimi için ortam değişkeni; verilmezse TextBlob kullanılır
+SCORER_ENV = "NEWS_SENTIMENT_SCORER"
+DEFAULT_SCORER = "textblob"
+
+
+class ScoreArrays(NamedTuple):
+    """score_many çıktısı; metinlerle aynı sırada float64 diziler"""
+    polarity: np.ndarray
+    subjectivity: np.ndarray
+
+
+class SentimentScorer(Protocol):
+    """
+    Sentiment skorlayıcı arayüzü.
+
+    name registry anahtarı, version veritabanına yazılan model sürümüdür
+    (backfill farklı sürümle skorlanmış satırları yeniden skorlar).
+    """
+
+    name: str
+    version: str
+
+    def score_many(self, texts: Sequence[str]) -> ScoreArrays:
+        ...
+
+
+class TextBlobScorer:
+    """TextBlob PatternAnalyzer polaritesi (mevcut varsayılan davranış)"""
+
+    name = "textblob"
+    version = "textblob-polarity-1"
+
+    def score_many(self, texts: Sequence[str]) -> ScoreArrays:
+        polarity = np.zeros(len(texts))
+        subjectivity = np.zeros(len(texts))
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                sentiment = TextBlob(text).sentiment
+                polarity[i], subjectivity[i] = sentiment.polarity, sentiment.subjectivity
+        return ScoreArrays(polarity, subjectivity)
+
+
+class LexiconScorer:
+    """
+    TextBlob sözlüğündeki kelime polaritelerinin ortalaması.
+
+    Olumsuzlama ve pekiştirme kuralları yoktur; TextBlob'dan daha kaba ama
+    ayrıştırma yapmadığı için çok daha hızlıdır.
+    """
+
+    name = "lexicon"
+    version = "textblob-lexicon-1"
+    WORD = re.compile(r"[a-z][a-z'-]*")
+
+    def __init__(self):
+        from textblob.en import sentiment as lexicon
+
+        self.polarity: Dict[str, float] = {}
+        self.subjectivity: Dict[str, float] = {}
+        for word, tags in lexicon.items():
+            values = tags.get(None) or next(iter(tags.values()))
+            self.polarity[word], self.subjectivity[word] = values[0], values[1]
+
+    def score_many(self, texts: Sequence[str]) -> ScoreArrays:
+        polarity = np.zeros(len(texts))
+        subjectivity = np.zeros(len(texts))
+        pol, subj = self.polarity, self.subjectivity
+        for i, text in enumerate(texts):
+            hits = [w for w in self.WORD.findall(text.lower()) if w in pol] if text else []
+            if hits:
+                polarity[i] = sum(pol[w] for w in hits) / len(hits)
+                subjectivity[i] = sum(subj[w] for w in hits) / len(hits)
+        return ScoreArrays(polarity, subjectivity)
+
+
+class VaderScorer:
+    """NLTK VADER compound skoru (vader_lexicon indirilmiş olmalı)"""
+
+    name = "vader"
+    version = "vader-compound-1"
+
+    def __init__(self):
+        if SentimentIntensityAnalyzer is None:
+            raise ImportError("nltk kurulu değil")
+        self.analyzer = SentimentIntensityAnalyzer()
+
+    def score_many(self, texts: Sequence[str]) -> ScoreArrays:
+        polarity = np.array([
+            self.analyzer.polarity_scores(text)["compound"] if text else 0.0 for text in texts
+        ], dtype="float64")
+        # VADER öznellik vermez
+        return ScoreArrays(polarity, np.full(len(texts), np.nan))
+
+
+# ---------------- REGISTRY ----------------
+
+SCORERS: Dict[str, Callable[[], SentimentScorer]] = {
+    "textblob": TextBlobScorer,
+    "lexicon": LexiconScorer,
+    "vader": VaderScorer,
+}
+_instances: Dict[str, SentimentScorer] = {}
+
+
+def register_scorer(name: str, factory: Callable[[], SentimentScorer]):
+    """Yeni skorlayıcı ekler ya da mevcut olanı değiştirir"""
+    SCORERS[name] = factory
+    _instances.pop(name, None)
+
+
+def get_scorer(name: Optional[str] = None) -> SentimentScorer:
+    """İsimle (ya da NEWS_SENTIMENT_SCORER ortam değişkeniyle) skorlayıcı döndürür"""
+    name = name or os.environ.get(SCORER_ENV) or DEFAULT_SCORER
+    if name not in SCORERS:
+        raise ValueError(f"Bilinmeyen skorlayıcı: {name} (kayıtlı: {sorted(SCORERS)})")
+    if name not in _instances:
+        _instances[name] = SCORERS[name]()
+    return _instances[name]
+
+
+def available_scorers() -> List[str]:
+    """Bu ortamda oluşturulabilen skorlayıcılar (eksik bağımlılıklar atlanır)"""
+    names = []
+    for name in SCORERS:
+        try:
+            get_scorer(name)
+            names.append(name)
+        except (ImportError, LookupError, OSError) as e:
+            logger.info(f"Skorlayıcı '{name}' kullanılamıyor ({type(e).__name__})")
+    return names
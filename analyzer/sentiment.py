@@ -1,10 +1,13 @@
 import pandas as pd
-from textblob import TextBlob
-from collections import Counter
-import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from analyzer.labels import SENTIMENT_LABELS, label_codes, label_for
+from analyzer.result_cache import AnalysisCache
+from analyzer.scorers import SentimentScorer, get_scorer
+from analyzer.tokenizer import STOP_WORDS, Tokenizer
+from analyzer.trending import TrendingEngine
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -12,12 +15,21 @@ logger = logging.getLogger(__name__)
 class NewsAnalyzer:
     """Haber metinleri için analiz yardımcıları"""
 
-    def __init__(self):
-        self.stop_words = {
-            'this', 'that', 'with', 'from', 'have', 'been', 'more',
-            'will', 'says', 'after', 'could', 'would', 'about', 'their',
-            'said', 'also', 'when', 'where', 'what', 'which', 'there'
-        }
+    def __init__(self, scorer: Optional[str] = None, cache: Optional[AnalysisCache] = None):
+        self.stop_words = set(STOP_WORDS)
+        self.scorer: SentimentScorer = get_scorer(scorer)
+        self.cache = cache
+
+    def cached(self, method: str, df: pd.DataFrame, *args, **kwargs):
+        """
+        Analiz metodunu önbellek üzerinden çağırır; aynı veri ve parametrelerle
+        yapılan tekrar çağrılar yeniden hesaplanmaz. Önbellek yoksa doğrudan çağırır.
+        """
+        compute = lambda: getattr(self, method)(df, *args, **kwargs)
+        if self.cache is None:
+            return compute()
+        params = (args, tuple(sorted(kwargs.items())))
+        return self.cache.get_or_compute(method, df, compute, params)
 
     def analyze_sentiment(self, text: str) -> Dict[str, any]:
         """Metin için sentiment skoru ve etiketi döndürür"""
@@ -25,87 +37,148 @@ class NewsAnalyzer:
             return {'score': 0.0, 'label': 'Neutral', 'subjectivity': 0.0}
 
         try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-
-            if polarity > 0.1:
-                label = 'Positive'
-            elif polarity < -0.1:
-                label = 'Negative'
-            else:
-                label = 'Neutral'
+            scores = self.scorer.score_many([text])
+            polarity = float(scores.polarity[0])
+            subjectivity = float(scores.subjectivity[0])
 
             return {
                 'score': round(polarity, 3),
-                'label': label,
+                'label': label_for(polarity),
                 'subjectivity': round(subjectivity, 3)
             }
         except Exception as e:
             logger.error(f"Sentiment hatası: {e}")
             return {'score': 0.0, 'label': 'Neutral', 'subjectivity': 0.0}
 
+    def label_scores(self, scores: pd.Series) -> pd.Series:
+        """Skor serisini tek vektörel adımda categorical Positive/Neutral/Negative etiketlerine çevirir"""
+        codes = label_codes(pd.to_numeric(scores, errors='coerce').to_numpy())
+        labels = pd.Categorical.from_codes(codes, categories=SENTIMENT_LABELS)
+        return pd.Series(labels, index=scores.index, name='sentiment_label')
+
     def analyze_batch(self, df: pd.DataFrame) -> pd.DataFrame:
-        """DataFrame'e sentiment etiketi ekler"""
+        """sentiment_label kolonu eklenmiş yeni bir DataFrame döndürür (girdi değişmez)"""
         if df.empty:
             return df
 
-        df['sentiment_label'] = df['sentiment'].apply(
-            lambda x: 'Positive' if x > 0.1 else ('Negative' if x < -0.1 else 'Neutral')
-        )
-        return df
+        # Veritabanında saklanan etiketler merkezi eşiklerle yazıldığı için yeniden hesaplanmaz
+        if 'sentiment_label' in df.columns and df['sentiment_label'].notna().all():
+            return df
+
+        return df.assign(sentiment_label=self.label_scores(df['sentiment']))
 
     def extract_keywords(self, text: str, top_n: int = 10) -> List[Tuple[str, int]]:
         """Metinden sık geçen kelimeleri çıkarır"""
         if not text:
             return []
 
-        words = re.findall(r'\b\w{4,}\b', text.lower())
-        words = [w for w in words if w not in self.stop_words]
-
-        return Counter(words).most_common(top_n)
+        return Tokenizer(stop_words=self.stop_words).most_common([text], top_n)
 
     def get_trending_topics(self, df: pd.DataFrame, top_n: int = 20) -> List[Tuple[str, int]]:
         """Başlıklardan trend kelimeleri üretir"""
         if df.empty or 'title' not in df.columns:
             return []
 
-        return self.extract_keywords(' '.join(df['title']), top_n)
+        # Başlıklar birleştirilmeden akış halinde sayılır
+        return Tokenizer(stop_words=self.stop_words).most_common(df['title'], top_n)
+
+    def keywords_by_group(
+        self,
+        df: pd.DataFrame,
+        by: str = 'source',
+        top_n: int = 10,
+        ngram_range: Tuple[int, int] = (1, 1)
+    ) -> pd.DataFrame:
+        """
+        Grup başına en sık kelimeler (by: 'source' | 'day' | 'sentiment_label').
+
+        Satırlar tek bir groupby ile gruplara ayrılır ve her başlık bir kez
+        tokenize edilir; kaynak başına DataFrame filtrelenmez.
+        Returns: by, term, count kolonlu uzun (tidy) DataFrame
+        """
+        columns = [by, 'term', 'count']
+        if df.empty or 'title' not in df.columns:
+            return pd.DataFrame(columns=columns)
+
+        if by == 'source':
+            keys = df['source']
+        elif by == 'day':
+            keys = pd.to_datetime(df['date'], errors='coerce').dt.date
+        elif by == 'sentiment_label':
+            keys = df['sentiment_label'] if 'sentiment_label' in df.columns else \
+                self.label_scores(df['sentiment'])
+        else:
+            raise ValueError(f"Bilinmeyen gruplama: {by}")
+
+        tokenizer = Tokenizer(stop_words=self.stop_words, ngram_range=ngram_range)
+        rows = []
+        titles = df['title'].fillna('').astype(str)
+        for key, group in titles.groupby(keys.rename(by), sort=True, observed=True):
+            for term, count in tokenizer.most_common(group, top_n):
+                rows.append((key, term, count))
+
+        return pd.DataFrame(rows, columns=columns)
+
+    def get_burst_topics(
+        self, df: pd.DataFrame, top_n: int = 20, method: str = 'zscore', bucket: str = 'D'
+    ) -> pd.DataFrame:
+        """Son zaman kovasında taban çizgisine göre sıçrayan terim ve bigram'lar"""
+        return TrendingEngine(bucket=bucket, method=method).score(df, top_n=top_n)
 
     def sentiment_by_source(self, df: pd.DataFrame) -> pd.DataFrame:
         """Kaynak bazında sentiment istatistikleri"""
         if df.empty or 'source' not in df.columns:
             return pd.DataFrame()
 
-        return df.groupby('source').agg({
-            'sentiment': ['mean', 'std', 'count'],
-            'sentiment_label': lambda x: x.value_counts().to_dict()
-        }).round(3)
+        labels = df['sentiment_label'] if 'sentiment_label' in df.columns else \
+            self.label_scores(df['sentiment'])
+
+        # float32 skorlar istatistik için float64'e çevrilir; categorical
+        # kaynaklarda yalnızca görülen kaynaklar listelenir
+        sentiment = df['sentiment'].astype('float64')
+        stats = sentiment.groupby(df['source'], observed=True).agg(['mean', 'std', 'count'])
+
+        # Etiket sayıları tek crosstab ile; sözlük her kaynak için bir kez kurulur
+        counts = pd.crosstab(df['source'], labels, dropna=False).reindex(stats.index, fill_value=0)
+        dists = [
+            {str(k): v for k, v in row[row > 0].sort_values(ascending=False, kind='stable').items()}
+            for _, row in counts.iterrows()
+        ]
+
+        return pd.concat({
+            'sentiment': stats,
+            'sentiment_label': pd.DataFrame({'<lambda>': dists}, index=stats.index),
+        }, axis=1).round(3)
 
     def sentiment_over_time(self, df: pd.DataFrame) -> pd.DataFrame:
         """Zaman bazlı sentiment ortalamaları"""
         if df.empty or 'date' not in df.columns:
             return pd.DataFrame()
 
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        df = df.dropna(subset=['date'])
+        dates = pd.to_datetime(df['date'], errors='coerce')
+        valid = dates.notna()
 
-        if df.empty:
+        if not valid.any():
             return pd.DataFrame()
 
-        df['day'] = df['date'].dt.date
-        return df.groupby('day').agg(
+        # Gün anahtarı datetime64 üzerinde hesaplanır, date nesnelerine yalnızca
+        # gruplar için dönülür
+        days = dates[valid].dt.normalize().rename('day')
+        frame = df.loc[valid, ['sentiment', 'id']].astype({'sentiment': 'float64'})
+        result = frame.groupby(days).agg(
             sentiment=('sentiment', 'mean'),
             article_count=('id', 'count')
         ).round(3)
+        result.index = pd.Index(result.index.date, name='day')
+        return result
 
     def get_sentiment_distribution(self, df: pd.DataFrame) -> Dict[str, int]:
         """Sentiment dağılımı"""
         if df.empty or 'sentiment_label' not in df.columns:
             return {'Positive': 0, 'Neutral': 0, 'Negative': 0}
 
-        dist = df['sentiment_label'].value_counts().to_dict()
-        for k in ['Positive', 'Neutral', 'Negative']:
+        dist = {str(k): int(v) for k, v in df['sentiment_label'].value_counts().items()}
+        for k in SENTIMENT_LABELS:
             dist.setdefault(k, 0)
 
         return dist
@@ -117,7 +190,7 @@ class NewsAnalyzer:
 
         return {
             'total_articles': len(df),
-            'avg_sentiment': round(df['sentiment'].mean(), 3),
+            'avg_sentiment': round(float(df['sentiment'].astype('float64').mean()), 3),
             'sources_count': df['source'].nunique(),
             'sentiment_distribution': self.get_sentiment_distribution(df)
         }
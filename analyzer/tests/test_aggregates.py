@@ -0,0 +1,131 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.aggregates import OnlineStats, SentimentAggregator
+from database.repository import DatabaseManager
+
+
+class TestOnlineStats(unittest.TestCase):
+    """EWMA ve kayan pencere istatistiklerinin pandas ile eşitliği"""
+
+    def setUp(self):
+        self.values = np.round(np.random.default_rng(3).uniform(-1, 1, 500), 3)
+
+    def test_matches_pandas(self):
+        stats = OnlineStats(alpha=0.2, window=50)
+        for value in self.values:
+            stats.update(value)
+
+        series = pd.Series(self.values)
+        ewm = series.ewm(alpha=0.2, adjust=False)
+        self.assertAlmostEqual(stats.ewma, ewm.mean().iloc[-1], places=9)
+        self.assertAlmostEqual(stats.ewvar, ewm.var(bias=True).iloc[-1], places=9)
+        self.assertAlmostEqual(stats.rolling_mean, series.rolling(50).mean().iloc[-1], places=9)
+        self.assertAlmostEqual(stats.rolling_std, series.rolling(50).std().iloc[-1], places=9)
+        self.assertEqual(stats.count, 500)
+
+    def test_state_roundtrip(self):
+        aggregator = SentimentAggregator(alpha=0.3, window=10)
+        for i, value in enumerate(self.values[:100]):
+            aggregator.update('BBC' if i % 2 else 'CNN', value, when=i)
+
+        restored = SentimentAggregator.from_state(aggregator.to_state())
+        restored.update('BBC', 0.9, when=100)
+        aggregator.update('BBC', 0.9, when=100)
+
+        self.assertEqual(restored.snapshot(), aggregator.snapshot())
+        self.assertEqual(restored.overall_snapshot(), aggregator.overall_snapshot())
+        self.assertEqual(aggregator.overall_snapshot()['count'], 101)
+        self.assertEqual(aggregator.snapshot('NPR'), {})
+
+
+class TestLiveSentiment(unittest.TestCase):
+    """Insert yolunda güncellenen ve DB'den geri yüklenen canlı istatistikler"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+
+        start = datetime(2026, 1, 1)
+        self.rows = [
+            {'title': f'Headline {i}', 'url': f'u{i}', 'source': ['BBC', 'CNN'][i % 2],
+             'sentiment': round(float(np.sin(i)), 3), 'date': start + timedelta(hours=i)}
+            for i in range(60)
+        ]
+        self.db.dbInsertArticlesBulk(self.rows)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_insert_updates_snapshot(self):
+        expected = SentimentAggregator()
+        for row in self.rows:
+            expected.update(row['source'], row['sentiment'], row['date'])
+
+        live = self.db.dbGetLiveSentiment()
+        self.assertEqual(set(live['sources']), {'BBC', 'CNN'})
+        self.assertEqual(live['overall'], expected.overall_snapshot())
+        self.assertEqual(self.db.dbGetLiveSentiment('CNN'), expected.snapshot('CNN'))
+
+    def test_existing_database_is_rebuilt_on_open(self):
+        """Genel satırı olmayan (eski şemalı) veritabanı açılışta yeniden üretilmeli"""
+        before = self.db.dbGetLiveSentiment()
+
+        # Eski şema genel durumu sentiment_stats'ta '__all__' anahtarıyla tutuyordu
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM sentiment_stats")
+        conn.execute("DELETE FROM sentiment_overall")
+        conn.execute("INSERT INTO sentiment_stats (key, state) VALUES ('__all__', '{}')")
+        conn.commit()
+        conn.close()
+
+        reopened = DatabaseManager(self.db_path, use_cache=False)
+        self.assertEqual(reopened.dbGetLiveSentiment(), before)
+
+        reopened.dbDeleteAllArticles()
+        self.assertEqual(reopened.dbGetLiveSentiment(), {'overall': {}, 'sources': {}})
+
+    def test_non_finite_scores_are_skipped(self):
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Odd score {i}', 'url': f'odd{i}', 'source': 'NPR', 'sentiment': score}
+            for i, score in enumerate([0.2, float('nan'), float('inf'), 0.4])
+        ])
+        npr = self.db.dbGetLiveSentiment('NPR')
+        self.assertEqual(npr['count'], 2)
+        self.assertEqual(npr['rolling_mean'], 0.3)
+        self.assertEqual(self.db.dbGetLiveSentiment()['overall']['count'], 62)
+
+    def test_source_named_like_overall_key_is_separate(self):
+        self.db.dbInsertArticle({'title': 'Edge case', 'url': 'edge', 'source': '__all__', 'sentiment': 0.9})
+        live = self.db.dbGetLiveSentiment()
+        self.assertEqual(live['sources']['__all__']['count'], 1)
+        self.assertEqual(live['overall']['count'], 61)
+
+    def test_mutations_invalidate_live_stats(self):
+        """Silme, skor güncellemesi ve backfill sonrası özet baştan üretilmiş gibi olmalı"""
+        df = self.db.dbGetAllArticles()
+        ids = df.sort_values('id')['id'].tolist()
+        self.db.dbDeleteArticle(ids[0])
+        self.db.dbUpdateArticle(ids[1], {'sentiment': 0.75})
+        self.db.dbApplySentimentChunk('rescore', 'test-v1', [(ids[2], -0.5)], ids[2])
+
+        live = self.db.dbGetLiveSentiment()
+        fresh = DatabaseManager(self.db_path, use_cache=False)
+        fresh.dbRebuildLiveStats()
+        self.assertEqual(live, fresh.dbGetLiveSentiment())
+        self.assertEqual(live['overall']['count'], 59)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
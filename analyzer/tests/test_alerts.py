@@ -0,0 +1,156 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.alerts import SpikeDetector
+from database.repository import DatabaseManager
+
+
+def steady_then_wave(n_steady=300, n_wave=40, seed=5):
+    """Nötr civarında dalgalanan skorlar, ardından negatif başlık dalgası"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2026, 1, 1)
+    rows = [(round(float(rng.normal(0.05, 0.2)), 3), start + timedelta(minutes=30 * i))
+            for i in range(n_steady)]
+    last = rows[-1][1]
+    rows += [(round(float(rng.normal(-0.6, 0.1)), 3), last + timedelta(minutes=30 * (i + 1)))
+             for i in range(n_wave)]
+    return rows
+
+
+class TestSpikeDetector(unittest.TestCase):
+    """Artımlı sentiment ve hacim sıçrama tespiti"""
+
+    def run_detector(self, detector, rows):
+        alerts = []
+        for i, (score, when) in enumerate(rows):
+            for alert in detector.observe(score, when):
+                alerts.append((i, alert))
+        return alerts
+
+    def test_negative_wave_is_flagged(self):
+        rows = steady_then_wave()
+        for method in ('cusum', 'zscore'):
+            alerts = self.run_detector(SpikeDetector(method=method), rows)
+            kinds = [(i, a['kind']) for i, a in alerts if a['kind'].startswith('sentiment')]
+
+            self.assertTrue(kinds, method)
+            first, kind = kinds[0]
+            self.assertEqual(kind, 'sentiment_drop')
+            self.assertGreaterEqual(first, 300, f"{method} sakin dönemde uyarı verdi")
+            self.assertLess(first, 310)
+            # Bekleme süresi: aynı dalga için tek uyarı
+            self.assertLessEqual(len(kinds), 2)
+
+    def test_volume_spike_flagged_once_per_bucket(self):
+        start = datetime(2026, 1, 1)
+        rows = [(0.0, start + timedelta(hours=h)) for h in range(48)]
+        rows += [(0.0, start + timedelta(hours=48, minutes=m)) for m in range(30)]
+
+        alerts = self.run_detector(SpikeDetector(), rows)
+        volume = [a for _, a in alerts if a['kind'] == 'volume_spike']
+        self.assertEqual(len(volume), 1)
+        self.assertGreater(volume[0]['value'], volume[0]['baseline'])
+
+    def test_state_size_is_bounded(self):
+        """Durum (dolayısıyla haber başına iş) geçmiş uzunluğundan bağımsız olmalı"""
+        detector = SpikeDetector(window=100)
+        rows = steady_then_wave(n_steady=3000, n_wave=0)
+        sizes = []
+        for i, (score, when) in enumerate(rows):
+            detector = SpikeDetector(window=100).load_state(detector.to_state()) if i else detector
+            detector.observe(score, when)
+            if i in (500, 2999):
+                sizes.append(len(json.dumps(detector.to_state())))
+        self.assertLess(abs(sizes[1] - sizes[0]), 200)
+
+    def test_infinite_score_does_not_poison_baseline(self):
+        start = datetime(2026, 1, 1)
+        rows = [(0.1, start + timedelta(minutes=i)) for i in range(20)]
+        rows += [(float('inf'), start + timedelta(minutes=20)), (float('-inf'), start + timedelta(minutes=21))]
+        rows += [(-0.9, start + timedelta(minutes=22 + i)) for i in range(40)]
+
+        detector = SpikeDetector()
+        alerts = self.run_detector(detector, rows)
+        self.assertIn('sentiment_drop', {a['kind'] for _, a in alerts})
+        json.dumps(detector.to_state(), allow_nan=False)
+
+        # Düzeltmeden önce yazılmış bozuk durum yüklenirken sıfırlanır
+        state = detector.to_state()
+        state['baseline'].update(ewma=float('nan'), ewvar=float('nan'))
+        healed = SpikeDetector().load_state(state)
+        healed.observe(0.1, start + timedelta(hours=2))
+        json.dumps(healed.to_state(), allow_nan=False)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            SpikeDetector(method='magic')
+
+
+class TestAlertsOnIngest(unittest.TestCase):
+    """Insert yolunda üretilen ve tabloya yazılan uyarılar"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def articles(self, source, rows):
+        return [{'title': f'{source} headline {i}', 'url': f'{source}-{i}', 'source': source,
+                 'sentiment': score, 'date': when} for i, (score, when) in enumerate(rows)]
+
+    def test_wave_persists_alert_for_source(self):
+        self.db.dbInsertArticlesBulk(self.articles('CNN', steady_then_wave(n_wave=0)))
+        self.db.dbInsertArticlesBulk(self.articles('BBC', steady_then_wave()))
+
+        alerts = self.db.dbGetAlerts()
+        self.assertTrue(alerts)
+        self.assertEqual({a['source'] for a in alerts}, {'BBC'})
+        self.assertIn('sentiment_drop', {a['kind'] for a in alerts})
+        self.assertIsNotNone(alerts[0]['article_id'])
+
+        for alert in alerts:
+            self.assertTrue(self.db.dbAcknowledgeAlert(alert['id']))
+        self.assertEqual(self.db.dbGetAlerts(), [])
+        self.assertEqual(len(self.db.dbGetAlerts(include_acknowledged=True)), len(alerts))
+
+    def test_history_warms_baseline_without_alerts(self):
+        """Mevcut veritabanı açılışta ısıtılmalı, geçmiş için uyarı yazılmamalı"""
+        self.db.dbInsertArticlesBulk(self.articles('BBC', steady_then_wave()))
+        self.db.dbDeleteAllArticles()
+
+        import sqlite3
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT INTO articles (title, url, source, sentiment, date) VALUES (?, ?, ?, ?, ?)",
+            [(a['title'], a['url'], a['source'], a['sentiment'], a['date'])
+             for a in self.articles('BBC', steady_then_wave(n_wave=0))]
+        )
+        conn.commit()
+        conn.close()
+
+        reopened = DatabaseManager(self.db_path, use_cache=False)
+        self.assertEqual(reopened.dbGetAlerts(), [])
+
+        last = datetime(2026, 1, 8)
+        reopened.dbInsertArticlesBulk([
+            {'title': f'Grim headline {i}', 'url': f'grim-{i}', 'source': 'BBC',
+             'sentiment': -0.7, 'date': last + timedelta(minutes=30 * i)}
+            for i in range(15)
+        ])
+        self.assertIn('sentiment_drop', {a['kind'] for a in reopened.dbGetAlerts()})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
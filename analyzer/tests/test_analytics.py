@@ -0,0 +1,142 @@
+import os
+import sys
+import random
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.analytics import AnalyticsEngine, duckdb
+from database.repository import DatabaseManager
+from database.archive import ArticleArchive
+
+
+@unittest.skipIf(duckdb is None, "duckdb kurulu değil")
+class TestAnalyticsParity(unittest.TestCase):
+    """DuckDB ve pandas motorlarının aynı sonuçları verdiğini kontrol eder"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.tmp_dir, "news.db")
+        db = DatabaseManager(cls.db_path)
+
+        rng = random.Random(42)
+        now = datetime.now()
+        sources = ['BBC News', 'CNN', 'Al Jazeera', 'NPR']
+        db.dbInsertArticlesBulk([
+            {
+                'title': f'Headline {i}',
+                'url': f'https://test.com/{i}',
+                'source': rng.choice(sources),
+                'sentiment': round(rng.uniform(-1, 1), 3),
+                'date': now - timedelta(days=rng.randint(0, 90), minutes=rng.randint(0, 1440))
+            }
+            for i in range(500)
+        ])
+
+        cls.archive_dir = os.path.join(cls.tmp_dir, "archive")
+        ArticleArchive(db, archive_dir=cls.archive_dir).archiveOldArticles(max_age_days=45)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def engines(self):
+        kwargs = {'archive_dir': self.archive_dir}
+        return (AnalyticsEngine(self.db_path, engine='duckdb', **kwargs),
+                AnalyticsEngine(self.db_path, engine='pandas', **kwargs))
+
+    def test_sentiment_by_source(self):
+        fast, slow = self.engines()
+        expected = slow.sentiment_by_source()
+        self.assertEqual(expected['count'].sum(), 500)
+        assert_frame_equal(fast.sentiment_by_source(), expected, check_dtype=False, atol=1e-9)
+
+    def test_timeline(self):
+        fast, slow = self.engines()
+        assert_frame_equal(fast.timeline(), slow.timeline(), check_dtype=False, atol=1e-9)
+
+    def test_histogram(self):
+        fast, slow = self.engines()
+        expected = slow.histogram(bins=30)
+        self.assertEqual(expected['count'].sum(), 500)
+        assert_frame_equal(fast.histogram(bins=30), expected)
+
+    def test_quantiles(self):
+        fast, slow = self.engines()
+        assert_frame_equal(fast.quantiles(), slow.quantiles(), check_dtype=False, atol=1e-6)
+
+    def test_hot_only_without_archive(self):
+        fast = AnalyticsEngine(self.db_path, engine='duckdb')
+        slow = AnalyticsEngine(self.db_path, engine='pandas')
+        assert_frame_equal(fast.sentiment_by_source(), slow.sentiment_by_source(),
+                           check_dtype=False, atol=1e-9)
+
+
+@unittest.skipIf(duckdb is None, "duckdb kurulu değil")
+class TestAnalyticsMixedDates(unittest.TestCase):
+    """Mikrosaniyeli ve mikrosaniyesiz tarihler birlikte sayılır"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        midnight = datetime.combine(datetime.now().date(), datetime.min.time())
+        # İlk satır gece yarısı: format tahmini mikrosaniyesiz biçime kilitlenir
+        self.db.dbInsertArticlesBulk([
+            {
+                'title': f'Headline {i}', 'url': f'u{i}', 'source': ['BBC', 'CNN'][i % 2],
+                'sentiment': 0.2 if i % 2 else -0.2,
+                'date': midnight - timedelta(days=i) + (timedelta() if i % 3 == 0 else timedelta(hours=10, microseconds=250000))
+            }
+            for i in range(40)
+        ])
+        self.archive_dir = os.path.join(self.tmp_dir, "archive")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def assertEnginesCountAll(self):
+        engines = [AnalyticsEngine(self.db_path, archive_dir=self.archive_dir, engine=e) for e in ('duckdb', 'pandas')]
+        for engine in engines:
+            self.assertEqual(engine.timeline()['article_count'].sum(), 40, engine.engine)
+        assert_frame_equal(engines[0].timeline(), engines[1].timeline(), check_dtype=False, atol=1e-9)
+
+    def test_hot_only(self):
+        self.assertEnginesCountAll()
+
+    def test_with_archive(self):
+        archived = ArticleArchive(self.db, archive_dir=self.archive_dir).archiveOldArticles(max_age_days=10)
+        self.assertGreater(archived['archived'], 0)
+        with patch.object(DatabaseManager, 'initializeDatabase') as init:
+            self.assertEnginesCountAll()
+        # Okuma yolu veritabanı yöneticisi (migration, önbellek) kurmaz
+        init.assert_not_called()
+
+
+class TestAnalyticsFallback(unittest.TestCase):
+    """duckdb olmadan pandas yolunun çalıştığını kontrol eder"""
+
+    def test_pandas_engine_on_empty_db(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(tmp_dir, "news.db")
+            DatabaseManager(db_path)
+            engine = AnalyticsEngine(db_path, engine='pandas')
+
+            self.assertTrue(engine.sentiment_by_source().empty)
+            self.assertTrue(engine.timeline().empty)
+            self.assertEqual(engine.histogram(bins=10)['count'].sum(), 0)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
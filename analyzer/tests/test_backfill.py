@@ -0,0 +1,87 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.backfill import SentimentBackfill, score_titles
+from database.repository import DatabaseManager
+
+
+class FlakyScorer:
+    """Belirli bir çağrıda çöken sahte skorlayıcı"""
+
+    def __init__(self, fail_on_call=None):
+        self.calls = 0
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, titles):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("crash")
+        return [0.5] * len(titles)
+
+
+class TestSentimentBackfill(unittest.TestCase):
+    """Parça parça, devam ettirilebilir backfill testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Headline {i}', 'url': f'u{i}', 'source': 'BBC', 'sentiment': 0.0}
+            for i in range(50)
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_rescores_all_rows_with_version(self):
+        """Tüm satırlar yeni skor ve model sürümüyle güncellenmeli"""
+        job = SentimentBackfill(self.db, scorer=FlakyScorer(), model_version='v2', chunk_size=10)
+        result = job.run()
+
+        self.assertEqual(result['rows'], 50)
+        self.assertEqual(result['chunks'], 5)
+        self.assertGreater(result['rows_per_sec'], 0)
+
+        df = self.db.dbGetAllArticles()
+        self.assertTrue((df['sentiment'] == 0.5).all())
+        self.assertTrue((df['sentiment_model_version'] == 'v2').all())
+
+    def test_resumes_after_crash(self):
+        """Çöken iş checkpoint'ten devam etmeli"""
+        with self.assertRaises(RuntimeError):
+            SentimentBackfill(self.db, scorer=FlakyScorer(fail_on_call=3),
+                              model_version='v2', chunk_size=10).run()
+
+        checkpoint = self.db.dbGetBackfillCheckpoint('sentiment')
+        self.assertEqual(checkpoint['rows_done'], 20)
+
+        scorer = FlakyScorer()
+        result = SentimentBackfill(self.db, scorer=scorer, model_version='v2', chunk_size=10).run()
+
+        self.assertEqual(result['resumed_from'], checkpoint['last_id'])
+        self.assertEqual(result['rows'], 30)
+        self.assertEqual(scorer.calls, 3)
+        self.assertEqual(self.db.dbGetBackfillCheckpoint('sentiment')['rows_done'], 50)
+
+    def test_new_version_starts_over(self):
+        """Farklı model sürümü eski checkpoint'i kullanmamalı"""
+        SentimentBackfill(self.db, scorer=FlakyScorer(), model_version='v2', chunk_size=10).run()
+        result = SentimentBackfill(self.db, scorer=FlakyScorer(), model_version='v3', chunk_size=10).run()
+
+        self.assertEqual(result['resumed_from'], 0)
+        self.assertEqual(result['rows'], 50)
+
+    def test_multiprocess_scoring(self):
+        """workers > 1 iken process havuzu aynı sonucu vermeli"""
+        job = SentimentBackfill(self.db, scorer=score_titles, model_version='v2',
+                                chunk_size=25, workers=2)
+        self.assertEqual(job.run()['rows'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.binning import box_summary, histogram_bins, lttb_indices, sentiment_timeline
+from analyzer.benchmarks import synthetic_articles
+from analyzer.sentiment import NewsAnalyzer
+
+
+class TestBinning(unittest.TestCase):
+    """Grafikler için sunucu tarafı özetleme ve seyreltme testleri"""
+
+    def setUp(self):
+        self.df = NewsAnalyzer().analyze_batch(synthetic_articles(5000, days=900))
+
+    def test_histogram_matches_numpy(self):
+        binned = histogram_bins(self.df['sentiment'], self.df['sentiment_label'], bins=20)
+        self.assertEqual(binned['count'].sum(), len(self.df))
+
+        totals = binned.groupby('bin_start', sort=True)['count'].sum().to_numpy()
+        expected, _ = np.histogram(self.df['sentiment'].clip(-1, 1), bins=20, range=(-1, 1))
+        np.testing.assert_array_equal(totals, expected)
+
+        positive = binned[binned['label'] == 'Positive']
+        self.assertEqual(positive['count'].sum(), (self.df['sentiment_label'] == 'Positive').sum())
+
+    def test_box_summary_matches_pandas(self):
+        summary = box_summary(self.df).set_index('source')
+        grouped = self.df.groupby('source')['sentiment']
+
+        pd.testing.assert_series_equal(summary['median'], grouped.median(), check_names=False)
+        pd.testing.assert_series_equal(summary['q1'], grouped.quantile(0.25), check_names=False)
+        self.assertTrue((summary['lowerfence'] >= summary['min']).all())
+        self.assertTrue((summary['upperfence'] <= summary['max']).all())
+        self.assertEqual(summary['count'].sum(), len(self.df))
+
+    def test_lttb_keeps_shape(self):
+        x = np.arange(10_000)
+        y = np.sin(x / 500.0)
+        y[4321] = 5.0
+
+        idx = lttb_indices(x, y, 200)
+        self.assertEqual(len(idx), 200)
+        self.assertEqual((idx[0], idx[-1]), (0, 9999))
+        self.assertTrue(np.all(np.diff(idx) > 0))
+        self.assertIn(4321, idx)
+        np.testing.assert_array_equal(lttb_indices(x[:50], y[:50], 200), np.arange(50))
+
+    def test_timeline_is_bounded(self):
+        daily = sentiment_timeline(self.df, max_points=100)
+        self.assertEqual(len(daily), 100)
+        self.assertTrue(daily['day'].is_monotonic_increasing)
+        self.assertEqual(len(sentiment_timeline(self.df.head(0))), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
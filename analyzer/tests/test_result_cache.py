@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.result_cache import AnalysisCache, fingerprint
+from analyzer.sentiment import NewsAnalyzer
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Parmak izi anahtarlı analiz sonucu önbelleği testleri"""
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'id': [1, 2, 3, 4],
+            'source': ['BBC', 'CNN', 'BBC', 'NPR'],
+            'sentiment': [0.5, -0.3, 0.05, 0.2],
+            'date': pd.date_range('2026-01-01', periods=4, freq='h'),
+        })
+        self.analyzer = NewsAnalyzer(cache=AnalysisCache(ttl=60))
+
+    def test_repeated_calls_hit_cache(self):
+        with patch.object(NewsAnalyzer, 'get_summary_statistics',
+                          wraps=self.analyzer.get_summary_statistics) as spy:
+            first = self.analyzer.cached('get_summary_statistics', self.df)
+            second = self.analyzer.cached('get_summary_statistics', self.df.copy())
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(self.analyzer.cache.stats()['hits'], 1)
+
+    def test_results_match_and_are_copies(self):
+        labeled = self.analyzer.cached('analyze_batch', self.df)
+        pd.testing.assert_frame_equal(labeled, self.analyzer.analyze_batch(self.df))
+
+        labeled.loc[0, 'sentiment'] = 9.0
+        again = self.analyzer.cached('analyze_batch', self.df)
+        self.assertEqual(again.loc[0, 'sentiment'], 0.5)
+
+    def test_fingerprint_tracks_data_changes(self):
+        base = fingerprint(self.df)
+        self.assertEqual(base, fingerprint(self.df.copy()))
+
+        rescored = self.df.assign(sentiment=[0.5, -0.3, 0.05, -0.9])
+        self.assertNotEqual(base, fingerprint(rescored))
+        self.assertNotEqual(base, fingerprint(self.df[self.df['source'] == 'BBC']))
+        self.assertNotEqual(base, fingerprint(self.df.drop(columns=['date'])))
+
+        self.assertNotEqual(
+            self.analyzer.cached('analyze_batch', self.df)['sentiment_label'].tolist(),
+            self.analyzer.cached('analyze_batch', rescored)['sentiment_label'].tolist()
+        )
+
+    def test_params_are_part_of_key(self):
+        df = self.df.assign(title=['Market rally', 'Storm warning', 'Market fall', 'Storm ends'])
+        top1 = self.analyzer.cached('get_trending_topics', df, top_n=1)
+        top2 = self.analyzer.cached('get_trending_topics', df, top_n=2)
+        self.assertEqual(len(top1), 1)
+        self.assertEqual(len(top2), 2)
+
+    def test_without_cache_calls_directly(self):
+        analyzer = NewsAnalyzer()
+        self.assertEqual(analyzer.cached('get_summary_statistics', self.df),
+                         analyzer.get_summary_statistics(self.df))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
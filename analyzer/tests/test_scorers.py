@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from textblob import TextBlob
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer import scorers
+from analyzer.scorers import SCORER_ENV, ScoreArrays, get_scorer, register_scorer
+from analyzer.sentiment import NewsAnalyzer
+from analyzer.benchmarks import bench_scorers, synthetic_headlines
+from models.News import News
+from scraper.manager import NewsScraper
+
+
+class ConstantScorer:
+    """Test için sabit skor döndüren skorlayıcı"""
+
+    name = "constant"
+    version = "constant-1"
+
+    def score_many(self, texts):
+        return ScoreArrays(np.full(len(texts), -0.5), np.zeros(len(texts)))
+
+
+class TestScorers(unittest.TestCase):
+    """SentimentScorer registry ve yerleşik skorlayıcı testleri"""
+
+    def tearDown(self):
+        scorers.SCORERS.pop('constant', None)
+        scorers._instances.pop('constant', None)
+
+    def test_textblob_matches_per_title_scores(self):
+        texts = synthetic_headlines(50) + ['', 'Great news today']
+        result = get_scorer('textblob').score_many(texts)
+
+        expected = [TextBlob(t).sentiment.polarity if t else 0.0 for t in texts]
+        np.testing.assert_allclose(result.polarity, expected)
+        self.assertEqual(result.subjectivity.shape, (len(texts),))
+
+    def test_lexicon_scores_are_bounded(self):
+        result = get_scorer('lexicon').score_many(['Great success', 'Terrible deadly crash', ''])
+        self.assertGreater(result.polarity[0], 0)
+        self.assertLess(result.polarity[1], 0)
+        self.assertEqual(result.polarity[2], 0)
+        self.assertTrue(np.all(np.abs(result.polarity) <= 1))
+
+    def test_registry_selection(self):
+        register_scorer('constant', ConstantScorer)
+
+        with patch.dict(os.environ, {SCORER_ENV: 'constant'}):
+            self.assertEqual(get_scorer().name, 'constant')
+            self.assertEqual(NewsAnalyzer().analyze_sentiment('Anything')['label'], 'Negative')
+        self.assertEqual(get_scorer().name, 'textblob')
+
+        with self.assertRaises(ValueError):
+            get_scorer('missing')
+
+    def test_scraper_scores_in_one_batch(self):
+        register_scorer('constant', ConstantScorer)
+        scraper = NewsScraper(scorer='constant')
+        articles = [News(title=f'Headline {i}', url='', source='X', sentiment=0.0) for i in range(3)]
+
+        scraper.score_articles(articles)
+        self.assertTrue(all(a.sentiment == -0.5 for a in articles))
+        self.assertTrue(all(a.sentiment_model_version == 'constant-1' for a in articles))
+
+    def test_benchmark_reports_each_scorer(self):
+        results = bench_scorers(n_texts=600, batch_size=100, names=['textblob', 'lexicon'])
+        self.assertEqual([r['scorer'] for r in results], ['textblob', 'lexicon'])
+        for r in results:
+            self.assertGreater(r['texts_per_sec'], 0)
+            self.assertLessEqual(r['batch_p50_ms'], r['batch_p99_ms'])
+            self.assertGreater(r['peak_mem_kb'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
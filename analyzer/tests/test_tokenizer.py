@@ -0,0 +1,98 @@
+import os
+import re
+import sys
+import unittest
+from collections import Counter
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.tokenizer import STOP_WORDS, STOP_WORD_PACKS, Tokenizer, register_stop_words
+from analyzer.benchmarks import synthetic_corpus, synthetic_titles, _legacy_keywords
+from analyzer.sentiment import NewsAnalyzer
+
+
+class TestTokenizer(unittest.TestCase):
+    """Akışlı tokenizer ve n-gram testleri"""
+
+    def test_matches_legacy_keywords(self):
+        """Unigram sayımları eski findall + filtre yolu ile aynı olmalı"""
+        titles = synthetic_corpus(5000)
+        self.assertEqual(Tokenizer().most_common(iter(titles), 30), _legacy_keywords(titles, 30))
+
+    def test_small_chunks_update_same_counter(self):
+        titles = ['Storm hits coast', 'Storm warning issued', '', None, 'this with that']
+        counter = Counter({'storm': 1})
+        Tokenizer().count(iter(titles), counter=counter, chunk_size=2)
+
+        expected = Counter(w for t in titles if t for w in re.findall(r'\b\w{4,}\b', t.lower())
+                           if w not in STOP_WORDS)
+        expected['storm'] += 1
+        self.assertEqual(counter, expected)
+
+    def test_ngrams_do_not_cross_titles(self):
+        tokenizer = Tokenizer(ngram_range=(2, 3))
+        counts = tokenizer.count(['Peace talks resume today', 'Talks collapse again'])
+
+        self.assertEqual(counts['peace talks'], 1)
+        self.assertEqual(counts['peace talks resume'], 1)
+        self.assertNotIn('today talks', counts)
+        self.assertTrue(all(' ' in term for term in counts))
+        self.assertEqual(tokenizer.terms('Peace talks resume'),
+                         ['peace talks', 'talks resume', 'peace talks resume'])
+
+    def test_language_packs(self):
+        titles = ['Seçim sonrası yeni kabine için görüşmeler']
+        self.assertIn('için', Tokenizer().count(titles))
+        self.assertNotIn('için', Tokenizer(languages=('en', 'tr')).count(titles))
+
+        original = STOP_WORD_PACKS.get('xx')
+        try:
+            register_stop_words('xx', ['Kabine'])
+            self.assertNotIn('kabine', Tokenizer(languages=('xx',)).count(titles))
+        finally:
+            STOP_WORD_PACKS.pop('xx', None)
+            if original is not None:
+                STOP_WORD_PACKS['xx'] = original
+
+        with self.assertRaises(ValueError):
+            Tokenizer(languages=('zz',))
+
+
+class TestKeywordsByGroup(unittest.TestCase):
+    """Tek geçişte grup bazlı anahtar kelime testleri"""
+
+    def setUp(self):
+        self.analyzer = NewsAnalyzer()
+        self.df = synthetic_titles(2000, days=5)
+
+    def test_matches_per_group_extract_keywords(self):
+        """Her grup, o grubun başlıkları için extract_keywords ile aynı olmalı"""
+        result = self.analyzer.keywords_by_group(self.df, by='source', top_n=5)
+        self.assertEqual(list(result.columns), ['source', 'term', 'count'])
+
+        for source in self.df['source'].unique():
+            titles = ' '.join(self.df[self.df['source'] == source]['title'])
+            part = result[result['source'] == source]
+            self.assertEqual(list(zip(part['term'], part['count'])),
+                             self.analyzer.extract_keywords(titles, top_n=5))
+
+    def test_day_and_sentiment_groupings(self):
+        by_day = self.analyzer.keywords_by_group(self.df, by='day', top_n=3)
+        self.assertEqual(by_day['day'].nunique(),
+                         pd.to_datetime(self.df['date']).dt.date.nunique())
+
+        by_label = self.analyzer.keywords_by_group(self.df, by='sentiment_label', top_n=3)
+        self.assertEqual(set(by_label['sentiment_label']), {'Positive', 'Neutral', 'Negative'})
+        self.assertNotIn('sentiment_label', self.df.columns)
+
+        with self.assertRaises(ValueError):
+            self.analyzer.keywords_by_group(self.df, by='url')
+
+    def test_empty_frame(self):
+        self.assertTrue(self.analyzer.keywords_by_group(pd.DataFrame()).empty)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,92 @@
+import os
+import sys
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.trending import TrendingEngine
+from analyzer.tokenizer import tokenize
+from analyzer.benchmarks import bench_trending
+
+
+def burst_frame():
+    """8 gün boyunca sabit 'world news' başlıkları, son gün ani bir 'earthquake' dalgası"""
+    start = datetime(2026, 1, 1, 9)
+    rows = []
+    for day in range(8):
+        for i in range(40):
+            rows.append({'title': f'World news update number{i} markets',
+                         'date': start + timedelta(days=day, minutes=i)})
+    for i in range(15):
+        rows.append({'title': f'Earthquake strikes coast, peace talks halted item{i}',
+                     'date': start + timedelta(days=7, hours=2, minutes=i)})
+    return pd.DataFrame(rows)
+
+
+class TestTrendingEngine(unittest.TestCase):
+    """Baseline'a göre normalize edilmiş burst skorlaması testleri"""
+
+    def test_burst_beats_evergreen_zscore(self):
+        result = TrendingEngine(method='zscore').score(burst_frame(), top_n=10)
+        self.assertEqual(result['term'].iloc[0].split()[0], 'earthquake')
+        self.assertNotIn('world', result['term'].head(5).tolist())
+        self.assertNotIn('news', result['term'].head(5).tolist())
+
+    def test_burst_beats_evergreen_kleinberg(self):
+        result = TrendingEngine(method='kleinberg').score(burst_frame(), top_n=10)
+        self.assertIn('earthquake', result['term'].head(3).tolist())
+        self.assertNotIn('world', result['term'].tolist())
+
+    def test_bigrams_are_scored(self):
+        result = TrendingEngine(ngram_range=(2, 2)).score(burst_frame(), top_n=20)
+        self.assertIn('peace talks', result['term'].tolist())
+        self.assertTrue(all(' ' in term for term in result['term']))
+
+    def test_unigram_counts_match_tokenizer(self):
+        """Seyrek matris sayıları NewsAnalyzer tokenizer'ı ile aynı olmalı"""
+        titles = ['Storm hits coast, storm warning', 'Markets rally after storm', 'this with that']
+        engine = TrendingEngine(ngram_range=(1, 1))
+        vocab, term_idx, buckets, counts = engine.count_matrix(titles, [0, 0, 1])
+
+        terms = vocab.decode(term_idx)
+        got = Counter()
+        for term, n in zip(terms, counts):
+            got[term] += int(n)
+
+        self.assertEqual(got, Counter(w for t in titles for w in tokenize(t)))
+
+    def test_large_vocabulary_keys_do_not_collide(self):
+        """Paketlenmiş anahtar int64'e sığmadığında satır anahtarlarıyla aynı sayımlar"""
+        engine = TrendingEngine(ngram_range=(1, 3))
+        df = burst_frame()
+        buckets = (df['date'].dt.normalize() - df['date'].min().normalize()).dt.days.to_numpy()
+
+        def counted(titles):
+            vocab, term_idx, term_buckets, counts = engine.count_matrix(titles, buckets)
+            return sorted(zip(vocab.decode(term_idx), term_buckets.tolist(), counts.tolist()))
+
+        packed, scored = counted(df['title'].tolist()), engine.score(df, top_n=10)
+        self.assertTrue(any(term.count(' ') == 2 for term, _, _ in packed))
+        V = len(engine.count_matrix(df['title'].tolist(), buckets)[0].words)
+        # Önce yalnızca (terim, kova) anahtarı, sonra n-gram anahtarının kendisi sığmaz
+        for limit in (V + V ** 2 + V ** 3, 1000):
+            with patch('analyzer.trending.MAX_PACKED_KEY', limit):
+                self.assertEqual(counted(df['title'].tolist()), packed, limit)
+                pd.testing.assert_frame_equal(engine.score(df, top_n=10), scored)
+
+    def test_empty_input(self):
+        self.assertTrue(TrendingEngine().score(pd.DataFrame()).empty)
+
+    def test_100k_titles_under_one_second(self):
+        """100k başlık bir saniyenin altında skorlanmalı"""
+        result = bench_trending(n_titles=100_000)
+        self.assertLess(result['seconds'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
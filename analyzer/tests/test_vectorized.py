@@ -0,0 +1,92 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.sentiment import NewsAnalyzer
+from analyzer.benchmarks import synthetic_articles
+
+
+# Vektörel sürümden önceki satır bazlı uygulamalar; çıktı eşitliği için referans
+
+def legacy_analyze_batch(df):
+    df['sentiment_label'] = df['sentiment'].apply(
+        lambda x: 'Positive' if x > 0.1 else ('Negative' if x < -0.1 else 'Neutral')
+    )
+    return df
+
+
+def legacy_sentiment_by_source(df):
+    return df.groupby('source').agg({
+        'sentiment': ['mean', 'std', 'count'],
+        'sentiment_label': lambda x: x.value_counts().to_dict()
+    }).round(3)
+
+
+def legacy_sentiment_over_time(df):
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    df = df.dropna(subset=['date'])
+    df['day'] = df['date'].dt.date
+    return df.groupby('day').agg(
+        sentiment=('sentiment', 'mean'),
+        article_count=('id', 'count')
+    ).round(3)
+
+
+class TestVectorizedAnalyzer(unittest.TestCase):
+    """Vektörel NewsAnalyzer çıktılarının eski uygulamayla eşitliği"""
+
+    def setUp(self):
+        self.analyzer = NewsAnalyzer()
+        self.df = synthetic_articles(5000, days=10)
+        # Eşik sınırları, eksik skor ve parse edilemeyen tarih
+        self.df.loc[:4, 'sentiment'] = [0.1, -0.1, 0.1001, -0.1001, np.nan]
+        self.df['date'] = self.df['date'].astype(object)
+        self.df.loc[5, 'date'] = 'not a date'
+
+    def test_analyze_batch_identical_and_pure(self):
+        before = self.df.copy()
+        result = self.analyzer.analyze_batch(self.df)
+
+        pd.testing.assert_frame_equal(self.df, before)
+        self.assertIsInstance(result['sentiment_label'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(result.astype({'sentiment_label': object}),
+                                      legacy_analyze_batch(before.copy()))
+
+    def test_sentiment_by_source_identical(self):
+        labeled = self.analyzer.analyze_batch(self.df).astype({'sentiment_label': object})
+        pd.testing.assert_frame_equal(self.analyzer.sentiment_by_source(labeled),
+                                      legacy_sentiment_by_source(labeled.copy()))
+
+    def test_compact_frames_match_object_frames(self):
+        """Categorical kaynak ve float32 skorla aynı istatistikler, görülmeyen kaynak yok"""
+        labeled = self.analyzer.analyze_batch(self.df).astype({'sentiment_label': object})
+        compact = self.analyzer.analyze_batch(
+            self.df.astype({'source': 'category', 'sentiment': 'float32'})
+        )
+        subset = compact[compact['source'].isin(['Source 1', 'Source 2'])]
+
+        expected = legacy_sentiment_by_source(
+            labeled[labeled['source'].isin(['Source 1', 'Source 2'])].copy()
+        )
+        result = self.analyzer.sentiment_by_source(subset)
+        self.assertEqual(list(result.index), ['Source 1', 'Source 2'])
+        result.index = result.index.astype(object)
+        pd.testing.assert_frame_equal(result, expected, atol=1e-3)
+        self.assertEqual(self.analyzer.get_sentiment_distribution(compact),
+                         self.analyzer.get_sentiment_distribution(labeled))
+
+    def test_sentiment_over_time_identical_and_pure(self):
+        before = self.df.copy()
+        result = self.analyzer.sentiment_over_time(self.df)
+
+        pd.testing.assert_frame_equal(self.df, before)
+        pd.testing.assert_frame_equal(result, legacy_sentiment_over_time(before.copy()))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
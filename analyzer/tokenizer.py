@@ -0,0 +1,141 @@
+import re
+from collections import Counter
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# En az 4 harfli kelimeler; NewsAnalyzer, terim indeksi ve trend motoru
+# aynı kuralı kullanır. \w{4,} açgözlü olduğu için \b\w{4,}\b ile aynı
+# eşleşmeleri verir, ancak daha hızlıdır.
+WORD_PATTERN = re.compile(r'\w{4,}')
+
+# Başlıklar tek metinde taranırken araya konan sınır token'ı; WORD_PATTERN
+# ile eşleşir ama gerçek başlıklarda geçmez
+BOUNDARY = "ǂ" * 4
+
+STOP_WORDS = frozenset({
+    'this', 'that', 'with', 'from', 'have', 'been', 'more',
+    'will', 'says', 'after', 'could', 'would', 'about', 'their',
+    'said', 'also', 'when', 'where', 'what', 'which', 'there'
+})
+
+# Dil paketleri; yalnızca 4+ harfli kelimeler anlamlıdır
+STOP_WORD_PACKS: Dict[str, FrozenSet[str]] = {
+    'en': STOP_WORDS,
+    'tr': frozenset({
+        'olan', 'olarak', 'için', 'gibi', 'daha', 'kadar', 'sonra', 'önce',
+        'ancak', 'fakat', 'veya', 'bile', 'şimdi', 'şöyle',
+        'böyle', 'bunu', 'buna', 'bunun', 'şunu', 'onun', 'onlar', 'diye',
+        'dedi', 'göre', 'karşı', 'arasında', 'üzerine', 'yeni', 'nasıl',
+        'neden', 'niçin', 'hangi', 'değil', 'çünkü', 'hala', 'hâlâ'
+    }),
+}
+
+
+def register_stop_words(language: str, words: Iterable[str]) -> FrozenSet[str]:
+    """Bir dil paketini oluşturur ya da mevcut paketi genişletir"""
+    pack = STOP_WORD_PACKS.get(language, frozenset()) | {w.lower() for w in words}
+    STOP_WORD_PACKS[language] = frozenset(pack)
+    return STOP_WORD_PACKS[language]
+
+
+def tokenize(text: str, stop_words=STOP_WORDS) -> List[str]:
+    """Metni küçük harfe çevirip stop word'ler dışındaki kelimeleri döndürür"""
+    if not text:
+        return []
+    return [w for w in WORD_PATTERN.findall(text.lower()) if w not in stop_words]
+
+
+class Tokenizer:
+    """
+    Başlık akışları için kelime / n-gram sayacı.
+
+    count() başlıkları bir iterator'dan chunk_size'lık parçalar halinde
+    okur ve verilen Counter'ı yerinde günceller; tüm başlıkları tek bir
+    dev metinde birleştirmez. Unigram'larda stop word'ler sayımdan sonra
+    tek seferde silinir, böylece kelime başına Python filtresi çalışmaz.
+    """
+
+    def __init__(
+        self,
+        languages: Tuple[str, ...] = ('en',),
+        extra_stop_words: Iterable[str] = (),
+        ngram_range: Tuple[int, int] = (1, 1),
+        stop_words: Optional[Iterable[str]] = None
+    ):
+        if not 1 <= ngram_range[0] <= ngram_range[1] <= 3:
+            raise ValueError("ngram_range 1 ile 3 arasında olmalı")
+
+        if stop_words is None:
+            words = set()
+            for lang in languages:
+                if lang not in STOP_WORD_PACKS:
+                    raise ValueError(f"Bilinmeyen dil paketi: {lang}")
+                words |= STOP_WORD_PACKS[lang]
+        else:
+            words = set(stop_words)
+
+        self.stop_words: FrozenSet[str] = frozenset(words | {w.lower() for w in extra_stop_words})
+        self.ngram_range = ngram_range
+
+    # ---------------- TOKENS ----------------
+
+    def tokens(self, text: str) -> List[str]:
+        """Tek metnin stop word'lerden arındırılmış kelimeleri"""
+        return tokenize(text, self.stop_words)
+
+    def terms(self, text: str) -> List[str]:
+        """ngram_range'e göre kelime ve n-gram listesi"""
+        tokens = self.tokens(text)
+        lo, hi = self.ngram_range
+        terms = list(tokens) if lo == 1 else []
+        for n in range(max(lo, 2), hi + 1):
+            terms.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return terms
+
+    # ---------------- STREAMING ----------------
+
+    def count(
+        self,
+        titles: Iterable[str],
+        counter: Optional[Counter] = None,
+        chunk_size: int = 4096
+    ) -> Counter:
+        """Başlık akışındaki terimleri sayar; counter verilirse onu günceller"""
+        counter = Counter() if counter is None else counter
+        lo, hi = self.ngram_range
+        iterator = iter(titles)
+
+        while True:
+            raw = list(islice(iterator, chunk_size))
+            if not raw:
+                break
+            chunk = [t for t in raw if t]
+            if not chunk:
+                continue
+
+            if hi == 1:
+                counter.update(WORD_PATTERN.findall(" \n ".join(chunk).lower()))
+                self._dropStopWords(counter)
+                continue
+
+            text = f" {BOUNDARY} ".join(chunk).lower() + f" {BOUNDARY}"
+            stop = self.stop_words
+            tokens = [w for w in WORD_PATTERN.findall(text) if w not in stop]
+
+            if lo == 1:
+                counter.update(tokens)
+                counter.pop(BOUNDARY, None)
+            for n in range(max(lo, 2), hi + 1):
+                grams = zip(*(tokens[k:] for k in range(n)))
+                counter.update(
+                    " ".join(gram) for gram in grams if BOUNDARY not in gram
+                )
+
+        return counter
+
+    def _dropStopWords(self, counter: Counter):
+        for word in self.stop_words:
+            counter.pop(word, None)
+
+    def most_common(self, titles: Iterable[str], top_n: int = 10) -> List[Tuple[str, int]]:
+        return self.count(titles).most_common(top_n)
@@ -0,0 +1,279 @@
+import logging
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+from analyzer.tokenizer import BOUNDARY, STOP_WORDS, WORD_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Paketlenmiş n-gram anahtarının sığması gereken üst sınır (int64)
+MAX_PACKED_KEY = int(np.iinfo(np.int64).max)
+
+
+class TrendingEngine:
+    """
+    Yükselen (burst) terim tespiti.
+
+    Başlıklar zaman kovalarına (bucket) ayrılır; her terim ve bigram için
+    son kovadaki frekans, önceki baseline_buckets kovanın oluşturduğu
+    taban çizgisiyle karşılaştırılır. Sayımlar seyrek (terim, kova)
+    çiftleri olarak tutulur, böylece yalnızca gerçekten görülen çiftler
+    için bellek harcanır.
+
+    method='zscore': kova hacmine göre normalize edilmiş oranın z-skoru
+    method='kleinberg': iki durumlu Kleinberg modeline göre son kovanın
+                        burst ağırlığı (log-olabilirlik farkı eksi geçiş maliyeti)
+    """
+
+    def __init__(
+        self,
+        bucket: str = "D",
+        baseline_buckets: int = 7,
+        ngram_range: Tuple[int, int] = (1, 2),
+        min_count: int = 3,
+        method: str = "zscore",
+        burst_ratio: float = 2.0,
+        gamma: float = 1.0
+    ):
+        if method not in ("zscore", "kleinberg"):
+            raise ValueError(f"Bilinmeyen method: {method}")
+        if not 1 <= ngram_range[0] <= ngram_range[1] <= 3:
+            raise ValueError("ngram_range 1 ile 3 arasında olmalı")
+
+        self.bucket = bucket
+        self.baseline_buckets = baseline_buckets
+        self.ngram_range = ngram_range
+        self.min_count = min_count
+        self.method = method
+        self.burst_ratio = burst_ratio
+        self.gamma = gamma
+
+    # ---------------- TOKENS ----------------
+
+    def count_matrix(
+        self, titles: List[str], buckets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Seyrek (COO) sayım matrisi üretir.
+
+        Returns: (vocab, term_idx, bucket_idx, counts) - her (terim, kova)
+        çifti için bir satır. n-gram'lar kelime kodlarından tamsayı
+        anahtar olarak üretilir; metne yalnızca sonuçta dönülür.
+        """
+        buckets = np.asarray(buckets, dtype="int64")
+        empty = np.array([], dtype="int64")
+        if len(titles) == 0:
+            return np.array([], dtype=object), empty, empty, empty
+
+        # Tek regex taraması; başlıklar arasına \w{4,} ile eşleşen bir sınır
+        # token'ı konur, böylece her token'ın hangi başlığa ait olduğu bilinir
+        text = f" {BOUNDARY} ".join(titles).lower() + f" {BOUNDARY}"
+        tokens = WORD_PATTERN.findall(text)
+        codes, words = pd.factorize(np.array(tokens, dtype=object))
+        codes = codes.astype("int64")
+        words = np.asarray(words, dtype=object)
+
+        boundary = int(np.flatnonzero(words == BOUNDARY)[0])
+        title_of_token = np.concatenate(([0], np.cumsum(codes == boundary)[:-1]))
+        token_bucket = buckets[title_of_token]
+
+        # Stop word'ler sınırı bozmadan atılır (NewsAnalyzer ile aynı kural)
+        is_stop = np.fromiter((w in STOP_WORDS for w in words), dtype=bool, count=len(words))
+        keep = ~is_stop[codes]
+        codes, token_bucket = codes[keep], token_bucket[keep]
+
+        V = len(words)
+        is_word = codes != boundary
+
+        lo, hi = self.ngram_range
+        # Büyük sözlükte V**3 int64'ü taşar; o zaman n-gram'lar [n, kodlar...]
+        # satırı olarak (eksik konumlar -1) tutulup satır bazında tekilleştirilir
+        max_key = sum(V ** m for m in range(1, hi + 1))
+        packed = max_key <= MAX_PACKED_KEY
+
+        keys, key_buckets = [], []
+        for n in range(lo, hi + 1):
+            if len(codes) < n:
+                continue
+            span = len(codes) - n + 1
+            valid = is_word[:span].copy()
+            for k in range(1, n):
+                valid &= is_word[k: span + k]
+            if packed:
+                key = codes[:span].copy()
+                for k in range(1, n):
+                    key = key * V + codes[k: span + k]
+                # Farklı n'ler çakışmasın diye n-gram uzayları kaydırılır
+                keys.append(key[valid] + sum(V ** m for m in range(1, n)))
+            else:
+                rows = np.full((int(valid.sum()), hi + 1), -1, dtype="int64")
+                rows[:, 0] = n
+                for k in range(n):
+                    rows[:, k + 1] = codes[k: span + k][valid]
+                keys.append(rows)
+            key_buckets.append(token_bucket[:span][valid])
+
+        term_buckets = np.concatenate(key_buckets) if key_buckets else empty
+        if len(term_buckets) == 0:
+            return np.array([], dtype=object), empty, empty, empty
+
+        n_buckets = int(term_buckets.max()) + 1
+        if packed and (max_key + 1) * n_buckets <= MAX_PACKED_KEY:
+            # Hızlı yol: (terim, kova) tek tamsayı anahtarda, tek sıralama
+            term_ids = np.concatenate(keys)
+            pair_keys, counts = np.unique(term_ids * n_buckets + term_buckets, return_counts=True)
+            pair_terms, pair_buckets = pair_keys // n_buckets, pair_keys % n_buckets
+            uniq_terms, term_idx = np.unique(pair_terms, return_inverse=True)
+            return _TermVocab(uniq_terms, words, V, hi), term_idx, pair_buckets, counts
+
+        # Terimler önce yoğun indekse çevrilir; kova eklenen anahtar
+        # terim sayısı x kova sayısı ile sınırlı kalır, taşma olmaz
+        if packed:
+            uniq_terms, term_of = np.unique(np.concatenate(keys), return_inverse=True)
+        else:
+            uniq_terms, term_of = np.unique(np.concatenate(keys), axis=0, return_inverse=True)
+        term_of = term_of.reshape(-1)
+
+        pair_keys, counts = np.unique(term_of * n_buckets + term_buckets, return_counts=True)
+        term_idx, pair_buckets = pair_keys // n_buckets, pair_keys % n_buckets
+        return _TermVocab(uniq_terms, words, V, hi), term_idx, pair_buckets, counts
+
+    # ---------------- SCORING ----------------
+
+    def score(
+        self,
+        df: pd.DataFrame,
+        top_n: int = 20,
+        now: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        """title/date kolonlu DataFrame için terimleri burst skoruna göre sıralar"""
+        columns = ["term", "recent", "baseline_mean", "score"]
+        if df.empty or not {"title", "date"} <= set(df.columns):
+            return pd.DataFrame(columns=columns)
+
+        dates = pd.to_datetime(df["date"], errors="coerce")
+        floored = dates.dt.floor(self.bucket)
+        latest = pd.Timestamp(now).floor(self.bucket) if now is not None else floored.max()
+        if pd.isna(latest):
+            return pd.DataFrame(columns=columns)
+
+        # Kova indeksi: 0 = en eski baseline kovası, baseline_buckets = son kova
+        step = pd.tseries.frequencies.to_offset(self.bucket)
+        first = latest - step * self.baseline_buckets
+        mask = (floored >= first) & (floored <= latest)
+        if not mask.any():
+            return pd.DataFrame(columns=columns)
+
+        window = floored[mask]
+        bucket_idx = ((window - first) // pd.Timedelta(step)).to_numpy(dtype="int64")
+        titles = df.loc[mask, "title"].fillna("").astype(str).tolist()
+
+        vocab, term_idx, term_bucket, counts = self.count_matrix(titles, bucket_idx)
+        if len(vocab) == 0:
+            return pd.DataFrame(columns=columns)
+
+        n_buckets = self.baseline_buckets + 1
+        docs = np.bincount(bucket_idx, minlength=n_buckets).astype("float64")
+        recent_bucket = n_buckets - 1
+
+        is_recent = term_bucket == recent_bucket
+        V = len(vocab)
+        recent = np.bincount(term_idx[is_recent], weights=counts[is_recent], minlength=V)
+
+        if self.method == "zscore":
+            scores, baseline = self._zscore(term_idx, term_bucket, counts, docs, recent, V)
+        else:
+            scores, baseline = self._kleinberg(term_idx, counts, docs, recent, V)
+
+        keep = recent >= self.min_count
+        if not keep.any():
+            return pd.DataFrame(columns=columns)
+
+        idx = np.flatnonzero(keep)
+        order = idx[np.lexsort((-recent[idx], -scores[idx]))][:top_n]
+
+        return pd.DataFrame({
+            "term": vocab.decode(order),
+            "recent": recent[order].astype("int64"),
+            "baseline_mean": np.round(baseline[order], 3),
+            "score": np.round(scores[order], 3),
+        })
+
+    def _zscore(self, term_idx, term_bucket, counts, docs, recent, V):
+        n_base = self.baseline_buckets
+        base_docs = docs[:n_base]
+        recent_docs = max(docs[-1], 1.0)
+
+        is_base = term_bucket < n_base
+        # Oranlar (terim / başlık): hacmi yüksek kovalar tek başına trend yaratmasın
+        rates = counts[is_base] / np.maximum(base_docs[term_bucket[is_base]], 1.0)
+        base_sum = np.bincount(term_idx[is_base], weights=rates, minlength=V)
+        base_sq = np.bincount(term_idx[is_base], weights=rates ** 2, minlength=V)
+
+        # Boş kovalar da (oran=0) ortalamaya dahil
+        active = max(int((base_docs > 0).sum()), 1)
+        mean = base_sum / active
+        var = np.maximum(base_sq / active - mean ** 2, 0.0)
+
+        recent_rate = recent / recent_docs
+        # Poisson gürültü tabanı: seyrek terimlerin std'si sıfıra inmesin
+        noise = np.sqrt((mean + 1.0 / recent_docs) / recent_docs)
+        scores = (recent_rate - mean) / (np.sqrt(var) + noise)
+
+        return scores, mean * recent_docs
+
+    def _kleinberg(self, term_idx, counts, docs, recent, V):
+        total_docs = docs.sum()
+        recent_docs = max(docs[-1], 1.0)
+        totals = np.bincount(term_idx, weights=counts, minlength=V)
+
+        eps = 1e-9
+        p0 = np.clip(totals / max(total_docs, 1.0), eps, 1 - eps)
+        p1 = np.clip(p0 * self.burst_ratio, eps, 1 - eps)
+
+        r = np.minimum(recent, recent_docs)
+        d = recent_docs
+        # Son kovanın burst durumunda olmasının log-olabilirlik kazancı
+        gain = r * np.log(p1 / p0) + (d - r) * np.log((1 - p1) / (1 - p0))
+        transition = self.gamma * np.log(len(docs))
+        scores = np.maximum(gain - transition, 0.0)
+
+        baseline = (totals - recent) / max(total_docs - docs[-1], 1.0) * recent_docs
+        return scores, baseline
+
+
+def _unpack_ngrams(term_ids: np.ndarray, V: int, hi: int) -> np.ndarray:
+    """Paketlenmiş anahtarları (terim, hi) kelime kodu satırlarına açar; eksik konumlar -1"""
+    grams = np.full((len(term_ids), hi), -1, dtype="int64")
+    offset = 0
+    for n in range(1, hi + 1):
+        in_n = (term_ids >= offset) & (term_ids < offset + V ** n)
+        key = term_ids[in_n] - offset
+        cols = np.empty((len(key), n), dtype="int64")
+        for k in reversed(range(n)):
+            key, cols[:, k] = np.divmod(key, V)
+        grams[in_n, :n] = cols
+        offset += V ** n
+    return grams
+
+
+class _TermVocab:
+    """
+    n-gram anahtarlarını gerektiğinde metne çevirir. Anahtarlar ya
+    paketlenmiş tamsayılar ya da [n, kodlar...] satırlarıdır.
+    """
+
+    def __init__(self, term_ids: np.ndarray, words: np.ndarray, V: int, hi: int):
+        self.term_ids = term_ids
+        self.words = words
+        self.V = V
+        self.hi = hi
+
+    def __len__(self) -> int:
+        return len(self.term_ids)
+
+    def decode(self, idx: np.ndarray) -> List[str]:
+        keys = self.term_ids[idx]
+        grams = _unpack_ngrams(keys, self.V, self.hi) if keys.ndim == 1 else keys[:, 1:]
+        return [" ".join(self.words[row[row >= 0]]) for row in grams]
@@ -0,0 +1,143 @@
+import argparse
+import http.client
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import numpy as np
+
+DEFAULT_PATHS = (
+    "/stats",
+    "/timeline",
+    "/trending?window_days=all",
+    "/articles?page=1&page_size=50",
+    "/search?q=market",
+)
+
+
+def run_load_test(
+    base_url: str,
+    paths: Sequence[str] = DEFAULT_PATHS,
+    clients: int = 16,
+    requests_per_client: int = 100,
+    revalidate: bool = True
+) -> Dict:
+    """
+    Eşzamanlı istemcilerle yük testi. Her istemci kalıcı bir bağlantı açar;
+    revalidate=True ise son ETag'i If-None-Match ile geri gönderir.
+    """
+    target = urlsplit(base_url)
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    received = [0]
+    lock = threading.Lock()
+    start_gate = threading.Barrier(clients)
+
+    def client(index: int):
+        conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+        etags: Dict[str, str] = {}
+        local_latencies, local_statuses, local_bytes = [], Counter(), 0
+        start_gate.wait()
+        try:
+            for i in range(requests_per_client):
+                path = paths[(index + i) % len(paths)]
+                headers = {"If-None-Match": etags[path]} if revalidate and path in etags else {}
+
+                started = time.perf_counter()
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                local_latencies.append(time.perf_counter() - started)
+
+                local_statuses[response.status] += 1
+                local_bytes += len(body)
+                if response.getheader("ETag"):
+                    etags[path] = response.getheader("ETag")
+        finally:
+            conn.close()
+            with lock:
+                latencies.extend(local_latencies)
+                statuses.update(local_statuses)
+                received[0] += local_bytes
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies_ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    total = sum(statuses.values())
+    return {
+        "benchmark": "api_load",
+        "revalidate": revalidate,
+        "clients": clients,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(total / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 2),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 2),
+        "status": {str(code): count for code, count in sorted(statuses.items())},
+        "bytes": received[0],
+    }
+
+
+def bench_api(n_rows: int = 5000, clients: int = 16, requests_per_client: int = 50) -> List[Dict]:
+    """Geçici veritabanı üzerinde sunucuyu başlatıp ETag'li ve ETag'siz yük testi"""
+    from analyzer.benchmarks import synthetic_titles
+    from api.server import NewsAPIServer
+    from database.repository import DatabaseManager
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        # Kurulum writer kuyruğu üzerinden batch halinde yazılır
+        db = DatabaseManager(os.path.join(tmp_dir, "news.db"), use_writer=True)
+        articles = synthetic_titles(n_rows).drop(columns=["id"]).to_dict("records")
+        for article in articles:
+            article["date"] = article["date"].to_pydatetime()
+        db.dbInsertArticlesBulk(articles)
+        db.stopWriter()
+
+        server = NewsAPIServer(("127.0.0.1", 0), db)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            return [
+                run_load_test(server.url, clients=clients, requests_per_client=requests_per_client,
+                              revalidate=revalidate)
+                for revalidate in (False, True)
+            ]
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="News Analyzer API yük testi")
+    parser.add_argument("--url", help="Çalışan sunucu (verilmezse geçici sunucu başlatılır)")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=100, help="İstemci başına istek")
+    parser.add_argument("--no-revalidate", action="store_true", help="If-None-Match gönderme")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        results = [run_load_test(args.url, clients=args.clients, requests_per_client=args.requests,
+                                 revalidate=not args.no_revalidate)]
+    else:
+        results = bench_api(clients=args.clients, requests_per_client=args.requests)
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
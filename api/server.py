@@ -0,0 +1,318 @@
+import argparse
+import json
+import logging
+import os
+import secrets
+import threading
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from analyzer.binning import MAX_TIMELINE_POINTS, lttb_indices
+from analyzer.result_cache import shared_analysis_cache
+from analyzer.sentiment import NewsAnalyzer
+from database.cache import LRUCache
+from database.filters import ArticleFilter
+from database.repository import DB_PATH_ENV, DEFAULT_DB_PATH, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_SEARCH_LIMIT = 200
+MAX_TIMELINE_LIMIT = 5000
+
+# Liste uçlarının döndürdüğü kolonlar
+API_COLUMNS = ("id", "title", "url", "source", "sentiment", "sentiment_label", "date")
+
+
+class BadRequest(ValueError):
+    """Geçersiz sorgu parametresi; 400 olarak döner"""
+
+
+# ---------------- PARAMS ----------------
+
+def _param(query: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = query.get(name)
+    return values[-1].strip() if values and values[-1].strip() else None
+
+
+def _int(query: Dict[str, List[str]], name: str, default: Optional[int], low: int, high: int) -> Optional[int]:
+    raw = _param(query, name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise BadRequest(f"{name} tam sayı olmalı")
+    if not low <= value <= high:
+        raise BadRequest(f"{name} {low} ile {high} arasında olmalı")
+    return value
+
+
+def _date(query: Dict[str, List[str]], name: str) -> Optional[date]:
+    raw = _param(query, name)
+    if raw is None:
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise BadRequest(f"{name} YYYY-MM-DD biçiminde olmalı")
+
+
+def _list(query: Dict[str, List[str]], name: str) -> Tuple[str, ...]:
+    # ?source=BBC&source=CNN ve ?source=BBC,CNN ikisi de kabul edilir
+    return tuple(part.strip() for value in query.get(name, []) for part in value.split(",") if part.strip())
+
+
+def _filters(query: Dict[str, List[str]]) -> Optional[ArticleFilter]:
+    filters = ArticleFilter(
+        sources=_list(query, "source"),
+        date_from=_date(query, "date_from"),
+        date_to=_date(query, "date_to"),
+        labels=_list(query, "label"),
+    )
+    return None if filters.isEmpty() else filters
+
+
+def _records(df: pd.DataFrame) -> List[Dict]:
+    # to_json skorları en fazla 15 haneye yuvarlar; kayıtlar Python nesneleriyle
+    # kurulur ki json float'ları repr ile (veritabanındaki değerle aynı) yazsın.
+    # NaN/NaT null'a, tarihler ISO metnine çevrilir
+    if df.empty:
+        return []
+    rows = df.astype(object).where(df.notna(), None).to_dict("records")
+    return [{k: v.isoformat() if isinstance(v, datetime) else v for k, v in row.items()} for row in rows]
+
+
+# ---------------- ROUTES ----------------
+
+def route_health(server: "NewsAPIServer", query) -> Dict:
+    return {"status": "ok", "generation": server.db.dbWriteGeneration()}
+
+
+def route_stats(server: "NewsAPIServer", query) -> Dict:
+    filters = _filters(query)
+    options = server.db.dbGetFilterOptions()
+    return {
+        "statistics": server.db.dbGetStatistics(),
+        "labels": server.db.dbGetLabelCounts(filters),
+        "min_date": options["min_date"].isoformat() if options["min_date"] else None,
+        "max_date": options["max_date"].isoformat() if options["max_date"] else None,
+    }
+
+
+def route_timeline(server: "NewsAPIServer", query) -> Dict:
+    max_points = _int(query, "max_points", MAX_TIMELINE_POINTS, 3, MAX_TIMELINE_LIMIT)
+    daily = server.db.dbGetSentimentTimeline(_filters(query))
+    total_days = len(daily)
+    if total_days > max_points:
+        x = daily["day"].to_numpy().astype("int64")
+        daily = daily.iloc[lttb_indices(x, daily["avg_sentiment"].fillna(0).to_numpy(), max_points)]
+
+    daily = daily.assign(day=daily["day"].dt.strftime("%Y-%m-%d"), avg_sentiment=daily["avg_sentiment"].round(4))
+    return {"days": total_days, "points": _records(daily)}
+
+
+def route_trending(server: "NewsAPIServer", query) -> Dict:
+    # window_days=all tüm geçmişi (term_totals) kullanır
+    window_days = None if _param(query, "window_days") == "all" else _int(query, "window_days", 7, 1, 3650)
+    terms = server.db.dbGetTrendingTerms(
+        window_days=window_days,
+        source=_param(query, "source"),
+        top_n=_int(query, "top_n", 20, 1, 200)
+    )
+    return {"window_days": window_days, "terms": [{"term": t, "count": c} for t, c in terms]}
+
+
+def route_search(server: "NewsAPIServer", query) -> Dict:
+    keyword = _param(query, "q")
+    if keyword is None:
+        raise BadRequest("q parametresi gerekli")
+    limit = _int(query, "limit", 50, 1, MAX_SEARCH_LIMIT)
+    df = server.analyzer.analyze_batch(server.db.dbSearchArticles(keyword, limit=limit, compact=False))
+    return {"q": keyword, "items": _records(df[[c for c in API_COLUMNS if c in df.columns]])}
+
+
+def route_articles(server: "NewsAPIServer", query) -> Dict:
+    filters = _filters(query)
+    page = _int(query, "page", 1, 1, 1_000_000)
+    page_size = _int(query, "page_size", DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+
+    # Bir fazla satır okunur; sonraki sayfa olup olmadığı COUNT'suz anlaşılır.
+    # Dış JSON veritabanıyla aynı olmalı: float32 sıkıştırma yapılmaz
+    df = server.db.dbGetAllArticles(
+        limit=page_size + 1, columns=API_COLUMNS, filters=filters,
+        offset=(page - 1) * page_size, compact=False
+    )
+    df = server.analyzer.analyze_batch(df)
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total": sum(server.db.dbGetLabelCounts(filters).values()),
+        "has_more": len(df) > page_size,
+        "items": _records(df.head(page_size)),
+    }
+
+
+ROUTES: Dict[str, Callable[["NewsAPIServer", Dict], Dict]] = {
+    "/health": route_health,
+    "/stats": route_stats,
+    "/timeline": route_timeline,
+    "/trending": route_trending,
+    "/search": route_search,
+    "/articles": route_articles,
+}
+
+
+# ---------------- SERVER ----------------
+
+class NewsAPIHandler(BaseHTTPRequestHandler):
+    """Salt okunur JSON uçları; ETag yazma neslinden türetilir"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "NewsAnalyzerAPI/1.0"
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _handle(self, send_body: bool):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        route = ROUTES.get(path)
+        if route is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Bilinmeyen uç: {path}", "routes": sorted(ROUTES)}, send_body)
+            return
+
+        # Nesil sorgudan önce okunur; yükleme sırasında gelen yazma ETag'i
+        # eskitir, yeni veriyi eski ETag'le işaretlemez
+        etag = self.server.etag()
+        if self._matches(etag):
+            self.server.count("not_modified")
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        try:
+            body = self.server.render(path, url.query, route, etag)
+        except ValueError as e:
+            # BadRequest ve ArticleFilter etiket doğrulaması
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(e)}, send_body)
+            return
+        except Exception as e:
+            logger.exception(f"API hatası ({self.path}): {e}")
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Sunucu hatası"}, send_body)
+            return
+
+        self.server.count("ok")
+        self._sendBody(HTTPStatus.OK, body, send_body, etag)
+
+    def _matches(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return "*" in candidates or etag in candidates
+
+    def _send(self, status: HTTPStatus, payload: Dict, send_body: bool):
+        if status >= 400:
+            self.server.count("errors")
+        self._sendBody(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), send_body)
+
+    def _sendBody(self, status: HTTPStatus, body: bytes, send_body: bool, etag: Optional[str] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class NewsAPIServer(ThreadingHTTPServer):
+    """
+    DatabaseManager ve NewsAnalyzer üzerinde salt okunur HTTP servisi.
+
+    ETag, sunucu örneğine özgü jeton ile yazma neslinden oluşur; veri
+    değişmedikçe istemci If-None-Match ile 304 alır ve sorgu çalışmaz.
+    Kodlanmış yanıtlar (yol, ETag) anahtarıyla ayrıca önbelleğe alınır.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], db_manager: DatabaseManager, analyzer: Optional[NewsAnalyzer] = None):
+        super().__init__(address, NewsAPIHandler)
+        self.db = db_manager
+        self.analyzer = analyzer or NewsAnalyzer(cache=shared_analysis_cache())
+        # Yeniden başlatılan sunucu eski ETag'lere yanlışlıkla 304 vermesin
+        self.instance = secrets.token_hex(4)
+        self.responses = LRUCache(max_entries=256, max_bytes=16 * 1024 * 1024)
+        self.counters = {"ok": 0, "not_modified": 0, "errors": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def etag(self) -> str:
+        return f'"{self.instance}-{self.db.dbWriteGeneration()}"'
+
+    def render(self, path: str, query_string: str, route, etag: str) -> bytes:
+        query = parse_qs(query_string)
+        key = (path, tuple(sorted((k, tuple(v)) for k, v in query.items())), etag)
+        body = self.responses.get(key)
+        if body is None:
+            body = json.dumps(route(self, query), ensure_ascii=False, default=str).encode("utf-8")
+            self.responses.put(key, body, size=len(body))
+        return body
+
+    def count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self.counters)
+        return {**counters, "responses": self.responses.stats(), "db_cache": self.db.dbCacheStats()}
+
+
+def create_server(db_path: str, host: str = "127.0.0.1", port: int = 8080) -> NewsAPIServer:
+    return NewsAPIServer((host, port), DatabaseManager(db_path))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="News Analyzer salt okunur JSON API")
+    parser.add_argument("--db", default=os.environ.get(DB_PATH_ENV, DEFAULT_DB_PATH), help="SQLite veritabanı yolu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = create_server(args.db, args.host, args.port)
+    logger.info(f"API dinleniyor: {server.url} ({', '.join(sorted(ROUTES))})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
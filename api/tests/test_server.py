@@ -0,0 +1,165 @@
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from api.loadtest import run_load_test
+from api.server import MAX_PAGE_SIZE, NewsAPIServer
+from database.repository import DatabaseManager
+
+
+class TestNewsAPI(unittest.TestCase):
+    """Salt okunur JSON API uçları, ETag/304 ve eşzamanlı istemciler"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        start = datetime(2026, 2, 1, 9)
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Market report {i} shows {["growth", "losses", "calm"][i % 3]}', 'url': f'u{i}',
+             'source': ['BBC', 'CNN'][i % 2], 'sentiment': [0.5, -0.5, 0.0][i % 3],
+             'date': start + timedelta(hours=8 * i)}
+            for i in range(60)
+        ])
+
+        self.server = NewsAPIServer(("127.0.0.1", 0), self.db)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def _get(self, path, etag=None):
+        request = urllib.request.Request(self.server.url + path)
+        if etag:
+            request.add_header('If-None-Match', etag)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.headers, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            body = e.read()
+            return e.code, e.headers, json.loads(body) if body else None
+
+    def test_stats_and_timeline(self):
+        status, _, stats = self._get('/stats')
+        self.assertEqual(status, 200)
+        self.assertEqual(stats['statistics']['total_articles'], 60)
+        self.assertEqual(stats['labels'], {'Positive': 20, 'Neutral': 20, 'Negative': 20})
+        self.assertEqual(stats['min_date'], '2026-02-01')
+
+        _, _, filtered = self._get('/stats?source=BBC&label=Positive,Neutral')
+        self.assertEqual(sum(filtered['labels'].values()), 20)
+
+        _, _, timeline = self._get('/timeline')
+        self.assertEqual(timeline['days'], 21)
+        self.assertEqual(sum(p['count'] for p in timeline['points']), 60)
+        self.assertEqual(timeline['points'][0]['day'], '2026-02-01')
+
+        _, _, thinned = self._get('/timeline?max_points=5')
+        self.assertEqual(len(thinned['points']), 5)
+
+    def test_articles_pagination(self):
+        _, _, first = self._get('/articles?page=1&page_size=25')
+        _, _, last = self._get('/articles?page=3&page_size=25')
+
+        self.assertEqual((first['total'], len(first['items']), first['has_more']), (60, 25, True))
+        self.assertEqual((len(last['items']), last['has_more']), (10, False))
+        dates = [item['date'] for item in first['items']]
+        self.assertEqual(dates, sorted(dates, reverse=True))
+        self.assertEqual(set(first['items'][0]), {'id', 'title', 'url', 'source', 'sentiment',
+                                                  'sentiment_label', 'date'})
+
+        _, _, cnn = self._get('/articles?source=CNN&page_size=100')
+        self.assertEqual({item['source'] for item in cnn['items']}, {'CNN'})
+        self.assertEqual(cnn['total'], 30)
+
+    def test_search_and_trending(self):
+        _, _, search = self._get('/search?q=losses&limit=5')
+        self.assertEqual(len(search['items']), 5)
+        self.assertTrue(all('losses' in item['title'] for item in search['items']))
+
+        _, _, trending = self._get('/trending?window_days=all&top_n=3')
+        self.assertIsNone(trending['window_days'])
+        self.assertEqual(trending['terms'][0], {'term': 'market', 'count': 60})
+
+    def test_items_match_stored_values(self):
+        """Skorlar float32'ye, tarihler mikrosaniyesiz biçime düşmeden sunulur"""
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Precision check one', 'url': 'p1', 'source': 'BBC', 'sentiment': 0.1,
+             'date': datetime(2026, 1, 1, 12, 0, 0, 123456)},
+            {'title': 'Precision check two', 'url': 'p2', 'source': 'CNN', 'sentiment': -0.337,
+             'date': datetime(2026, 1, 2)},
+            {'title': 'Precision check three', 'url': 'p3', 'source': 'CNN', 'sentiment': 0.13636363636363635,
+             'date': datetime(2026, 1, 1, 23, 59, 59)},
+        ])
+        with sqlite3.connect(os.path.join(self.tmp_dir, "news.db")) as conn:
+            stored = {url: (sentiment, datetime.fromisoformat(date)) for url, sentiment, date in conn.execute(
+                "SELECT url, sentiment, date FROM articles WHERE url IN ('p1', 'p2', 'p3')")}
+
+        _, _, search = self._get('/search?q=Precision')
+        _, _, articles = self._get('/articles?date_to=2026-01-02&page_size=10')
+        for items in (search['items'], articles['items']):
+            served = {item['url']: (item['sentiment'], datetime.fromisoformat(item['date'])) for item in items}
+            self.assertEqual(served, stored)
+        self.assertEqual(stored['p1'][0], 0.1)
+
+    def test_bad_requests(self):
+        for path in ('/search', f'/articles?page_size={MAX_PAGE_SIZE + 1}', '/articles?page=x',
+                     '/stats?label=Happy', '/timeline?date_from=yesterday'):
+            status, headers, body = self._get(path)
+            self.assertEqual(status, 400, path)
+            self.assertIn('error', body)
+            self.assertIsNone(headers.get('ETag'))
+
+        status, _, body = self._get('/nope')
+        self.assertEqual(status, 404)
+        self.assertIn('/articles', body['routes'])
+
+    def test_etag_revalidation(self):
+        status, headers, _ = self._get('/stats')
+        etag = headers['ETag']
+        self.assertEqual(status, 200)
+
+        status, headers, body = self._get('/stats', etag=etag)
+        self.assertEqual((status, body, headers['ETag']), (304, None, etag))
+        # Nesil tüm uçlar için ortaktır
+        self.assertEqual(self._get('/articles', etag=etag)[0], 304)
+
+        self.db.dbInsertArticle({'title': 'Fresh news', 'url': 'fresh', 'source': 'NPR',
+                                 'sentiment': 0.3, 'date': datetime(2026, 3, 1)})
+        status, headers, stats = self._get('/stats', etag=etag)
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+        self.assertEqual(stats['statistics']['total_articles'], 61)
+
+    def test_etag_is_scoped_to_server_instance(self):
+        etag = self._get('/stats')[1]['ETag']
+        other = NewsAPIServer(("127.0.0.1", 0), self.db)
+        try:
+            self.assertNotEqual(other.etag(), etag)
+        finally:
+            other.server_close()
+
+    def test_concurrent_clients(self):
+        result = run_load_test(self.server.url, clients=8, requests_per_client=20)
+
+        self.assertEqual(result['requests'], 160)
+        self.assertEqual(set(result['status']), {'200', '304'})
+        # İlk tur dışında tüm istekler 304 ile döner
+        self.assertGreaterEqual(result['status']['304'], 160 - 8 * 5)
+        self.assertEqual(self.server.stats()['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,313 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from analyzer.labels import SENTIMENT_LABELS
+from analyzer.sentiment import NewsAnalyzer
+from database.filters import ArticleFilter
+from database.repository import DB_PATH_ENV, DEFAULT_DB_PATH, DatabaseManager
+
+# Bu modül Streamlit/Plotly içe aktarmaz; cron'dan çalışan ingest hızlı açılır.
+# Scraper (requests, bs4) ve benchmark modülleri yalnızca ilgili komutta yüklenir.
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+EXPORT_CHUNK_ROWS = 5000
+EXPORT_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+STATS_WINDOW = 1000
+
+
+def _json_default(value):
+    # Tarihler ve numpy skalerleri; kalan tipler metne çevrilir
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _emit(record: Dict):
+    """Tek satır JSON; stdout yalnızca makine okunur çıktı içindir, loglar stderr'e gider"""
+    sys.stdout.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+    sys.stdout.flush()
+
+
+def _filters(args) -> Optional[ArticleFilter]:
+    filters = ArticleFilter(
+        sources=tuple(args.source or ()),
+        date_from=args.date_from,
+        date_to=args.date_to,
+        labels=tuple(args.label or ()),
+    )
+    return None if filters.isEmpty() else filters
+
+
+def build_scraper(args):
+    from scraper.manager import NewsScraper
+    return NewsScraper(max_workers=args.workers, scorer=args.scorer)
+
+
+# ---------------- COMMANDS ----------------
+
+def cmd_ingest(args, db: DatabaseManager) -> Iterator[Dict]:
+    """Tek seferlik veya --loop aralığıyla tekrarlanan scrape + kayıt"""
+    from scraper.jobs import FAILED, ScrapeJobManager
+
+    jobs = ScrapeJobManager(build_scraper(args), db)
+    run = 0
+    while True:
+        run += 1
+        started = time.perf_counter()
+        job = jobs.submit()
+        job.wait()
+        snapshot = job.snapshot()
+        elapsed = time.perf_counter() - started
+
+        yield {
+            "run": run,
+            "state": snapshot["state"],
+            "sources": snapshot["sources"],
+            "totals": snapshot["totals"],
+            "error": snapshot["error"],
+            "ok": snapshot["state"] != FAILED,
+            "seconds": round(elapsed, 3),
+        }
+
+        if not args.loop or (args.max_runs and run >= args.max_runs):
+            return
+        # Aralık çalışmanın başından ölçülür; uzun süren scrape kaymaya yol açmaz
+        time.sleep(max(0.0, args.loop - elapsed))
+
+
+def cmd_stats(args, db: DatabaseManager) -> Iterator[Dict]:
+    filters = _filters(args)
+    options = db.dbGetFilterOptions()
+    analyzer = NewsAnalyzer()
+    recent = analyzer.analyze_batch(db.dbGetAllArticles(limit=args.window, filters=filters))
+    yield {
+        "statistics": db.dbGetStatistics(),
+        "labels": db.dbGetLabelCounts(filters),
+        "min_date": options["min_date"],
+        "max_date": options["max_date"],
+        "recent": analyzer.get_summary_statistics(recent),
+    }
+
+
+def cmd_search(args, db: DatabaseManager) -> Iterator[Dict]:
+    df = NewsAnalyzer().analyze_batch(db.dbSearchArticles(args.query, limit=args.limit))
+    columns = [c for c in ("id", "title", "url", "source", "sentiment", "sentiment_label", "date") if c in df.columns]
+    items = json.loads(df[columns].to_json(orient="records", date_format="iso")) if not df.empty else []
+    yield {"query": args.query, "count": len(items), "items": items}
+
+
+def cmd_vacuum(args, db: DatabaseManager) -> Iterator[Dict]:
+    yield db.dbVacuum()
+
+
+def cmd_analyze(args, db: DatabaseManager) -> Iterator[Dict]:
+    yield db.dbAnalyze()
+
+
+def _parquetSchema():
+    import pyarrow as pa
+
+    # Boş sonuç ve tamamı NULL kolonlu parçalar için de dosya şeması sabit kalır
+    return pa.schema([
+        ("id", pa.int64()),
+        ("title", pa.string()),
+        ("url", pa.string()),
+        ("source", pa.string()),
+        ("sentiment", pa.float64()),
+        ("date", pa.timestamp("us")),
+        ("sentiment_model_version", pa.string()),
+        ("sentiment_label", pa.string()),
+    ])
+
+
+def cmd_export(args, db: DatabaseManager) -> Iterator[Dict]:
+    """
+    Haberleri id sırasıyla parça parça okuyup dosyaya akıtır; tüm tablo
+    belleğe alınmaz. Değerler veritabanındaki gibidir: skorlar float64,
+    tarihler mikrosaniyeli ISO 8601.
+    """
+    filters = _filters(args)
+    rows, chunks, last_id = 0, 0, 0
+    writer = None
+    handle = schema = None
+    if args.format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = _parquetSchema()
+    else:
+        handle = open(args.output, "w", encoding="utf-8", newline="")
+
+    try:
+        while True:
+            df = db.dbGetArticlesSince(last_id, filters=filters, limit=args.chunk_rows, compact=False)
+            if df.empty:
+                break
+
+            if args.format == "csv":
+                df.to_csv(handle, index=False, header=chunks == 0, date_format=EXPORT_DATE_FORMAT)
+            elif args.format == "jsonl":
+                # to_json skorları 15 haneye yuvarlar; json float'ları repr ile tam yazar
+                records = df.astype(object).where(df.notna(), None).to_dict("records")
+                handle.writelines(json.dumps(r, ensure_ascii=False, default=_json_default) + "\n" for r in records)
+            else:
+                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(args.output, schema)
+                writer.write_table(table)
+
+            rows += len(df)
+            chunks += 1
+            last_id = int(df["id"].iloc[-1])
+    finally:
+        if handle is not None:
+            handle.close()
+        if writer is not None:
+            writer.close()
+
+    if args.format == "parquet" and writer is None:
+        # Boş sonuç da okunabilir bir dosya bırakır
+        pq.write_table(schema.empty_table(), args.output)
+
+    yield {
+        "format": args.format,
+        "output": os.path.abspath(args.output),
+        "rows": rows,
+        "chunks": chunks,
+        "bytes": os.path.getsize(args.output),
+    }
+
+
+def _benchmarks(quick: bool) -> Dict[str, Callable[[], List[Dict]]]:
+    # Streamlit/Plotly kullanan benchmark'lar dashboard.benchmarks'tadır ve burada dahil değildir
+    from analyzer import benchmarks
+    from api.loadtest import bench_api
+
+    return {
+        "trending": lambda: [
+            benchmarks.bench_trending(n_titles=10_000 if quick else 100_000, method=method)
+            for method in ("zscore", "kleinberg")
+        ],
+        "tokenizer": lambda: [benchmarks.bench_tokenizer(n_titles=50_000 if quick else 1_000_000)],
+        "analyzer": lambda: benchmarks.bench_analyzer(sizes=(10_000,) if quick else (10_000, 100_000, 1_000_000)),
+        "page_memory": lambda: benchmarks.bench_page_memory(n_rows=1000 if quick else 5000, limit=500 if quick else 1000),
+        "scorers": lambda: benchmarks.bench_scorers(n_texts=1000 if quick else 20_000),
+        "api": lambda: bench_api(n_rows=1000 if quick else 5000, clients=4 if quick else 16,
+                                 requests_per_client=10 if quick else 50),
+    }
+
+
+BENCHMARKS = ("trending", "tokenizer", "analyzer", "page_memory", "scorers", "api")
+
+
+def cmd_bench(args, db: Optional[DatabaseManager]) -> Iterator[Dict]:
+    suites = _benchmarks(args.quick)
+    for name in args.names or BENCHMARKS:
+        started = time.perf_counter()
+        results = suites[name]()
+        yield {"suite": name, "results": results, "seconds": round(time.perf_counter() - started, 3)}
+
+
+COMMANDS: Dict[str, Callable] = {
+    "ingest": cmd_ingest,
+    "stats": cmd_stats,
+    "search": cmd_search,
+    "vacuum": cmd_vacuum,
+    "analyze": cmd_analyze,
+    "export": cmd_export,
+    "bench": cmd_bench,
+}
+
+
+# ---------------- ARGUMENTS ----------------
+
+def _add_filter_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--source", action="append", help="Kaynak (tekrarlanabilir)")
+    parser.add_argument("--label", action="append", choices=SENTIMENT_LABELS, help="Etiket (tekrarlanabilir)")
+    parser.add_argument("--date-from", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--date-to", type=date.fromisoformat, help="YYYY-MM-DD")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="News Analyzer komut satırı; her sonuç stdout'a tek satır JSON olarak yazılır"
+    )
+    parser.add_argument("--db", default=os.environ.get(DB_PATH_ENV, DEFAULT_DB_PATH), help="SQLite veritabanı yolu")
+    parser.add_argument("--log-level", default="INFO", choices=("DEBUG", "INFO", "WARNING", "ERROR"))
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Kaynakları çek ve kaydet")
+    ingest.add_argument("--loop", type=float, metavar="SECONDS", help="Verilirse bu aralıkla tekrarla")
+    ingest.add_argument("--max-runs", type=int, help="--loop ile en fazla çalışma sayısı")
+    ingest.add_argument("--workers", type=int, default=4)
+    ingest.add_argument("--scorer", help="Skorlayıcı (varsayılan: NEWS_SENTIMENT_SCORER / textblob)")
+
+    stats = sub.add_parser("stats", help="Özet istatistikler")
+    stats.add_argument("--window", type=int, default=STATS_WINDOW, help="Analiz özeti için son haber sayısı")
+    _add_filter_args(stats)
+
+    search = sub.add_parser("search", help="Başlıkta arama")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=50)
+
+    sub.add_parser("vacuum", help="VACUUM ile dosyayı sıkıştır")
+    sub.add_parser("analyze", help="ANALYZE ve PRAGMA optimize")
+
+    export = sub.add_parser("export", help="Haberleri dosyaya aktar")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    export.add_argument("--output", "-o", required=True)
+    export.add_argument("--chunk-rows", type=int, default=EXPORT_CHUNK_ROWS)
+    _add_filter_args(export)
+
+    bench = sub.add_parser("bench", help="Benchmark'ları çalıştır")
+    bench.add_argument("names", nargs="*", metavar="NAME",
+                       help=f"Seçenekler: {', '.join(BENCHMARKS)} (varsayılan: hepsi)")
+    bench.add_argument("--quick", action="store_true", help="Küçük boyutlarla çalıştır")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "bench":
+        unknown = sorted(set(args.names) - set(BENCHMARKS))
+        if unknown:
+            parser.error(f"Bilinmeyen benchmark(lar): {', '.join(unknown)}")
+    # Scraper modülünün basicConfig'inden önce; loglar stdout'taki JSON'a karışmasın
+    logging.basicConfig(
+        level=args.log_level, stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    started = time.perf_counter()
+    last = started
+    ok = True
+    try:
+        # Benchmark'lar kendi geçici veritabanlarını kurar
+        db = None if args.command == "bench" else DatabaseManager(args.db, use_cache=False)
+        for record in COMMANDS[args.command](args, db):
+            now = time.perf_counter()
+            record.setdefault("seconds", round(now - last, 4))
+            ok = ok and record.get("ok", True)
+            _emit({"command": args.command, **record})
+            last = time.perf_counter()
+    except KeyboardInterrupt:
+        logger.info("Durduruldu")
+    except Exception as e:
+        logger.exception(f"{args.command} başarısız: {e}")
+        _emit({"command": args.command, "ok": False, "error": str(e) or type(e).__name__,
+               "seconds": round(time.perf_counter() - started, 4)})
+        return 1
+
+    return 0 if ok else 1
@@ -0,0 +1,171 @@
+import os
+import sys
+import io
+import json
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from cli.app import main
+from database.repository import DatabaseManager
+from models.News import News
+
+
+class FakeScraper:
+    """Ağa çıkmadan iki kaynak raporlayan sahte scraper"""
+
+    SOURCES = {'BBC': None, 'CNN': None}
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    def scrape_all(self, db_manager=None, progress=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError('network down')
+        progress('BBC', {'state': 'done', 'count': 2})
+        progress('CNN', {'state': 'failed', 'error': 'timeout'})
+        return [News(title=f'Run {self.calls} headline {i}', url=f'r{self.calls}-{i}', source='BBC', sentiment=0.2)
+                for i in range(2)]
+
+
+class TestCLI(unittest.TestCase):
+    """Komut satırı alt komutları ve JSON çıktısı"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        start = datetime(2026, 3, 1, 8)
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Market update {i} {["rally", "slump", "steady"][i % 3]}', 'url': f'u{i}',
+             'source': ['BBC', 'CNN'][i % 2], 'sentiment': [0.6, -0.6, 0.0][i % 3],
+             'date': start + timedelta(hours=i)}
+            for i in range(30)
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _run(self, *argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['--db', self.db_path, '--log-level', 'ERROR', *argv])
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_stats_and_search(self):
+        code, [stats] = self._run('stats', '--source', 'CNN')
+        self.assertEqual(code, 0)
+        self.assertEqual(stats['command'], 'stats')
+        self.assertEqual(stats['statistics']['total_articles'], 30)
+        self.assertEqual(sum(stats['labels'].values()), 15)
+        self.assertEqual(stats['recent']['total_articles'], 15)
+        self.assertEqual(stats['min_date'], '2026-03-01')
+        self.assertIsInstance(stats['seconds'], float)
+
+        code, [search] = self._run('search', 'slump', '--limit', '3')
+        self.assertEqual(search['count'], 3)
+        self.assertTrue(all(item['sentiment_label'] == 'Negative' for item in search['items']))
+
+    def test_export_formats(self):
+        for fmt in ('csv', 'jsonl', 'parquet'):
+            output = os.path.join(self.tmp_dir, f'out.{fmt}')
+            code, [result] = self._run('export', '--format', fmt, '-o', output, '--chunk-rows', '7')
+            self.assertEqual(code, 0)
+            self.assertEqual((result['rows'], result['chunks']), (30, 5))
+
+            if fmt == 'csv':
+                df = pd.read_csv(output)
+            elif fmt == 'jsonl':
+                df = pd.read_json(output, lines=True)
+            else:
+                df = pq.read_table(output).to_pandas()
+            self.assertEqual(df['id'].tolist(), sorted(df['id']))
+            self.assertEqual(len(df), 30, fmt)
+            self.assertEqual(df['sentiment_label'].value_counts().to_dict(),
+                             {'Positive': 10, 'Negative': 10, 'Neutral': 10})
+
+        output = os.path.join(self.tmp_dir, 'empty.parquet')
+        code, [result] = self._run('export', '--format', 'parquet', '-o', output, '--label', 'Positive',
+                                   '--date-from', '2027-01-01')
+        self.assertEqual(result['rows'], 0)
+        self.assertEqual(pq.read_table(output).num_rows, 0)
+
+    def test_export_round_trips_stored_values(self):
+        """Skorlar float32'ye, tarihler saniyeye düşmeden SQLite'taki değerlerle aynı yazılır"""
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Precise one', 'url': 'p1', 'source': 'BBC', 'sentiment': 0.1,
+             'date': datetime(2026, 3, 5, 12, 0, 0, 123456)},
+            {'title': 'Precise two', 'url': 'p2', 'source': 'CNN', 'sentiment': 0.13636363636363635,
+             'date': datetime(2026, 3, 6)},
+            {'title': 'Precise three', 'url': 'p3', 'source': 'CNN', 'sentiment': -0.337,
+             'date': datetime(2026, 3, 6, 23, 59, 59, 1)},
+        ])
+        with sqlite3.connect(self.db_path) as conn:
+            stored = [(row_id, sentiment, datetime.fromisoformat(date)) for row_id, sentiment, date in conn.execute(
+                "SELECT id, sentiment, date FROM articles ORDER BY id")]
+
+        for fmt in ('csv', 'jsonl', 'parquet'):
+            output = os.path.join(self.tmp_dir, f'exact.{fmt}')
+            self._run('export', '--format', fmt, '-o', output, '--chunk-rows', '4')
+            if fmt == 'csv':
+                df = pd.read_csv(output, float_precision='round_trip', parse_dates=['date'])
+            elif fmt == 'jsonl':
+                df = pd.read_json(output, lines=True, precise_float=True, convert_dates=['date'])
+            else:
+                df = pq.read_table(output).to_pandas()
+            exported = [(int(i), float(s), d.to_pydatetime()) for i, s, d in zip(df['id'], df['sentiment'], df['date'])]
+            self.assertEqual(exported, stored, fmt)
+
+    def test_maintenance(self):
+        self.db.dbDeleteAllArticles()
+        code, [vacuum] = self._run('vacuum')
+        self.assertEqual(code, 0)
+        self.assertLessEqual(vacuum['bytes_after'], vacuum['bytes_before'])
+
+        code, [analyze] = self._run('analyze')
+        self.assertGreaterEqual(analyze['indexes'], 0)
+
+    def test_ingest_loop(self):
+        scraper = FakeScraper()
+        with patch('cli.app.build_scraper', return_value=scraper):
+            code, runs = self._run('ingest', '--loop', '0.01', '--max-runs', '2')
+
+        self.assertEqual(code, 0)
+        self.assertEqual([run['run'] for run in runs], [1, 2])
+        self.assertEqual(runs[0]['totals']['saved'], 2)
+        self.assertEqual(runs[0]['sources']['CNN']['error'], 'timeout')
+        self.assertEqual(self.db.dbGetStatistics()['total_articles'], 34)
+
+    def test_ingest_failure_sets_exit_code(self):
+        with patch('cli.app.build_scraper', return_value=FakeScraper(fail=True)):
+            code, [run] = self._run('ingest')
+
+        self.assertEqual(code, 1)
+        self.assertFalse(run['ok'])
+        self.assertEqual(run['error'], 'network down')
+
+    def test_does_not_import_dashboard_stack(self):
+        script = (
+            "import sys; from cli.app import main; "
+            f"main(['--db', {self.db_path!r}, '--log-level', 'ERROR', 'stats']); "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & {'streamlit', 'plotly', 'scraper'}))"
+        )
+        result = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.splitlines()[-1], '[]')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,169 @@
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from analyzer.benchmarks import synthetic_articles, synthetic_titles
+from analyzer.sentiment import NewsAnalyzer
+from analyzer.tokenizer import Tokenizer
+from dashboard.components import DashboardUI
+from dashboard.figures import FigureCache
+
+# Streamlit/Plotly gerektiren arayüz benchmark'ları; analyzer.benchmarks bunları içe aktarmaz.
+
+
+def bench_chart_payload(
+    sizes=(1_000, 100_000, 1_000_000), days: int = 3650, raw_limit: int = 100_000
+) -> List[Dict]:
+    """
+    Histogram, kutu ve zaman grafiklerinin figure JSON boyutu (byte).
+    Ham satırları Plotly'ye veren eski yol yalnızca raw_limit'e kadar ölçülür.
+    """
+    import plotly.express as px
+    from analyzer.binning import box_summary, histogram_bins, sentiment_timeline
+
+    analyzer = NewsAnalyzer()
+    ui = DashboardUI()
+    results = []
+    for n in sizes:
+        df = analyzer.analyze_batch(synthetic_articles(n, days=days))
+
+        started = time.perf_counter()
+        figures = {
+            'histogram': ui.histogram_figure(histogram_bins(df['sentiment'], df['sentiment_label'])),
+            'box': ui.box_figure(box_summary(df)),
+            'timeline': ui.timeline_figure(sentiment_timeline(df)),
+        }
+        aggregate_sec = time.perf_counter() - started
+        result = {
+            "benchmark": "chart_payload",
+            "rows": n,
+            "aggregate_sec": round(aggregate_sec, 4),
+            "payload_bytes": {name: len(fig.to_json()) for name, fig in figures.items()},
+        }
+
+        if n <= raw_limit:
+            raw = {
+                'histogram': px.histogram(df, x='sentiment', nbins=30, color='sentiment_label'),
+                'box': px.box(df, x='source', y='sentiment', color='source'),
+            }
+            result["raw_payload_bytes"] = {name: len(fig.to_json()) for name, fig in raw.items()}
+
+        results.append(result)
+    return results
+
+
+def _legacy_news_list(df: pd.DataFrame):
+    # Tablo görünümünden önceki 4_Haberler döngüsü: satır başına konteyner/kolon/metric
+    import streamlit as st
+
+    badges = {"Positive": "🟢", "Negative": "🔴"}
+    for _, row in df.iterrows():
+        with st.container():
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.markdown(f"### {badges.get(row['sentiment_label'], '🟡')} {row['title']}")
+                st.caption(f"📰 {row['source']} | 📅 {row['date']}")
+                if row['url']:
+                    st.markdown(f"[🔗 Haberi Oku]({row['url']})")
+            with col2:
+                st.metric("Sentiment", f"{row['sentiment']:.3f}")
+                st.caption(row.get('sentiment_label', 'Neutral'))
+            st.markdown("---")
+
+
+def _news_list_script(n_rows: int, mode: str):
+    # AppTest.from_function bu gövdeyi ayrı bir betik olarak çalıştırır
+    import time
+    import streamlit as st
+    from analyzer.benchmarks import synthetic_titles
+    from analyzer.sentiment import NewsAnalyzer
+    from dashboard.benchmarks import _legacy_news_list
+    from dashboard.components import DashboardUI
+
+    df = NewsAnalyzer().analyze_batch(synthetic_titles(n_rows))
+    started = time.perf_counter()
+    if mode == "legacy":
+        _legacy_news_list(df)
+    else:
+        DashboardUI().render_news_list(df, sort_by=None, limit=n_rows)
+    st.session_state["render_ms"] = (time.perf_counter() - started) * 1000
+
+
+def _element_count(node) -> int:
+    children = getattr(node, "children", {}) or {}
+    return 1 + sum(_element_count(child) for child in children.values())
+
+
+def bench_news_list(sizes=(20, 100, 500), repeats: int = 3) -> List[Dict]:
+    """
+    Haber listesinin betik içi çizim süresi ve eleman sayısı: satır başına
+    widget üreten eski döngü vs tek st.dataframe tablosu.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    results = []
+    for n in sizes:
+        for mode in ("legacy", "table"):
+            at = AppTest.from_function(_news_list_script, args=(n, mode), default_timeout=120).run()
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                at.run()
+                timings.append((time.perf_counter() - started) * 1000)
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+
+            results.append({
+                "benchmark": "news_list",
+                "renderer": mode,
+                "rows": n,
+                "elements": _element_count(at.main),
+                "render_ms": round(at.session_state["render_ms"], 2),
+                "run_p50_ms": round(float(np.percentile(timings, 50)), 2),
+            })
+    return results
+
+
+def bench_figure_cache(n_rows: int = 1000, reruns: int = 20) -> List[Dict]:
+    """
+    Dört özet grafiğin rerun başına maliyeti: her seferinde figür kurup
+    serileştirme vs özet hash'iyle önbellekten JSON okuma.
+    """
+    from analyzer.binning import label_counts, source_counts, source_label_counts
+    from analyzer.labels import SENTIMENT_LABELS
+
+    df = NewsAnalyzer().analyze_batch(synthetic_titles(n_rows))
+    keywords = Tokenizer().most_common(df['title'], 20)
+
+    def charts(ui):
+        return [
+            ('sentiment_pie', label_counts(df['sentiment_label'], SENTIMENT_LABELS), ui.pie_figure),
+            ('source_distribution', source_counts(df['source']), ui.source_bar_figure),
+            ('source_sentiment', source_label_counts(df), ui.source_sentiment_figure),
+            ('keywords', pd.DataFrame(keywords, columns=['word', 'count']), ui.keywords_figure),
+        ]
+
+    results = []
+    for mode in ("rebuild", "cached"):
+        cache = FigureCache()
+        ui = DashboardUI(figure_cache=cache)
+        timings = []
+        for _ in range(reruns):
+            if mode == "rebuild":
+                cache.clear()
+            started = time.perf_counter()
+            for name, data, build in charts(ui):
+                cache.get_or_build(name, data, build)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        results.append({
+            "benchmark": "figure_cache",
+            "mode": mode,
+            "rows": n_rows,
+            "charts": 4,
+            "rerun_p50_ms": round(float(np.percentile(timings, 50)), 2),
+            "hit_rate": cache.stats()["hit_rate"],
+        })
+    return results
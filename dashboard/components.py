@@ -3,11 +3,38 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from database.filters import ArticleFilter
+from analyzer.labels import SENTIMENT_LABELS
+from analyzer.binning import (
+    MAX_TIMELINE_POINTS, box_summary, histogram_bins, label_counts, sentiment_timeline,
+    source_counts, source_label_counts, thin_timeline
+)
+from dashboard.figures import FigureCache, shared_figure_cache
+
+SENTIMENT_COLORS = {'Positive': '#2ecc71', 'Neutral': '#95a5a6', 'Negative': '#e74c3c'}
+LABELS_TR = {'Positive': 'Pozitif', 'Neutral': 'Nötr', 'Negative': 'Negatif'}
+SENTIMENT_BADGES = {'Positive': '🟢', 'Neutral': '🟡', 'Negative': '🔴'}
+
+# Haber listesi tablosunun kolonları; satır sayısından bağımsız tek st.dataframe
+NEWS_LIST_COLUMNS = ['badge', 'title', 'source', 'date', 'sentiment', 'sentiment_label', 'url']
+NEWS_LIST_ROW_PX = 35
+NEWS_LIST_MAX_PX = 720
 
 
 class DashboardUI:
-    
+    """
+    plot_* metotları DataFrame'i küçük bir özete indirger; figür *_figure
+    metotlarıyla bu özetten kurulur ve özet hash'iyle önbelleğe alınır.
+    """
+
+    def __init__(self, figure_cache: Optional[FigureCache] = None):
+        self.figures = figure_cache or shared_figure_cache()
+
+    def _chart(self, name: str, data, build):
+        st.plotly_chart(self.figures.get_or_build(name, data, build), use_container_width=True)
+
     def render_header(self):
         st.markdown("""
             <div style='text-align: center; padding: 25px; background: rgba(0, 0, 0, 0.7); border-radius: 15px; margin-bottom: 30px; box-shadow: 0 8px 16px rgba(0,0,0,0.4); border: 2px solid rgba(255,255,255,0.2);'>
@@ -15,22 +42,32 @@ class DashboardUI:
             </div>
         """, unsafe_allow_html=True)
 
-    def render_metrics(self, df: pd.DataFrame):
+    def render_metrics(self, df: pd.DataFrame, summary: Optional[Dict] = None):
+        """summary verilirse (ör. LiveArticles.summary()) toplamlar çerçeveden yeniden hesaplanmaz"""
         if df.empty:
             return
 
+        if not summary:
+            summary = {
+                'total_articles': len(df),
+                'avg_sentiment': df['sentiment'].mean(),
+                'sources_count': df['source'].nunique(),
+                'sentiment_distribution': {'Positive': int((df['sentiment_label'] == 'Positive').sum())},
+            }
+        total = summary['total_articles']
+
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
             today_count = len(df[df['date'] > datetime.now() - timedelta(days=1)])
             st.metric(
                 label="📰 Toplam Haber",
-                value=len(df),
+                value=total,
                 delta=f"+{today_count} (bugün)" if today_count > 0 else None
             )
 
         with col2:
-            avg_sentiment = df['sentiment'].mean()
+            avg_sentiment = summary['avg_sentiment']
             st.metric(
                 label="😊 Ortalama Duygu",
                 value=f"{avg_sentiment:.3f}",
@@ -38,8 +75,8 @@ class DashboardUI:
             )
 
         with col3:
-            positive_count = (df['sentiment_label'] == 'Positive').sum()
-            positive_pct = positive_count / len(df) * 100 if len(df) > 0 else 0
+            positive_count = summary['sentiment_distribution'].get('Positive', 0)
+            positive_pct = positive_count / total * 100 if total > 0 else 0
             st.metric(
                 label="✅ Pozitif Oran",
                 value=f"{positive_pct:.1f}%",
@@ -47,11 +84,11 @@ class DashboardUI:
             )
 
         with col4:
-            sources_count = df['source'].nunique()
+            sources_count = summary['sources_count']
             st.metric(
                 label="📡 Kaynak Sayısı",
                 value=sources_count,
-                delta=f"{len(df) // max(sources_count, 1)} avg/kaynak"
+                delta=f"{total // max(sources_count, 1)} avg/kaynak"
             )
 
     def plot_sentiment_pie(self, df: pd.DataFrame):
@@ -59,83 +96,91 @@ class DashboardUI:
             st.warning("Veri yok")
             return
 
-        order = ['Positive', 'Neutral', 'Negative']
-        labels_tr = ['Pozitif', 'Nötr', 'Negatif']
-        values = [(df['sentiment_label'] == k).sum() for k in order]
-        colors = ['#2ecc71', '#95a5a6', '#e74c3c']
+        self._chart('sentiment_pie', label_counts(df['sentiment_label'], SENTIMENT_LABELS),
+                    self.pie_figure)
 
+    def pie_figure(self, counts: pd.DataFrame) -> go.Figure:
+        """label_counts çıktısından (label, count) halka grafik"""
         fig = go.Figure(data=[go.Pie(
-            labels=labels_tr,
-            values=values,
+            labels=[LABELS_TR.get(label, label) for label in counts['label']],
+            values=counts['count'],
             hole=0.4,
-            marker_colors=colors
+            marker_colors=[SENTIMENT_COLORS.get(label) for label in counts['label']]
         )])
         fig.update_layout(height=400, title="🎭 Duygu Dağılımı")
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
 
     def plot_source_distribution(self, df: pd.DataFrame):
         if df.empty:
             st.warning("Veri yok")
             return
 
-        source_counts = df['source'].value_counts()
+        self._chart('source_distribution', source_counts(df['source']), self.source_bar_figure)
 
+    def source_bar_figure(self, counts: pd.DataFrame) -> go.Figure:
+        """source_counts çıktısından (source, count) çubuk grafik"""
         fig = px.bar(
-            x=source_counts.index,
-            y=source_counts.values,
+            x=counts['source'],
+            y=counts['count'],
             labels={'x': 'Kaynak', 'y': 'Haber Sayısı'},
-            color=source_counts.values,
+            color=counts['count'],
             color_continuous_scale='Blues'
         )
         fig.update_layout(height=400, showlegend=False, title="📡 Kaynak Bazında Haber Sayısı")
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
 
     def plot_source_sentiment_grouped(self, df: pd.DataFrame):
         if df.empty:
             st.warning("Veri yok")
             return
 
-        label_map = {'Positive': 'Pozitif', 'Neutral': 'Nötr', 'Negative': 'Negatif'}
-        df['sentiment_label_tr'] = df['sentiment_label'].map(label_map)
-        source_sentiment = df.groupby(['source', 'sentiment_label_tr']).size().reset_index(name='count')
+        self._chart('source_sentiment', source_label_counts(df), self.source_sentiment_figure)
 
+    def source_sentiment_figure(self, counts: pd.DataFrame) -> go.Figure:
+        """source_label_counts çıktısından (source, sentiment_label, count) gruplu çubuklar"""
+        counts = counts.assign(sentiment_label_tr=counts['sentiment_label'].astype(str).map(LABELS_TR))
         fig = px.bar(
-            source_sentiment,
+            counts,
             x='source',
             y='count',
             color='sentiment_label_tr',
             barmode='group',
-            color_discrete_map={'Pozitif': '#2ecc71', 'Nötr': '#95a5a6', 'Negatif': '#e74c3c'},
+            color_discrete_map={LABELS_TR[k]: v for k, v in SENTIMENT_COLORS.items()},
             labels={'count': 'Haber Sayısı', 'source': 'Kaynak', 'sentiment_label_tr': 'Duygu'}
         )
         fig.update_layout(height=400, title="📊 Kaynak Bazında Duygu Analizi")
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
 
-    def plot_sentiment_timeline(self, df: pd.DataFrame):
+    def plot_sentiment_timeline(self, df: pd.DataFrame, max_points: int = MAX_TIMELINE_POINTS):
         if df.empty or 'date' not in df.columns:
             st.warning("Veri yok")
             return
 
-        df['day'] = df['date'].dt.date
-        daily_sentiment = df.groupby('day').agg({
-            'sentiment': 'mean',
-            'id': 'count'
-        }).reset_index()
-        daily_sentiment.columns = ['day', 'avg_sentiment', 'count']
+        self._chart('timeline', sentiment_timeline(df, max_points), self.timeline_figure)
+
+    def plot_daily_timeline(self, daily: pd.DataFrame):
+        """Önceden toplanmış (day, avg_sentiment, count) serisinin grafiği"""
+        if daily.empty:
+            st.warning("Veri yok")
+            return
 
+        self._chart('timeline', thin_timeline(daily), self.timeline_figure)
+
+    def timeline_figure(self, daily: pd.DataFrame) -> go.Figure:
+        """sentiment_timeline çıktısından (day, avg_sentiment, count) grafik"""
         fig = go.Figure()
 
         fig.add_trace(go.Scatter(
-            x=daily_sentiment['day'],
-            y=daily_sentiment['avg_sentiment'],
+            x=daily['day'],
+            y=daily['avg_sentiment'],
             name='Ortalama Duygu',
             line=dict(color='#e74c3c', width=3),
             mode='lines+markers'
         ))
 
         fig.add_trace(go.Bar(
-            x=daily_sentiment['day'],
-            y=daily_sentiment['count'],
+            x=daily['day'],
+            y=daily['count'],
             name='Haber Sayısı',
             yaxis='y2',
             opacity=0.3,
@@ -149,47 +194,78 @@ class DashboardUI:
             yaxis2=dict(title='Haber Sayısı', side='right', overlaying='y'),
             hovermode='x unified'
         )
+        return fig
 
-        st.plotly_chart(fig, use_container_width=True)
-
-    def plot_histogram(self, df: pd.DataFrame):
+    def plot_histogram(self, df: pd.DataFrame, bins: int = 30):
         if df.empty:
             st.warning("Veri yok")
             return
 
-        fig = px.histogram(
-            df,
-            x='sentiment',
-            nbins=30,
-            color='sentiment_label',
-            color_discrete_map={'Positive': '#2ecc71', 'Neutral': '#95a5a6', 'Negative': '#e74c3c'},
-            labels={'sentiment': 'Duygu Skoru', 'count': 'Frekans'}
+        labels = df['sentiment_label'] if 'sentiment_label' in df.columns else None
+        self._chart('histogram', histogram_bins(df['sentiment'], labels, bins), self.histogram_figure)
+
+    def histogram_figure(self, binned: pd.DataFrame) -> go.Figure:
+        """histogram_bins çıktısından (label, bin_start, bin_end, count) yığılmış histogram"""
+        fig = go.Figure()
+        for label, part in binned.groupby('label', sort=False):
+            fig.add_trace(go.Bar(
+                x=(part['bin_start'] + part['bin_end']) / 2,
+                y=part['count'],
+                width=part['bin_end'] - part['bin_start'],
+                name=str(label),
+                marker_color=SENTIMENT_COLORS.get(label)
+            ))
+
+        fig.update_layout(
+            height=400,
+            barmode='stack',
+            bargap=0,
+            title="📊 Sentiment Score Dağılımı",
+            xaxis=dict(title='Duygu Skoru'),
+            yaxis=dict(title='Frekans')
         )
-        fig.update_layout(height=400, title="📊 Sentiment Score Dağılımı")
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
 
     def plot_box_plot(self, df: pd.DataFrame):
         if df.empty:
             st.warning("Veri yok")
             return
 
-        fig = px.box(
-            df,
-            x='source',
-            y='sentiment',
-            color='source',
-            labels={'sentiment': 'Duygu Skoru', 'source': 'Kaynak'}
+        self._chart('box', box_summary(df), self.box_figure)
+
+    def box_figure(self, summary: pd.DataFrame) -> go.Figure:
+        """box_summary çıktısından kaynak başına önceden hesaplanmış kutu grafiği"""
+        fig = go.Figure()
+        for row in summary.itertuples(index=False):
+            fig.add_trace(go.Box(
+                x=[row.source],
+                q1=[row.q1],
+                median=[row.median],
+                q3=[row.q3],
+                lowerfence=[row.lowerfence],
+                upperfence=[row.upperfence],
+                name=str(row.source)
+            ))
+
+        fig.update_layout(
+            height=400,
+            showlegend=False,
+            title="📦 Kaynak Bazında Sentiment Dağılımı",
+            xaxis=dict(title='Kaynak'),
+            yaxis=dict(title='Duygu Skoru')
         )
-        fig.update_layout(height=400, showlegend=False, title="📦 Kaynak Bazında Sentiment Dağılımı")
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
 
     def plot_keywords_bar(self, keywords: List[tuple]):
         if not keywords:
             st.warning("Anahtar kelime yok")
             return
 
-        kw_df = pd.DataFrame(keywords[:20], columns=['word', 'count'])
+        self._chart('keywords', pd.DataFrame(keywords[:20], columns=['word', 'count']),
+                    self.keywords_figure)
 
+    def keywords_figure(self, kw_df: pd.DataFrame) -> go.Figure:
+        """(word, count) tablosundan yatay çubuk grafik"""
         fig = px.bar(
             kw_df,
             x='count',
@@ -200,45 +276,84 @@ class DashboardUI:
             labels={'count': 'Frekans', 'word': 'Kelime'}
         )
         fig.update_layout(height=600, showlegend=False, title="🔑 En Popüler Anahtar Kelimeler")
-        st.plotly_chart(fig, use_container_width=True)
-
-    def render_news_list(self, df: pd.DataFrame, sort_by: str = 'En Yeni'):
+        return fig
+
+    @staticmethod
+    def news_list_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Liste tablosuna giden kolonlu dilim; rozet etiketten vektörel eşlenir"""
+        labels = df['sentiment_label'] if 'sentiment_label' in df.columns else \
+            pd.Series('Neutral', index=df.index)
+        return pd.DataFrame({
+            'badge': labels.astype(object).map(SENTIMENT_BADGES).fillna(SENTIMENT_BADGES['Neutral']),
+            'title': df['title'],
+            'source': df['source'],
+            'date': df['date'],
+            'sentiment': df['sentiment'],
+            'sentiment_label': labels,
+            'url': df['url'] if 'url' in df.columns else None,
+        }, columns=NEWS_LIST_COLUMNS)
+
+    def render_news_list(self, df: pd.DataFrame, sort_by: Optional[str] = 'En Yeni', limit: int = 20):
+        """
+        Haberleri tek bir st.dataframe olarak çizer; satır başına widget
+        üretilmediği için eleman sayısı limit'ten bağımsızdır. sort_by=None
+        gelen sırayı korur.
+        """
         if df.empty:
             st.warning("Haber yok")
             return
 
         if sort_by == 'En Yeni':
-            df_display = df.sort_values('date', ascending=False)
+            df = df.nlargest(limit, 'date')
         elif sort_by == 'En Pozitif':
-            df_display = df.sort_values('sentiment', ascending=False)
-        else:
-            df_display = df.sort_values('sentiment', ascending=True)
-
-        for idx, row in df_display.head(20).iterrows():
-            if row['sentiment'] > 0.1:
-                color, emoji = '🟢', '😊'
-            elif row['sentiment'] < -0.1:
-                color, emoji = '🔴', '😢'
-            else:
-                color, emoji = '🟡', '😐'
-
-            with st.container():
-                col1, col2, col3 = st.columns([0.5, 8, 1.5])
-
-                with col1:
-                    st.markdown(f"### {color}")
-
-                with col2:
-                    st.markdown(f"**{row['title']}**")
-                    date_str = row['date'].strftime('%Y-%m-%d %H:%M') if pd.notna(row['date']) else 'Tarih yok'
-                    st.caption(f"📡 {row['source']} | 📅 {date_str}")
-                    if row['url']:
-                        st.markdown(f"[🔗 Haberi Oku]({row['url']})")
-
-                with col3:
-                    st.metric("Duygu", f"{row['sentiment']:.2f}", emoji)
+            df = df.nlargest(limit, 'sentiment')
+        elif sort_by is not None:
+            df = df.nsmallest(limit, 'sentiment')
+        frame = self.news_list_frame(df.head(limit))
+
+        st.dataframe(
+            frame,
+            hide_index=True,
+            height=min(NEWS_LIST_ROW_PX * (len(frame) + 1) + 3, NEWS_LIST_MAX_PX),
+            column_config={
+                'badge': st.column_config.TextColumn("", width="small"),
+                'title': st.column_config.TextColumn("Başlık", width="large"),
+                'source': st.column_config.TextColumn("📡 Kaynak"),
+                'date': st.column_config.DatetimeColumn("📅 Tarih", format="YYYY-MM-DD HH:mm"),
+                'sentiment': st.column_config.ProgressColumn(
+                    "Duygu", min_value=-1.0, max_value=1.0, format="%.3f"
+                ),
+                'sentiment_label': st.column_config.TextColumn("Etiket"),
+                'url': st.column_config.LinkColumn("🔗", display_text="Haberi Oku"),
+            },
+        )
 
-                st.markdown("---")
+    def render_scrape_progress(self, job: Dict):
+        """ScrapeJob.snapshot() çıktısı: kaynak bazlı ilerleme ve toplamlar"""
+        sources = job['sources']
+        finished = sum(info['state'] in ('done', 'failed') for info in sources.values())
+        icons = {'pending': '⏳', 'running': '🔄', 'done': '✅', 'failed': '❌'}
+
+        if job['state'] in ('running', 'saving'):
+            label = "Kaydediliyor..." if job['state'] == 'saving' else "Haberler çekiliyor..."
+            st.progress(finished / max(len(sources), 1), text=f"{label} ({job['elapsed_sec']} sn)")
+
+        for name, info in sources.items():
+            detail = f" · {info['count']} haber" if info['state'] == 'done' else ""
+            error = f" · {info['error']}" if info.get('error') else ""
+            st.caption(f"{icons.get(info['state'], '⏳')} {name}{detail}{error}")
+
+        totals = job['totals']
+        if job['state'] == 'done':
+            st.success(f"""
+            ✅ **Tamamlandı!** ({job['elapsed_sec']} sn)
+            - 🔍 Çekilen: {totals['scraped']} haber
+            - ✅ YENİ: {totals['saved']} haber
+            - 🔄 Duplicate: {totals['duplicate']} haber
+            - ❌ Başarısız: {totals['failed']}
+            """)
+        elif job['state'] == 'failed':
+            st.error(f"❌ Scrape başarısız: {job['error']}")
 
     def render_footer(self):
         st.markdown("---")
@@ -249,49 +364,37 @@ class DashboardUI:
         </div>
         """, unsafe_allow_html=True)
 
-    def render_sidebar_filters(self, df: pd.DataFrame) -> Dict:
+    def render_sidebar_filters(self, options: Dict) -> ArticleFilter:
+        """options: dbGetFilterOptions çıktısı; seçimler SQL'e gönderilecek filtreye çevrilir"""
         st.sidebar.markdown("### 🎛️ Filtreler")
 
-        filters = {}
+        if not options.get('sources'):
+            return ArticleFilter()
 
-        if not df.empty:
-            sources = ['Tümü'] + sorted(df['source'].unique().tolist())
-            filters['source'] = st.sidebar.selectbox("📡 Kaynak", sources)
+        source = st.sidebar.selectbox("📡 Kaynak", ['Tümü'] + options['sources'])
 
-            if 'date' in df.columns:
-                min_date = df['date'].min().date()
-                max_date = df['date'].max().date()
-
-                if min_date != max_date:
-                    filters['date_range'] = st.sidebar.date_input(
-                        "📅 Tarih Aralığı",
-                        value=(min_date, max_date),
-                        min_value=min_date,
-                        max_value=max_date
-                    )
-
-            filters['sentiment'] = st.sidebar.multiselect(
-                "😊 Duygu",
-                ['Positive', 'Neutral', 'Negative'],
-                default=['Positive', 'Neutral', 'Negative']
+        date_from = date_to = None
+        min_date, max_date = options.get('min_date'), options.get('max_date')
+        if min_date and max_date and min_date != max_date:
+            date_range = st.sidebar.date_input(
+                "📅 Tarih Aralığı",
+                value=(min_date, max_date),
+                min_value=min_date,
+                max_value=max_date
             )
+            if len(date_range) == 2:
+                date_from, date_to = date_range
 
-        return filters
-
-    def apply_filters(self, df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
-        if df.empty:
-            return df
-
-        if filters.get('source') and filters['source'] != 'Tümü':
-            df = df[df['source'] == filters['source']]
-
-        if 'date_range' in filters and len(filters['date_range']) == 2:
-            df = df[
-                (df['date'].dt.date >= filters['date_range'][0]) &
-                (df['date'].dt.date <= filters['date_range'][1])
-            ]
-
-        if filters.get('sentiment'):
-            df = df[df['sentiment_label'].isin(filters['sentiment'])]
+        labels = st.sidebar.multiselect(
+            "😊 Duygu",
+            SENTIMENT_LABELS,
+            default=SENTIMENT_LABELS
+        )
 
-        return df
\ No newline at end of file
+        return ArticleFilter(
+            sources=() if source == 'Tümü' else (source,),
+            # Tüm aralık seçiliyse tarih koşulu eklenmez
+            date_from=date_from if date_from != min_date else None,
+            date_to=date_to if date_to != max_date else None,
+            labels=tuple(labels)
+        )
@@ -0,0 +1,255 @@
+import os
+import time
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analyzer.analytics import AnalyticsEngine
+from analyzer.result_cache import shared_analysis_cache
+from analyzer.sentiment import NewsAnalyzer
+from dashboard.components import DashboardUI
+from dashboard.live import LiveArticles
+from database.filters import ArticleFilter
+from database.repository import DB_PATH_ENV, DEFAULT_DB_PATH, DatabaseManager
+
+# Eski nesillere ait sonuçlar bu kadar kayıt/süre sonra düşer
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 64
+
+# Canlı pencere sayısı (limit/kolon/filtre kombinasyonu başına bir tane)
+LIVE_MAX_ENTRIES = 16
+# Otomatik yenileme seçenekleri (saniye); her tikte yalnızca yazma nesli okunur
+AUTO_REFRESH_INTERVALS = (5, 15, 30, 60)
+
+# Tüm geçmiş (arşiv dahil) agregasyonlarının motoru: auto | duckdb | pandas | off
+ANALYTICS_ENGINE_ENV = "NEWS_ANALYTICS_ENGINE"
+DEFAULT_ANALYTICS_ENGINE = "auto"
+
+
+def db_path() -> str:
+    return os.environ.get(DB_PATH_ENV, DEFAULT_DB_PATH)
+
+
+def analytics_engine() -> str:
+    return os.environ.get(ANALYTICS_ENGINE_ENV, DEFAULT_ANALYTICS_ENGINE)
+
+
+# ---------------- RESOURCES ----------------
+
+@st.cache_resource(show_spinner=False)
+def _database(path: str) -> DatabaseManager:
+    return DatabaseManager(path)
+
+
+def get_db() -> DatabaseManager:
+    """Süreç genelinde paylaşılan DatabaseManager"""
+    return _database(db_path())
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer() -> NewsAnalyzer:
+    return NewsAnalyzer(cache=shared_analysis_cache())
+
+
+@st.cache_resource(show_spinner=False)
+def get_ui() -> DashboardUI:
+    return DashboardUI()
+
+
+@st.cache_resource(show_spinner=False)
+def _analytics(path: str, engine: str) -> AnalyticsEngine:
+    # ArticleArchive'ın varsayılan dizini: veritabanının yanındaki archive/
+    archive_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "archive")
+    return AnalyticsEngine(path, archive_dir=archive_dir, engine=engine)
+
+
+def get_analytics() -> Optional[AnalyticsEngine]:
+    """Seçilen motorla AnalyticsEngine; NEWS_ANALYTICS_ENGINE=off ise None"""
+    engine = analytics_engine()
+    return None if engine == "off" else _analytics(db_path(), engine)
+
+
+@st.cache_resource(show_spinner=False)
+def get_scraper():
+    from scraper.manager import NewsScraper
+    return NewsScraper(max_workers=4)
+
+
+@st.cache_resource(show_spinner=False)
+def _job_manager(path: str):
+    from scraper.jobs import ScrapeJobManager
+    return ScrapeJobManager(get_scraper(), _database(path))
+
+
+def get_job_manager():
+    """Tüm oturumların paylaştığı arka plan scrape işi yöneticisi"""
+    return _job_manager(db_path())
+
+
+# ---------------- LOADERS ----------------
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _query(path: str, generation: int, method: str, args: tuple, kwargs: tuple):
+    """
+    DatabaseManager okuma metodunu çağırır. generation anahtarın parçası
+    olduğu için yazma nesli değişmedikçe aynı çağrı SQLite'a gitmez.
+    """
+    return getattr(_database(path), method)(*args, **dict(kwargs))
+
+
+def _load(method: str, *args, **kwargs):
+    db = get_db()
+    return _query(db_path(), db.dbWriteGeneration(), method, args, tuple(sorted(kwargs.items())))
+
+
+@st.cache_resource(max_entries=LIVE_MAX_ENTRIES, show_spinner=False)
+def _live_articles(
+    path: str, limit: int, columns: Optional[tuple], filters: Optional[ArticleFilter]
+) -> LiveArticles:
+    return LiveArticles(_database(path), limit=limit, columns=columns, filters=filters,
+                        analyzer=get_analyzer())
+
+
+def live_articles(
+    limit: int = 1000,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[ArticleFilter] = None
+) -> LiveArticles:
+    """Oturumların paylaştığı, yalnızca yeni satırları ekleyerek güncellenen pencere"""
+    if filters is not None and filters.isEmpty():
+        filters = None
+    return _live_articles(db_path(), limit, tuple(columns) if columns else None, filters)
+
+
+def load_articles(
+    limit: int = 1000,
+    columns: Optional[Sequence[str]] = None,
+    labeled: bool = True,
+    filters: Optional[ArticleFilter] = None
+) -> pd.DataFrame:
+    """
+    Son haberler; labeled=True ise sentiment_label kolonu eklenmiş olarak.
+    Etiketli pencere canlı tutulur: yeni haberlerde yalnızca delta okunur.
+    """
+    columns = tuple(columns) if columns else None
+    if not labeled:
+        return _load("dbGetAllArticles", columns=columns, filters=filters, limit=limit)
+    return live_articles(limit, columns, filters).refresh()
+
+
+def load_filter_options() -> Dict:
+    return _load("dbGetFilterOptions")
+
+
+def load_statistics() -> Dict:
+    return _load("dbGetStatistics")
+
+
+def load_trending_terms(
+    window_days: Optional[int] = None, source: Optional[str] = None, top_n: int = 20
+) -> List:
+    return _load("dbGetTrendingTerms", window_days=window_days, source=source, top_n=top_n)
+
+
+def load_live_sentiment() -> Dict:
+    return _load("dbGetLiveSentiment")
+
+
+def load_alerts(limit: int = 20) -> List[Dict]:
+    return _load("dbGetAlerts", limit=limit)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _history(path: str, engine: str, generation: int, method: str, args: tuple) -> pd.DataFrame:
+    # Arşivleme de articles'tan sildiği için yazma nesli soğuk veriyi de kapsar
+    return getattr(_analytics(path, engine), method)(*args)
+
+
+def load_history(method: str, *args) -> Optional[pd.DataFrame]:
+    """
+    Sıcak + arşiv verisinin tamamı üzerinde AnalyticsEngine agregasyonu
+    (sentiment_by_source, timeline, histogram, quantiles). Motor kapalıysa None.
+    """
+    engine = analytics_engine()
+    if engine == "off":
+        return None
+    return _history(db_path(), engine, get_db().dbWriteGeneration(), method, args)
+
+
+def clear_data_cache():
+    _query.clear()
+    _live_articles.clear()
+    _history.clear()
+
+
+# ---------------- AUTO REFRESH ----------------
+
+def render_auto_refresh():
+    """
+    Sidebar'da otomatik yenileme seçeneği. Açıksa fragment her aralıkta
+    yalnızca yazma neslini (PRAGMA data_version) okur; sayfa ancak veri
+    değiştiğinde yeniden çalışır ve canlı pencere delta ile güncellenir.
+    """
+    enabled = st.sidebar.toggle("⏱️ Otomatik yenile", key="auto_refresh")
+    interval = None
+    if enabled:
+        interval = st.sidebar.select_slider(
+            "Aralık (sn)", options=AUTO_REFRESH_INTERVALS, value=AUTO_REFRESH_INTERVALS[1],
+            key="auto_refresh_interval"
+        )
+
+    @st.fragment(run_every=interval)
+    def poll():
+        generation = get_db().dbWriteGeneration()
+        seen = st.session_state.get("_seen_generation")
+        st.session_state["_seen_generation"] = generation
+        # Tam çalıştırmada fragment de çalışıp nesli kaydeder; bu yüzden
+        # yalnızca iki tik arasında gelen yazma sayfayı yeniden çalıştırır
+        if seen is not None and seen != generation:
+            st.rerun()
+
+    with st.sidebar:
+        poll()
+
+
+# ---------------- RERUN TIMING ----------------
+
+_rerun_times: Dict[str, deque] = {}
+_rerun_lock = threading.Lock()
+
+
+def start_rerun(page: str):
+    """Sayfa betiğinin başında çağrılır; süre finish_rerun ile kaydedilir"""
+    st.session_state["_rerun_started"] = (page, time.perf_counter())
+
+
+def finish_rerun():
+    started = st.session_state.pop("_rerun_started", None)
+    if started is None:
+        return
+    page, start = started
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    with _rerun_lock:
+        _rerun_times.setdefault(page, deque(maxlen=200)).append(elapsed_ms)
+
+
+def rerun_stats() -> pd.DataFrame:
+    """Sayfa başına son rerun sürelerinin özeti (ms)"""
+    with _rerun_lock:
+        times = {page: list(values) for page, values in _rerun_times.items()}
+
+    rows = [
+        {
+            "page": page,
+            "reruns": len(values),
+            "last_ms": round(values[-1], 1),
+            "p50_ms": round(float(np.percentile(values, 50)), 1),
+            "p95_ms": round(float(np.percentile(values, 95)), 1),
+        }
+        for page, values in sorted(times.items()) if values
+    ]
+    return pd.DataFrame(rows, columns=["page", "reruns", "last_ms", "p50_ms", "p95_ms"])
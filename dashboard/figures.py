@@ -0,0 +1,68 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from database.cache import LRUCache
+
+FIGURE_CACHE_ENTRIES = 128
+FIGURE_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def aggregate_hash(data: Any) -> str:
+    """
+    Grafiğe giden küçük özetin içerik hash'i. DataFrame/Series için değerler
+    ve kolon adları, diğer tipler için JSON gösterimi hash'lenir.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        columns = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+        digest.update(repr(columns).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    else:
+        digest.update(json.dumps(data, default=str, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """
+    Plotly figürlerinin serileştirilmiş (JSON) halleri için LRU önbellek.
+
+    Anahtar (grafik adı, özet hash'i) ikilisidir; aynı özeti gören rerun'lar
+    ve oturumlar figürü yeniden kurmaz. Değerler değişmez metin olduğu için
+    paylaşım sırasında kopyalanmaz.
+    """
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_ENTRIES, max_bytes: Optional[int] = FIGURE_CACHE_BYTES):
+        self.lru = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    def get_or_build(self, name: str, data: Any, build: Callable[[Any], go.Figure]) -> Dict:
+        """Figür sözlüğü; st.plotly_chart'a doğrudan verilebilir"""
+        key = (name, aggregate_hash(data))
+        spec = self.lru.get(key)
+        if spec is None:
+            spec = build(data).to_json()
+            self.lru.put(key, spec, size=len(spec))
+        return json.loads(spec)
+
+    def clear(self):
+        self.lru.clear()
+
+    def stats(self) -> Dict:
+        return self.lru.stats()
+
+
+_shared_cache: Optional[FigureCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_figure_cache(**options) -> FigureCache:
+    """Süreçteki tüm sayfa ve oturumların paylaştığı figür önbelleği"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = FigureCache(**options)
+        return _shared_cache
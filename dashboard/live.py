@@ -0,0 +1,193 @@
+import logging
+import threading
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from analyzer.labels import SENTIMENT_LABELS
+from database.filters import ArticleFilter
+
+logger = logging.getLogger(__name__)
+
+# Delta birleştirmesi için her pencerede bulunması gereken kolonlar
+REQUIRED_COLUMNS = ("id", "date")
+
+
+class WindowAggregates:
+    """
+    Penceredeki haberlerin toplamları. Pencereye giren satırlar add(),
+    pencereden düşenler remove() ile işlenir; tüm çerçeve yeniden taranmaz.
+    """
+
+    def __init__(self):
+        self.total = 0
+        # Ortalama yalnızca skoru olan satırlar üzerinden (pandas mean() gibi)
+        self.scored = 0
+        self.sentiment_sum = 0.0
+        self.labels: Dict[str, int] = {label: 0 for label in SENTIMENT_LABELS}
+        self.sources: Dict[str, int] = {}
+
+    def add(self, df: pd.DataFrame, sign: int = 1):
+        if df.empty:
+            return
+
+        self.total += sign * len(df)
+        if "sentiment" in df.columns:
+            scores = df["sentiment"].to_numpy(dtype="float64", na_value=np.nan)
+            self.scored += sign * int(np.count_nonzero(~np.isnan(scores)))
+            self.sentiment_sum += sign * float(np.nansum(scores))
+        if "sentiment_label" in df.columns:
+            for label, count in df["sentiment_label"].value_counts().items():
+                self.labels[str(label)] = self.labels.get(str(label), 0) + sign * int(count)
+        if "source" in df.columns:
+            for source, count in df["source"].value_counts().items():
+                if count:
+                    self.sources[str(source)] = self.sources.get(str(source), 0) + sign * int(count)
+            self.sources = {k: v for k, v in self.sources.items() if v > 0}
+
+    def remove(self, df: pd.DataFrame):
+        self.add(df, sign=-1)
+
+    def summary(self) -> Dict:
+        """NewsAnalyzer.get_summary_statistics ile aynı biçim"""
+        if self.total == 0:
+            return {}
+        return {
+            "total_articles": self.total,
+            "avg_sentiment": round(self.sentiment_sum / self.scored, 3) if self.scored else float("nan"),
+            "sources_count": len(self.sources),
+            "sentiment_distribution": dict(self.labels),
+        }
+
+
+class LiveArticles:
+    """
+    Son `limit` haberin (tarihe göre) güncel tutulan penceresi.
+
+    refresh() önce yazma neslini kontrol eder; değişiklik yoksa veritabanına
+    gidilmez. Yalnızca insert olduysa dbGetArticlesSince ile yeni satırlar
+    okunup pencereye eklenir, taşan en eski satırlar düşer. Güncelleme/silme
+    (değişiklik sayacı) veya pencereden büyük delta tam yüklemeye döner.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        limit: int = 1000,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ArticleFilter] = None,
+        analyzer=None
+    ):
+        self.db = db_manager
+        self.limit = limit
+        self.columns = None
+        if columns:
+            self.columns = tuple(columns) + tuple(c for c in REQUIRED_COLUMNS if c not in columns)
+        self.filters = filters
+        self.analyzer = analyzer
+
+        self.frame = pd.DataFrame()
+        self.aggregates = WindowAggregates()
+        self.last_id = 0
+        self.generation: Optional[int] = None
+        self.mutations: Optional[int] = None
+        self.stats = {"full_loads": 0, "delta_loads": 0, "delta_rows": 0, "skipped": 0}
+        self._lock = threading.Lock()
+
+    # ---------------- REFRESH ----------------
+
+    def refresh(self) -> pd.DataFrame:
+        """Pencereyi günceller ve kopyasını döndürür"""
+        with self._lock:
+            generation = self.db.dbWriteGeneration()
+            if generation == self.generation:
+                self.stats["skipped"] += 1
+                return self.frame.copy()
+
+            # Durum sorgudan önce okunur: max_id'ye kadar olan satırlar
+            # ardından gelen sorguda mutlaka görülür
+            state = self.db.dbGetDeltaState()
+            if self.mutations is None or state["mutations"] != self.mutations \
+                    or state["max_id"] < self.last_id:
+                self._fullLoad()
+            elif state["max_id"] > self.last_id:
+                self._deltaLoad()
+            else:
+                self.stats["skipped"] += 1
+
+            self.last_id = max(self.last_id, state["max_id"])
+            self.generation = generation
+            self.mutations = state["mutations"]
+            return self.frame.copy()
+
+    def _fullLoad(self):
+        df = self.db.dbGetAllArticles(limit=self.limit, columns=self.columns, filters=self.filters)
+        self.frame = self._label(df).reset_index(drop=True)
+        self.aggregates = WindowAggregates()
+        self.aggregates.add(self.frame)
+        self.last_id = 0
+        self.stats["full_loads"] += 1
+
+    def _deltaLoad(self):
+        # Pencereden fazla yeni satır varsa tam yükleme daha ucuzdur
+        new = self.db.dbGetArticlesSince(
+            self.last_id, columns=self.columns, filters=self.filters, limit=self.limit + 1
+        )
+        if len(new) > self.limit:
+            self._fullLoad()
+            return
+
+        # Tam yükleme ile durum okuması arasında eklenmiş satırlar zaten penceredeydi
+        if not self.frame.empty:
+            new = new[~new["id"].isin(self.frame["id"])]
+        if new.empty:
+            return
+
+        new = self._label(new)
+        merged = _concatFrames(new, self.frame)
+        merged = merged.iloc[_stableDescending(merged)].reset_index(drop=True)
+        kept, dropped = merged.iloc[:self.limit], merged.iloc[self.limit:]
+
+        # Yalnızca pencereye giren yeni satırlar eklenir, düşen eski satırlar çıkarılır
+        self.aggregates.add(new[new["id"].isin(kept["id"])])
+        self.aggregates.remove(dropped[~dropped["id"].isin(new["id"])])
+
+        self.frame = kept
+        self.stats["delta_loads"] += 1
+        self.stats["delta_rows"] += len(new)
+
+    def _label(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df.empty or self.analyzer is None:
+            return df
+        return self.analyzer.analyze_batch(df)
+
+    def summary(self) -> Dict:
+        return self.aggregates.summary()
+
+
+def _stableDescending(df: pd.DataFrame) -> np.ndarray:
+    """dbGetAllArticles'taki ORDER BY date DESC; eşit tarihlerde yeni id önce"""
+    if df.empty:
+        return np.arange(0)
+    keys = pd.DataFrame({"date": df["date"], "id": df["id"]})
+    return keys.sort_values(["date", "id"], ascending=False, na_position="last").index.to_numpy()
+
+
+def _concatFrames(first: pd.DataFrame, second: pd.DataFrame) -> pd.DataFrame:
+    """Categorical kolonların kategorileri birleştirilerek alt alta ekler"""
+    if second.empty:
+        return first.copy()
+    if first.empty:
+        return second.copy()
+
+    first, second = first.copy(), second.copy()
+    for column in first.columns.intersection(second.columns):
+        a, b = first[column], second[column]
+        if isinstance(a.dtype, pd.CategoricalDtype) and isinstance(b.dtype, pd.CategoricalDtype) \
+                and not a.cat.categories.equals(b.cat.categories):
+            merged = union_categoricals([a, b], ignore_order=True).categories
+            first[column] = a.cat.set_categories(merged)
+            second[column] = b.cat.set_categories(merged)
+    return pd.concat([first, second], ignore_index=True)
@@ -0,0 +1,128 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+from analyzer.analytics import AnalyticsEngine
+from dashboard.data import ANALYTICS_ENGINE_ENV, DB_PATH_ENV, clear_data_cache, load_history, rerun_stats
+from database.repository import DatabaseManager
+
+PAGES = [
+    'MainPage.py',
+    'pages/1_Genel_Bakış.py',
+    'pages/2_Trend_Analizi.py',
+    'pages/3_Anahtar_Kelimeler.py',
+    'pages/4_Haberler.py',
+]
+# Canlı pencereler delta durumunu önbellekli okur; SQL'e giden yükleyiciler sayılır
+READ_METHODS = ['dbGetAllArticles', '_loadArticlesSince', '_loadDeltaState', 'dbGetStatistics', 'dbGetTrendingTerms', 'dbGetLiveSentiment', 'dbGetAlerts']
+
+
+class TestDashboardData(unittest.TestCase):
+    """Sayfaların paylaşılan veri katmanı üzerinden DB'ye gitme sayısı"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        start = datetime.now() - timedelta(hours=40)
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Market report number {i} shows growth', 'url': f'u{i}',
+             'source': ['BBC', 'CNN'][i % 2], 'sentiment': round((i % 7 - 3) / 5, 3),
+             'date': start + timedelta(hours=i)}
+            for i in range(40)
+        ])
+
+        self.calls = Counter()
+        self.env = patch.dict(os.environ, {DB_PATH_ENV: self.db_path})
+        self.env.start()
+        self.spies = []
+        for name in READ_METHODS:
+            spy = patch.object(DatabaseManager, name, autospec=True, side_effect=self._record(name))
+            spy.start()
+            self.spies.append(spy)
+        clear_data_cache()
+
+    def tearDown(self):
+        for spy in self.spies:
+            spy.stop()
+        self.env.stop()
+        clear_data_cache()
+        shutil.rmtree(self.tmp_dir)
+
+    def _record(self, name):
+        original = getattr(DatabaseManager, name)
+
+        def call(db, *args, **kwargs):
+            self.calls[(name, args, tuple(sorted(kwargs.items())))] += 1
+            return original(db, *args, **kwargs)
+        return call
+
+    def _runPages(self, reruns: int = 2):
+        for page in PAGES:
+            at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=60).run()
+            for _ in range(reruns):
+                at.run()
+            self.assertFalse(at.exception, f"{page}: {[e.value for e in at.exception]}")
+
+    def test_at_most_one_db_call_per_data_version(self):
+        self._runPages()
+        self.assertTrue(self.calls)
+        self.assertEqual(max(self.calls.values()), 1, self.calls)
+
+        # Sayfa değiştirmek ve yeniden çalıştırmak yeni sorgu üretmez
+        before = sum(self.calls.values())
+        self._runPages(reruns=1)
+        self.assertEqual(sum(self.calls.values()), before)
+
+        # Yazma nesli değişince her sorgu bir kez daha çalışır
+        self.db.dbInsertArticle({'title': 'Fresh headline arrives', 'url': 'new', 'source': 'BBC',
+                                 'sentiment': 0.4, 'date': datetime.now()})
+        self.calls.clear()
+        self._runPages()
+        self.assertTrue(self.calls)
+        self.assertEqual(max(self.calls.values()), 1, self.calls)
+
+        # Etiketli 1000'lik pencereler tam yüklenmez, yalnızca yeni satır okunur
+        methods = Counter(name for name, _, kwargs in self.calls.elements()
+                          if dict(kwargs).get('limit') != 20000)
+        self.assertEqual(methods['dbGetAllArticles'], 0, self.calls)
+        self.assertGreater(methods['_loadArticlesSince'], 0)
+
+    def test_rerun_latency_is_recorded(self):
+        self._runPages(reruns=1)
+        stats = rerun_stats().set_index('page')
+        self.assertIn('4_Haberler', stats.index)
+        self.assertGreaterEqual(stats.loc['4_Haberler', 'reruns'], 2)
+        self.assertGreater(stats.loc['MainPage', 'p50_ms'], 0)
+
+    def test_history_uses_analytics_engine(self):
+        with patch.object(AnalyticsEngine, 'sentiment_by_source', autospec=True,
+                          side_effect=AnalyticsEngine.sentiment_by_source) as spy:
+            with patch.dict(os.environ, {ANALYTICS_ENGINE_ENV: 'pandas'}):
+                first = load_history('sentiment_by_source')
+                load_history('sentiment_by_source')
+                self.assertEqual(spy.call_count, 1)
+                self.assertEqual(first['count'].sum(), 40)
+
+                # Yeni yazma nesli tüm geçmişi yeniden toplar
+                self.db.dbInsertArticle({'title': 'Fresh headline arrives', 'url': 'new', 'source': 'NPR',
+                                         'sentiment': 0.4, 'date': datetime.now()})
+                self.assertEqual(load_history('sentiment_by_source')['count'].sum(), 41)
+                self.assertEqual(spy.call_count, 2)
+
+            with patch.dict(os.environ, {ANALYTICS_ENGINE_ENV: 'off'}):
+                self.assertIsNone(load_history('sentiment_by_source'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
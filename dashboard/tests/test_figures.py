@@ -0,0 +1,103 @@
+import os
+import sys
+import json
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pandas as pd
+
+from analyzer.benchmarks import synthetic_titles
+from analyzer.binning import label_counts, source_counts, source_label_counts
+from analyzer.labels import SENTIMENT_LABELS
+from analyzer.sentiment import NewsAnalyzer
+from dashboard.benchmarks import bench_chart_payload, bench_figure_cache
+from dashboard.components import DashboardUI
+from dashboard.figures import FigureCache, aggregate_hash
+
+
+class TestFigureCache(unittest.TestCase):
+    """Figürlerin özet hash'iyle önbelleğe alınması"""
+
+    def setUp(self):
+        self.df = NewsAnalyzer().analyze_batch(synthetic_titles(300))
+        self.cache = FigureCache(max_entries=4)
+        self.ui = DashboardUI(figure_cache=self.cache)
+
+    def test_aggregates(self):
+        counts = label_counts(self.df['sentiment_label'], SENTIMENT_LABELS)
+        self.assertEqual(list(counts['label']), SENTIMENT_LABELS)
+        self.assertEqual(counts['count'].sum(), len(self.df))
+
+        by_source = source_counts(self.df['source'])
+        self.assertTrue(by_source['count'].is_monotonic_decreasing)
+        self.assertEqual(source_label_counts(self.df)['count'].sum(), len(self.df))
+
+    def test_hash_follows_aggregate_not_rows(self):
+        shuffled = self.df.sample(frac=1, random_state=3)
+        self.assertEqual(aggregate_hash(source_counts(self.df['source'])),
+                         aggregate_hash(source_counts(shuffled['source'])))
+
+        changed = self.df.assign(source=self.df['source'].replace({'CNN': 'NPR'}))
+        self.assertNotEqual(aggregate_hash(source_counts(self.df['source'])),
+                            aggregate_hash(source_counts(changed['source'])))
+        self.assertNotEqual(aggregate_hash(pd.DataFrame({'a': [1]})),
+                            aggregate_hash(pd.DataFrame({'b': [1]})))
+        self.assertEqual(aggregate_hash([('war', 3)]), aggregate_hash([('war', 3)]))
+
+    def test_cached_spec_matches_fresh_figure(self):
+        counts = source_label_counts(self.df)
+        built = []
+
+        def build(data):
+            built.append(data)
+            return self.ui.source_sentiment_figure(data)
+
+        first = self.cache.get_or_build('source_sentiment', counts, build)
+        second = self.cache.get_or_build('source_sentiment', counts.copy(), build)
+
+        self.assertEqual(len(built), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first, json.loads(self.ui.source_sentiment_figure(counts).to_json()))
+        self.assertEqual([trace['type'] for trace in first['data']], ['bar'] * 3)
+
+        # Çağıranın değiştirmesi önbelleği bozmaz
+        first['layout']['height'] = 1
+        self.assertEqual(self.cache.get_or_build('source_sentiment', counts, build)['layout']['height'], 400)
+
+    def test_lru_bounds(self):
+        for n in range(6):
+            self.cache.get_or_build('keywords', pd.DataFrame({'word': ['w'], 'count': [n]}),
+                                    self.ui.keywords_figure)
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 4)
+        self.assertEqual(stats['evictions'], 2)
+
+    def test_plot_methods_reuse_figures_across_reruns(self):
+        with patch('streamlit.plotly_chart') as chart:
+            for _ in range(3):
+                self.ui.plot_sentiment_pie(self.df)
+                self.ui.plot_source_distribution(self.df)
+                self.ui.plot_source_sentiment_grouped(self.df)
+                self.ui.plot_keywords_bar([('market', 5), ('storm', 2)])
+
+        self.assertEqual(chart.call_count, 12)
+        self.assertIsInstance(chart.call_args[0][0], dict)
+        stats = self.cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (4, 8))
+
+    def test_benchmark_reports_hits(self):
+        rebuild, cached = bench_figure_cache(n_rows=200, reruns=3)
+        self.assertEqual(rebuild['hit_rate'], 0.0)
+        self.assertGreater(cached['hit_rate'], 0.5)
+
+    def test_payload_is_bounded_at_one_million_rows(self):
+        small, large = bench_chart_payload(sizes=(1_000, 1_000_000), raw_limit=0)
+        for name, size in large['payload_bytes'].items():
+            self.assertLess(size, 64 * 1024, name)
+            self.assertLess(size, small['payload_bytes'][name] * 1.5, name)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,133 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.sentiment import NewsAnalyzer
+from dashboard.live import LiveArticles
+from database.filters import ArticleFilter
+from database.repository import DatabaseManager
+
+
+class TestLiveArticles(unittest.TestCase):
+    """Delta ile güncellenen pencerenin tam yüklemeyle aynı kalması"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        self.analyzer = NewsAnalyzer()
+        self.start = datetime(2026, 3, 1, 8)
+        self.next = 0
+        self._insert(60)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _insert(self, n, source=None, hours_back=0):
+        rows = []
+        for _ in range(n):
+            i = self.next
+            self.next += 1
+            rows.append({
+                'title': f'Headline {i}', 'url': f'u{i}',
+                'source': source or ['BBC', 'CNN', 'NPR'][i % 3],
+                'sentiment': [-0.4, 0.0, 0.3, 0.05][i % 4],
+                'date': self.start + timedelta(hours=i - hours_back)
+            })
+        self.db.dbInsertArticlesBulk(rows)
+
+    def _assertMatchesFullLoad(self, live):
+        frame = live.refresh()
+        expected = self.analyzer.analyze_batch(
+            self.db.dbGetAllArticles(limit=live.limit, columns=live.columns, filters=live.filters)
+        )
+        self.assertEqual(list(frame['id']), list(expected['id']))
+
+        summary = self.analyzer.get_summary_statistics(expected)
+        self.assertEqual(live.summary(), summary)
+
+    def test_inserts_are_appended_as_delta(self):
+        live = LiveArticles(self.db, limit=50, analyzer=self.analyzer)
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(live.stats['full_loads'], 1)
+
+        # Yeni kaynak categorical kategorilerine eklenir; en eski satırlar pencereden düşer
+        self._insert(7, source='Al Jazeera')
+        with patch.object(self.db, 'dbGetAllArticles', wraps=self.db.dbGetAllArticles) as full:
+            frame = live.refresh()
+            full.assert_not_called()
+        self.assertEqual(len(frame), 50)
+        self.assertIn('Al Jazeera', set(frame['source']))
+        self.assertEqual(live.stats, {'full_loads': 1, 'delta_loads': 1, 'delta_rows': 7, 'skipped': 0})
+        self._assertMatchesFullLoad(live)
+
+    def test_average_ignores_missing_scores(self):
+        """Skoru olmayan satırlar ortalamanın paydasına girmemeli (pandas mean() gibi)"""
+        live = LiveArticles(self.db, limit=120, analyzer=self.analyzer)
+        live.refresh()
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Unscored {i}', 'url': f'x{i}', 'source': 'BBC', 'sentiment': None,
+             'date': self.start + timedelta(days=5, hours=i)}
+            for i in range(40)
+        ])
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(live.stats['delta_loads'], 1)
+
+    def test_unchanged_generation_skips_database(self):
+        live = LiveArticles(self.db, limit=20, analyzer=self.analyzer)
+        live.refresh()
+        with patch.object(self.db, 'dbGetDeltaState') as state:
+            live.refresh()
+            state.assert_not_called()
+        self.assertEqual(live.stats['skipped'], 1)
+
+    def test_backdated_rows_stay_out_of_window(self):
+        live = LiveArticles(self.db, limit=30, columns=['source', 'sentiment', 'sentiment_label'],
+                            analyzer=self.analyzer)
+        live.refresh()
+        self.assertEqual(live.columns, ('source', 'sentiment', 'sentiment_label', 'id', 'date'))
+
+        self._insert(5, hours_back=500)
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(live.stats['delta_loads'], 1)
+
+    def test_updates_and_deletes_force_full_reload(self):
+        live = LiveArticles(self.db, limit=40, analyzer=self.analyzer)
+        live.refresh()
+
+        self.db.dbUpdateArticle(int(live.frame['id'].iloc[0]), {'sentiment': -0.9})
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(live.stats['full_loads'], 2)
+
+        self.db.dbDeleteAllArticles()
+        self.assertTrue(live.refresh().empty)
+        self.assertEqual(live.summary(), {})
+
+        self._insert(3)
+        self._assertMatchesFullLoad(live)
+
+    def test_filters_apply_to_delta(self):
+        live = LiveArticles(self.db, limit=100, filters=ArticleFilter(sources=('CNN',)),
+                            analyzer=self.analyzer)
+        live.refresh()
+        self._insert(6, source='BBC')
+        self._insert(2, source='CNN')
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(set(live.frame['source']), {'CNN'})
+        self.assertEqual(live.stats['delta_rows'], 2)
+
+    def test_large_delta_falls_back_to_full_load(self):
+        live = LiveArticles(self.db, limit=10, analyzer=self.analyzer)
+        live.refresh()
+        self._insert(25)
+        self._assertMatchesFullLoad(live)
+        self.assertEqual(live.stats['full_loads'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import numpy as np
+import pandas as pd
+
+from analyzer.benchmarks import synthetic_titles
+from analyzer.sentiment import NewsAnalyzer
+from dashboard.benchmarks import bench_news_list
+from dashboard.components import NEWS_LIST_COLUMNS, DashboardUI
+
+
+class TestNewsList(unittest.TestCase):
+    """Haber listesinin tek tablo olarak çizilmesi"""
+
+    def test_frame_is_columnar_slice_with_badges(self):
+        df = NewsAnalyzer().analyze_batch(synthetic_titles(50))
+        frame = DashboardUI.news_list_frame(df)
+
+        self.assertEqual(list(frame.columns), NEWS_LIST_COLUMNS)
+        self.assertEqual(len(frame), 50)
+        expected = np.select(
+            [df['sentiment_label'] == 'Positive', df['sentiment_label'] == 'Negative'],
+            ['🟢', '🔴'], default='🟡'
+        )
+        self.assertEqual(list(frame['badge']), list(expected))
+        pd.testing.assert_series_equal(frame['url'], df['url'])
+
+    def test_frame_without_labels_or_urls(self):
+        df = synthetic_titles(5).drop(columns=['url'])
+        frame = DashboardUI.news_list_frame(df)
+        self.assertEqual(set(frame['badge']), {'🟡'})
+        self.assertTrue(frame['url'].isna().all())
+
+    def test_element_count_is_independent_of_rows(self):
+        results = {(r['renderer'], r['rows']): r for r in bench_news_list(sizes=(20, 200), repeats=1)}
+
+        self.assertEqual(results[('table', 20)]['elements'], results[('table', 200)]['elements'])
+        self.assertLessEqual(results[('table', 200)]['elements'], 3)
+        # Eski döngü satır başına ~10 eleman üretir
+        self.assertGreaterEqual(results[('legacy', 200)]['elements'], 10 * 200)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
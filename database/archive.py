@@ -0,0 +1,245 @@
+import os
+import shutil
+import logging
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta, date
+from typing import List, Dict, Optional, Iterable
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow opsiyonel
+    pa = ds = pq = None
+
+from analyzer.labels import SENTIMENT_LABELS, label_codes
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleArchive:
+    """
+    Eski haberleri SQLite'dan gün/kaynak bölümlü Parquet dosyalarına taşır.
+
+    Dizin yapısı: <archive_dir>/day=YYYY-MM-DD/source=<kaynak>/part-*.parquet
+    Okuma tarafında sıcak (SQLite) ve soğuk (Parquet) veri birleştirilir;
+    gün ve kaynak filtreleri bölüm budamasıyla, tarih filtresi ise Parquet
+    istatistikleri üzerinden uygulanır.
+    """
+
+    COLUMNS = [
+        "id", "title", "url", "source", "sentiment", "date", "sentiment_model_version", "sentiment_label"
+    ]
+
+    def __init__(
+        self,
+        db_manager,
+        archive_dir: Optional[str] = None,
+        max_age_days: int = 30,
+        retention_days: Optional[int] = None
+    ):
+        if pa is None:
+            raise ImportError("Arşiv için pyarrow kurulu olmalı: pip install pyarrow")
+        # db_manager=None: yalnızca soğuk okuma (readArticles(include_hot=False))
+        if db_manager is None and archive_dir is None:
+            raise ValueError("db_manager verilmezse archive_dir gerekli")
+
+        self.db = db_manager
+        self.archive_dir = archive_dir or os.path.join(
+            os.path.dirname(os.path.abspath(db_manager.db_path)), "archive"
+        )
+        self.max_age_days = max_age_days
+        self.retention_days = retention_days
+
+        self._partitioning = ds.partitioning(
+            pa.schema([("day", pa.string()), ("source", pa.string())]),
+            flavor="hive"
+        )
+
+    # ---------------- ARCHIVE ----------------
+
+    def archiveOldArticles(self, max_age_days: Optional[int] = None) -> Dict[str, int]:
+        """max_age_days'ten eski haberleri Parquet'e yazar ve SQLite'dan siler"""
+        age = self.max_age_days if max_age_days is None else max_age_days
+        cutoff = str(datetime.now() - timedelta(days=age))
+
+        with self.db.dbConnection() as conn:
+            df = pd.read_sql_query(
+                "SELECT * FROM articles WHERE date < ? ORDER BY id",
+                conn, params=(cutoff,)
+            )
+
+        # Kayıtlarda mikrosaniyeli ve mikrosaniyesiz metinler karışık;
+        # tek biçim tahmini gece yarısı satırlarını NaT yapar
+        df["date"] = pd.to_datetime(df["date"], format="ISO8601", errors="coerce")
+        df = df.dropna(subset=["date"])
+        if df.empty:
+            return {"archived": 0, "partitions": 0}
+
+        partitions = self._writePartitions(df)
+
+        # Dosyalar yazıldıktan sonra yalnızca yazılan id'ler silinir;
+        # okunamayan tarihler SQLite'ta kalır
+        self.db.dbDeleteArchivedArticles(df["id"])
+
+        logger.info(f"Arşiv: {len(df)} haber {partitions} bölüme taşındı")
+        return {"archived": len(df), "partitions": partitions}
+
+    def _writePartitions(self, df: pd.DataFrame) -> int:
+        df = df[self.COLUMNS].copy()
+        df["day"] = df["date"].dt.strftime("%Y-%m-%d")
+
+        table = pa.Table.from_pandas(df, schema=self._fileSchema(), preserve_index=False)
+        token = f"{int(df['id'].min())}-{int(df['id'].max())}"
+
+        pq.write_to_dataset(
+            table,
+            root_path=self.archive_dir,
+            partition_cols=["day", "source"],
+            basename_template=f"part-{token}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+        return int(df.groupby(["day", "source"]).ngroups)
+
+    @staticmethod
+    def _fileSchema():
+        # Tümü NULL olan kolonlar da her dosyada aynı tiple yazılsın
+        return pa.schema([
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("url", pa.string()),
+            ("source", pa.string()),
+            ("sentiment", pa.float64()),
+            ("date", pa.timestamp("us")),
+            ("sentiment_model_version", pa.string()),
+            ("sentiment_label", pa.string()),
+            ("day", pa.string()),
+        ])
+
+    def purgeExpiredPartitions(self, retention_days: Optional[int] = None) -> int:
+        """retention_days'ten eski gün bölümlerini tamamen siler"""
+        days = self.retention_days if retention_days is None else retention_days
+        if days is None or not os.path.isdir(self.archive_dir):
+            return 0
+
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        removed = 0
+        for name in os.listdir(self.archive_dir):
+            if name.startswith("day=") and name[4:] < cutoff:
+                shutil.rmtree(os.path.join(self.archive_dir, name))
+                removed += 1
+
+        if removed:
+            logger.info(f"Arşiv: {removed} eski gün bölümü silindi")
+        return removed
+
+    def runRetention(self) -> Dict[str, int]:
+        """Arşivleme ve saklama politikasını birlikte çalıştırır"""
+        result = self.archiveOldArticles()
+        result["purged"] = self.purgeExpiredPartitions()
+        return result
+
+    # ---------------- READ ----------------
+
+    def readArticles(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+        columns: Optional[List[str]] = None,
+        include_hot: bool = True
+    ) -> pd.DataFrame:
+        """Sıcak SQLite penceresi ile soğuk arşivi birleştirerek okur"""
+        columns = list(columns) if columns else list(self.COLUMNS)
+        unknown = set(columns) - set(self.COLUMNS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen kolon(lar): {sorted(unknown)}")
+
+        sources = list(sources) if sources else None
+        # Birleştirme ve sıralama (ve eski dosyalarda etiket türetme) için
+        # gereken kolonları geçici olarak ekle
+        required = ("id", "date", "sentiment") if "sentiment_label" in columns else ("id", "date")
+        read_columns = columns + [c for c in required if c not in columns]
+
+        frames = [self._readCold(start, end, sources, read_columns)]
+        if include_hot:
+            frames.append(self._readHot(start, end, sources, read_columns))
+
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+
+        df = pd.concat(frames, ignore_index=True)
+        # Yarım kalan bir arşivleme aynı satırı iki tarafta bırakabilir
+        df = df.drop_duplicates(subset="id", keep="last")
+        df = df.sort_values("date", ascending=False, ignore_index=True)
+
+        return df[columns]
+
+    def _readHot(self, start, end, sources, columns) -> pd.DataFrame:
+        query = f"SELECT {', '.join(columns)} FROM articles"
+        conditions, params = [], []
+
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(str(pd.Timestamp(start).to_pydatetime()))
+        if end is not None:
+            conditions.append("date <= ?")
+            params.append(str(pd.Timestamp(end).to_pydatetime()))
+        if sources:
+            conditions.append(f"source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        with self.db.dbConnection() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+
+        if not df.empty:
+            df["date"] = pd.to_datetime(df["date"], format="ISO8601", errors="coerce")
+        return df
+
+    def _readCold(self, start, end, sources, columns) -> pd.DataFrame:
+        if not os.path.isdir(self.archive_dir):
+            return pd.DataFrame(columns=columns)
+
+        # Sabit şema: etiket kolonundan önce yazılmış dosyalarda kolon NULL okunur
+        dataset = ds.dataset(
+            self.archive_dir, format="parquet", partitioning=self._partitioning,
+            schema=self._fileSchema()
+        )
+
+        expr = None
+
+        def _and(e):
+            return e if expr is None else expr & e
+
+        # Gün ve kaynak bölüm kolonları: eşleşmeyen dizinler hiç okunmaz
+        if start is not None:
+            start = pd.Timestamp(start)
+            expr = _and(ds.field("day") >= start.strftime("%Y-%m-%d"))
+            expr = _and(ds.field("date") >= pa.scalar(start.to_pydatetime(), pa.timestamp("us")))
+        if end is not None:
+            end = pd.Timestamp(end)
+            expr = _and(ds.field("day") <= end.strftime("%Y-%m-%d"))
+            expr = _and(ds.field("date") <= pa.scalar(end.to_pydatetime(), pa.timestamp("us")))
+        if sources:
+            expr = _and(ds.field("source").isin(sources))
+
+        df = dataset.to_table(columns=columns, filter=expr).to_pandas()
+        if "sentiment_label" in df.columns and "sentiment" in df.columns and df["sentiment_label"].isna().any():
+            # Eski dosyalar için etiket kayıtlı skordan merkezi eşiklerle türetilir
+            missing = df["sentiment_label"].isna()
+            codes = label_codes(df.loc[missing, "sentiment"].to_numpy(dtype="float64"))
+            df.loc[missing, "sentiment_label"] = np.asarray(SENTIMENT_LABELS, dtype=object)[codes]
+        return df
+
+    def archivedDays(self) -> List[str]:
+        """Arşivdeki gün bölümlerini listeler"""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(
+            name[4:] for name in os.listdir(self.archive_dir) if name.startswith("day=")
+        )
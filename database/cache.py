@@ -0,0 +1,202 @@
+import os
+import sys
+import copy
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+
+_MISSING = object()
+
+
+def estimateSize(value: Any) -> int:
+    """Önbellekteki bir değerin yaklaşık bellek kullanımı (byte)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimateSize(k) + estimateSize(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimateSize(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def copyValue(value: Any) -> Any:
+    """Çağıranın önbellekteki nesneyi değiştirmemesi için kopya döndürür"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class LRUCache:
+    """Adet ve bellek sınırlı, opsiyonel TTL'li LRU önbellek"""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, size, expires = entry
+            if expires is not None and expires < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        size = estimateSize(value) if size is None else size
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            # Tek başına sınırı aşan değerler önbelleğe alınmaz
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            expires = time.monotonic() + self.ttl if self.ttl else None
+            self._data[key] = (value, size, expires)
+            self._bytes += size
+
+            while self._data and (
+                len(self._data) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+class QueryCache:
+    """
+    DatabaseManager sorguları için yazma-nesli (write generation) ile
+    geçersizlenen önbellek.
+
+    Nesil sayacı bu süreçteki her yazmada artırılır; diğer süreçlerin
+    yazmaları ise ayrı tutulan bir bağlantı üzerinden SQLite'ın
+    `PRAGMA data_version` değeri izlenerek yakalanır.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        self.db_path = db_path
+        self.lru = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._cached_generation = 0
+        self._data_version: Optional[int] = None
+        self._version_conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.invalidations = 0
+
+    def bump(self):
+        """Bu süreçteki bir yazmadan sonra nesli artırır"""
+        with self._lock:
+            self._generation += 1
+
+    def currentGeneration(self) -> int:
+        with self._lock:
+            version = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._data_version is not None and version != self._data_version:
+                self._generation += 1
+            self._data_version = version
+            return self._generation
+
+    def getOrLoad(self, method: str, args: tuple, loader: Callable[[], Any]) -> Any:
+        generation = self.currentGeneration()
+        with self._lock:
+            if generation != self._cached_generation:
+                self.lru.clear()
+                self._cached_generation = generation
+                self.invalidations += 1
+
+        key = (method, args)
+        value = self.lru.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            # Yükleme sırasında yazma olduysa sonuç eski nesle aittir
+            if self.currentGeneration() == generation:
+                self.lru.put(key, value)
+
+        return copyValue(value)
+
+    def clear(self):
+        self.lru.clear()
+
+    def stats(self) -> Dict:
+        stats = self.lru.stats()
+        stats["generation"] = self._generation
+        stats["invalidations"] = self.invalidations
+        return stats
+
+
+_shared_caches: Dict[str, QueryCache] = {}
+_shared_lock = threading.Lock()
+
+
+def sharedQueryCache(db_path: str, **options) -> QueryCache:
+    """Aynı veritabanı dosyasını kullanan tüm DatabaseManager'lar tek önbelleği paylaşır"""
+    key = os.path.abspath(db_path)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = QueryCache(db_path, **options)
+            _shared_caches[key] = cache
+        return cache
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from analyzer.labels import SENTIMENT_LABELS
+
+
+@dataclass(frozen=True)
+class ArticleFilter:
+    """
+    Sidebar filtrelerinin veritabanına gönderilen hali.
+
+    Boş alanlar filtre uygulamaz. Hashable olduğu için sorgu önbelleği
+    anahtarında doğrudan kullanılır.
+    """
+
+    sources: Tuple[str, ...] = ()
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    labels: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        unknown = set(self.labels) - set(SENTIMENT_LABELS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen etiket(ler): {sorted(unknown)}")
+        # Sıra farkı ayrı önbellek kaydı oluşturmasın
+        object.__setattr__(self, "sources", tuple(sorted(set(self.sources))))
+        object.__setattr__(self, "labels", tuple(sorted(set(self.labels))))
+
+    def isEmpty(self) -> bool:
+        return not self.toSql()[0]
+
+    def toSql(self) -> Tuple[str, List]:
+        """
+        Parametreli WHERE gövdesi ve parametreler. Tarih koşulları kolonu
+        sarmadan karşılaştırılır; böylece idx_date/idx_source_date kullanılabilir.
+        """
+        clauses, params = [], []
+
+        if self.sources:
+            clauses.append(f"source IN ({', '.join('?' * len(self.sources))})")
+            params.extend(self.sources)
+
+        # date kolonu 'YYYY-MM-DD HH:MM:SS' metni; gün sınırları metin olarak karşılaştırılır
+        if self.date_from:
+            clauses.append("date >= ?")
+            params.append(self.date_from.isoformat())
+        if self.date_to:
+            clauses.append("date < ?")
+            params.append((self.date_to + timedelta(days=1)).isoformat())
+
+        # Etiketler kalıcı sentiment_label kolonundan okunur (idx_label_date)
+        if self.labels and len(self.labels) < len(SENTIMENT_LABELS):
+            clauses.append(f"sentiment_label IN ({', '.join('?' * len(self.labels))})")
+            params.extend(self.labels)
+
+        return " AND ".join(clauses), params
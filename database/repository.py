@@ -1,20 +1,60 @@
 import os
+import json
 import sqlite3
 import pandas as pd
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, date, timedelta
 from contextlib import contextmanager
-from typing import List, Dict, Optional
+from concurrent.futures import Future
+from typing import Iterable, List, Dict, Optional, Sequence, Tuple
+
+from analyzer.tokenizer import tokenize
+from analyzer.aggregates import OnlineStats, SentimentAggregator, finite_score
+from analyzer.alerts import SpikeDetector
+from analyzer.labels import LABEL_CASE_PARAMS, LABEL_VERSION, SENTIMENT_LABELS, label_case_sql, label_for
+from database.writer import WriterService
+from database.cache import QueryCache, sharedQueryCache
+from database.filters import ArticleFilter
+
+
+# Dashboard, API ve CLI'nin kullandığı veritabanı dosyası; verilmezse çalışma dizinindeki news.db
+DB_PATH_ENV = "NEWS_DB_PATH"
+DEFAULT_DB_PATH = "news.db"
+
+# dbGetAllArticles projeksiyonunda izin verilen kolonlar
+ARTICLE_COLUMNS = (
+    "id", "title", "url", "source", "sentiment", "date", "sentiment_model_version", "sentiment_label"
+)
 
 
 class DatabaseManager:
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        use_writer: bool = False,
+        writer_options: Optional[Dict] = None,
+        use_cache: bool = True,
+        alert_options: Optional[Dict] = None
+    ):
         if db_path:
             self.db_path = db_path
         else:
             self.db_path = os.path.join(os.path.dirname(__file__), "news.db")
 
+        self.writer: Optional[WriterService] = None
+        # SpikeDetector parametreleri (method, threshold, bucket_minutes, ...)
+        self.alert_options: Dict = dict(alert_options or {})
+        SpikeDetector(**self.alert_options)  # geçersiz ayar ilk insert'te değil burada hata versin
+
         self.initializeDatabase()
 
+        # Aynı dosyayı kullanan tüm örnekler (ör. Streamlit sayfaları) önbelleği paylaşır
+        self.cache: QueryCache = sharedQueryCache(self.db_path)
+        self.use_cache = use_cache
+
+        if use_writer:
+            self.startWriter(**(writer_options or {}))
+
     @contextmanager
     def dbConnection(self):
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
@@ -43,48 +83,200 @@ class DatabaseManager:
             """)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_source ON articles(source)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_date ON articles(date)")
+            # Kaynak filtresi + tarih sıralaması tek indeksle karşılanır
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_date ON articles(source, date)")
+
+            self._ensureColumn(cursor, "articles", "sentiment_model_version", "TEXT")
+            # Etiket analyzer.labels eşikleriyle yazılır; etiket filtresi ve dağılımı SQL'de çalışır
+            self._ensureColumn(cursor, "articles", "sentiment_label", "TEXT")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_label_date ON articles(sentiment_label, date)"
+            )
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                    job TEXT PRIMARY KEY,
+                    model_version TEXT NOT NULL,
+                    last_id INTEGER NOT NULL,
+                    rows_done INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP
+                )
+            """)
+
+            # Trend sorguları için (terim, gün, kaynak) bazında kelime sayıları
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS term_counts (
+                    term TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (term, day, source)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_term_day ON term_counts(day, source)")
+            # Tüm geçmiş sorguları gün satırlarını taramasın diye kaynak bazlı toplamlar
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS term_totals (
+                    term TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (term, source)
+                ) WITHOUT ROWID
+            """)
+
+            # Kaynak başına canlı sentiment istatistikleri (OnlineStats durumu, JSON)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_stats (
+                    key TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at TIMESTAMP
+                )
+            """)
+            # Tüm kaynakların birlikte istatistiği; kaynak adlarıyla çakışmasın diye ayrı tablo
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_overall (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    state TEXT NOT NULL,
+                    updated_at TIMESTAMP
+                )
+            """)
+
+            # Kaynak başına sıçrama dedektörü durumu ve üretilen uyarılar
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS alert_state (
+                    source TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    detector TEXT NOT NULL,
+                    score REAL,
+                    value REAL,
+                    baseline REAL,
+                    article_id INTEGER,
+                    created_at TIMESTAMP,
+                    acknowledged INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_created ON alerts(created_at)")
+
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM term_counts)")
+            if not cursor.fetchone()[0]:
+                self._rebuildTermIndex(cursor)
+
+            # Eşikler değiştiyse ya da etiketsiz eski satırlar varsa etiketler yeniden yazılır
+            cursor.execute("SELECT value FROM meta WHERE key = 'label_version'")
+            row = cursor.fetchone()
+            if row is None or row[0] != LABEL_VERSION:
+                self._relabelArticles(cursor)
+            else:
+                cursor.execute("SELECT EXISTS(SELECT 1 FROM articles WHERE sentiment_label IS NULL)")
+                if cursor.fetchone()[0]:
+                    self._relabelArticles(cursor, only_missing=True)
+
+            # Genel satır her yeniden üretimde yazılır; yoksa tablo yeni ya da
+            # eski (genel anahtarı sentiment_stats'ta tutan) şemadır
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM sentiment_overall)")
+            if not cursor.fetchone()[0]:
+                self._rebuildLiveStats(cursor)
+
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM alert_state)")
+            if not cursor.fetchone()[0]:
+                self._rebuildAlertState(cursor)
+
+    @staticmethod
+    def _ensureColumn(cursor: sqlite3.Cursor, table: str, column: str, ddl: str):
+        # Eski veritabanı dosyaları için basit şema göçü
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
 
     # ---------------- INSERT ----------------
 
     def dbInsertArticle(self, article) -> Optional[int]:
+        if self.writer and self.writer.is_running:
+            return self.dbSubmitArticle(article).result()
+
         data = article.dictConverter() if hasattr(article, "dictConverter") else article
 
         with self.dbConnection() as conn:
-            cursor = conn.cursor()
+            return self._insertArticleRow(conn.cursor(), data)
 
-            # URL bazlı duplicate kontrolü
-            if data.get("url"):
-                cursor.execute(
-                    "SELECT id FROM articles WHERE url = ?", (data["url"],)
-                )
-                if cursor.fetchone():
-                    return None
-            
-            # Başlık bazlı duplicate kontrolü (URL yoksa veya benzer başlıklar için)
+    def _insertArticleRow(self, cursor: sqlite3.Cursor, data: Dict) -> Optional[int]:
+        # URL bazlı duplicate kontrolü
+        if data.get("url"):
             cursor.execute(
-                "SELECT id FROM articles WHERE title = ? AND source = ?",
-                (data["title"], data["source"])
+                "SELECT id FROM articles WHERE url = ?", (data["url"],)
             )
             if cursor.fetchone():
                 return None
 
-            cursor.execute("""
-                INSERT INTO articles (title, url, source, sentiment, date)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                data["title"],
-                data["url"],
-                data["source"],
-                data["sentiment"],
-                data.get("date", datetime.now())
-            ))
+        # Başlık bazlı duplicate kontrolü (URL yoksa veya benzer başlıklar için)
+        cursor.execute(
+            "SELECT id FROM articles WHERE title = ? AND source = ?",
+            (data["title"], data["source"])
+        )
+        if cursor.fetchone():
+            return None
+
+        cursor.execute("""
+            INSERT INTO articles (
+                title, url, source, sentiment, date, sentiment_model_version, sentiment_label
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            data["title"],
+            data["url"],
+            data["source"],
+            data["sentiment"],
+            data.get("date", datetime.now()),
+            data.get("sentiment_model_version"),
+            label_for(data["sentiment"])
+        ))
+        article_id = cursor.lastrowid
 
-            return cursor.lastrowid
+        self._indexTerms(
+            cursor, data["title"], data["source"], data.get("date", datetime.now()), 1
+        )
+        self._updateLiveStats(
+            cursor, data["source"], data["sentiment"], data.get("date", datetime.now())
+        )
+        self._detectSpikes(
+            cursor, article_id, data["source"], data["sentiment"], data.get("date", datetime.now())
+        )
 
+        self._bumpGeneration()
+        return article_id
 
     def dbInsertArticlesBulk(self, articles: List) -> Dict[str, int]:
         result = {"saved": 0, "duplicate": 0}
         from sqlite3 import IntegrityError
+
+        if self.writer and self.writer.is_running:
+            # Tüm istekler kuyruğa alınır, writer bunları batch halinde yazar
+            futures = [self.dbSubmitArticle(article) for article in articles]
+            for future in futures:
+                try:
+                    if future.result():
+                        result["saved"] += 1
+                    else:
+                        result["duplicate"] += 1
+                except IntegrityError:
+                    result["duplicate"] += 1
+            return result
+
         for article in articles:
             try:
                 if self.dbInsertArticle(article):
@@ -95,30 +287,239 @@ class DatabaseManager:
                 result["duplicate"] += 1
         return result
 
+    # ---------------- WRITER ----------------
+
+    def startWriter(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 0.2,
+        max_queue: int = 10000
+    ) -> WriterService:
+        """Tek yazıcılı arka plan kuyruğunu başlatır"""
+        if self.writer is None or not self.writer.is_running:
+            self.writer = WriterService(
+                self.db_path,
+                self._insertArticleRow,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+                max_queue=max_queue
+            )
+            self.writer.start()
+        return self.writer
+
+    def stopWriter(self, timeout: Optional[float] = None):
+        """Kuyruğu boşaltıp writer thread'ini durdurur"""
+        if self.writer:
+            self.writer.stop(timeout)
+
+    def dbSubmitArticle(self, article) -> Future:
+        """Haberi writer kuyruğuna ekler; Future yeni id'yi (veya None) döndürür"""
+        if not (self.writer and self.writer.is_running):
+            raise RuntimeError("Writer servisi başlatılmadı (startWriter)")
+
+        data = article.dictConverter() if hasattr(article, "dictConverter") else article
+        return self.writer.submit(data)
+
+    def dbWriterMetrics(self) -> Dict:
+        """Kuyruk derinliği ve commit gecikmesi metrikleri"""
+        if self.writer is None:
+            return {"running": False}
+        return self.writer.metrics()
+
+    # ---------------- CACHE ----------------
+
+    def _cachedQuery(self, method: str, args: tuple, loader):
+        if not self.use_cache:
+            return loader()
+        return self.cache.getOrLoad(method, args, loader)
+
+    def _bumpGeneration(self):
+        self.cache.bump()
+
+    def dbWriteGeneration(self) -> int:
+        """Her yazmada (diğer süreçler dahil) artan nesil sayacı"""
+        return self.cache.currentGeneration()
+
+    def dbCacheStats(self) -> Dict:
+        """Sorgu önbelleği hit/miss istatistikleri"""
+        return {"enabled": self.use_cache, **self.cache.stats()}
+
+    @staticmethod
+    def _markMutation(cursor: sqlite3.Cursor):
+        """
+        Var olan satırları değiştiren/silen yazmalar sayacı artırır. Yalnızca
+        insert görmüş bir okuyucu id > last_id deltasıyla güncel kalabilir;
+        sayaç değiştiyse tam yükleme gerekir.
+        """
+        cursor.execute(
+            "INSERT INTO meta (key, value) VALUES ('mutations', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def dbGetDeltaState(self) -> Dict[str, int]:
+        """En büyük haber id'si ve değişiklik sayacı (iki indeks okuması)"""
+        return self._cachedQuery("dbGetDeltaState", (), self._loadDeltaState)
+
+    def _loadDeltaState(self) -> Dict[str, int]:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(id) FROM articles")
+            max_id = cursor.fetchone()[0] or 0
+            cursor.execute("SELECT value FROM meta WHERE key = 'mutations'")
+            row = cursor.fetchone()
+            return {"max_id": int(max_id), "mutations": int(row[0]) if row else 0}
+
     # ---------------- SELECT ----------------
 
     def dbGetAllArticles(
-        self, source: Optional[str] = None, limit: int = 1000
+        self,
+        source: Optional[str] = None,
+        limit: int = 1000,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ArticleFilter] = None,
+        offset: int = 0,
+        compact: bool = True
+    ) -> pd.DataFrame:
+        """
+        Son haberler; source/model sürümü categorical, sentiment float32.
+        columns verilirse yalnızca o kolonlar okunur (ör. grafikler için
+        title/url atlanabilir). filters SQL WHERE'e derlenir; limit ve
+        offset (sayfalama) filtrelenmiş sonuca uygulanır. compact=False
+        değerleri veritabanındaki gibi (float64, metin) döndürür.
+        """
+        columns = tuple(columns) if columns else None
+        if columns:
+            unknown = set(columns) - set(ARTICLE_COLUMNS)
+            if unknown:
+                raise ValueError(f"Bilinmeyen kolon(lar): {sorted(unknown)}")
+
+        if filters is not None and filters.isEmpty():
+            filters = None
+
+        return self._cachedQuery(
+            "dbGetAllArticles", (source, limit, columns, filters, offset, compact),
+            lambda: self._loadAllArticles(source, limit, columns, filters, offset, compact)
+        )
+
+    def _loadAllArticles(
+        self,
+        source: Optional[str],
+        limit: int,
+        columns: Optional[Tuple[str, ...]] = None,
+        filters: Optional[ArticleFilter] = None,
+        offset: int = 0,
+        compact: bool = True
     ) -> pd.DataFrame:
         with self.dbConnection() as conn:
-            query = "SELECT * FROM articles"
-            params = []
+            query = f"SELECT {', '.join(columns) if columns else '*'} FROM articles"
+            clauses, params = [], []
 
             if source:
-                query += " WHERE source = ?"
+                clauses.append("source = ?")
                 params.append(source)
 
+            if filters is not None:
+                where, values = filters.toSql()
+                if where:
+                    clauses.append(where)
+                    params.extend(values)
+
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
+
             query += " ORDER BY date DESC LIMIT ?"
             params.append(limit)
+            if offset:
+                query += " OFFSET ?"
+                params.append(offset)
 
             df = pd.read_sql_query(query, conn, params=params)
 
-            if not df.empty:
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
+            if not df.empty and "date" in df.columns:
+                df["date"] = self._parseDates(df["date"])
+
+            return self._compactFrame(df) if compact else df
+
+    def dbGetArticlesSince(
+        self,
+        last_id: int,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ArticleFilter] = None,
+        limit: Optional[int] = None,
+        compact: bool = True
+    ) -> pd.DataFrame:
+        """
+        id'si last_id'den büyük haberler, id sırasıyla. Birincil anahtar
+        üzerinden okunduğu için maliyeti yalnızca yeni satır sayısı kadardır.
+        compact=False ile skorlar float64 kalır (dışa aktarma).
+        """
+        columns = tuple(columns) if columns else None
+        if columns:
+            unknown = set(columns) - set(ARTICLE_COLUMNS)
+            if unknown:
+                raise ValueError(f"Bilinmeyen kolon(lar): {sorted(unknown)}")
+
+        if filters is not None and filters.isEmpty():
+            filters = None
 
-            return df
+        return self._cachedQuery(
+            "dbGetArticlesSince", (int(last_id), columns, filters, limit, compact),
+            lambda: self._loadArticlesSince(int(last_id), columns, filters, limit, compact)
+        )
+
+    def _loadArticlesSince(
+        self,
+        last_id: int,
+        columns: Optional[Tuple[str, ...]],
+        filters: Optional[ArticleFilter],
+        limit: Optional[int],
+        compact: bool = True
+    ) -> pd.DataFrame:
+        query = f"SELECT {', '.join(columns) if columns else '*'} FROM articles WHERE id > ?"
+        params: List = [last_id]
+
+        if filters is not None:
+            where, values = filters.toSql()
+            query += f" AND {where}"
+            params.extend(values)
+
+        query += " ORDER BY id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.dbConnection() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+
+        if not df.empty and "date" in df.columns:
+            df["date"] = self._parseDates(df["date"])
+
+        return self._compactFrame(df) if compact else df
+
+    @staticmethod
+    def _parseDates(values: pd.Series) -> pd.Series:
+        # Kayıtlı metinler mikrosaniyeli ve mikrosaniyesiz karışık; format
+        # tahmini ilk değerden yapılırsa diğer biçimdeki satırlar NaT olur
+        return pd.to_datetime(values, format="ISO8601", errors="coerce")
+
+    def _compactFrame(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Tekrarlayan metinler categorical, skorlar float32 olarak tutulur
+        for column in ("source", "sentiment_model_version"):
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        if "sentiment" in df.columns:
+            df["sentiment"] = df["sentiment"].astype("float32")
+        if "sentiment_label" in df.columns:
+            df["sentiment_label"] = pd.Categorical(df["sentiment_label"], categories=SENTIMENT_LABELS)
+        return df
 
     def dbGetArticleById(self, article_id: int) -> Optional[Dict]:
+        return self._cachedQuery(
+            "dbGetArticleById", (article_id,),
+            lambda: self._loadArticleById(article_id)
+        )
+
+    def _loadArticleById(self, article_id: int) -> Optional[Dict]:
         with self.dbConnection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
@@ -131,31 +532,531 @@ class DatabaseManager:
         with self.dbConnection() as conn:
             cursor = conn.cursor()
 
+            reindex = bool({"title", "source", "date"} & set(updates))
+            if reindex:
+                self._unindexArticles(cursor, "WHERE id = ?", (article_id,))
+
+            if "sentiment" in updates:
+                updates = {**updates, "sentiment_label": label_for(updates["sentiment"])}
+
             fields = ", ".join([f"{k} = ?" for k in updates])
             values = list(updates.values()) + [article_id]
 
             cursor.execute(
                 f"UPDATE articles SET {fields} WHERE id = ?", values
             )
+
+            if reindex:
+                cursor.execute(
+                    "SELECT title, source, date FROM articles WHERE id = ?", (article_id,)
+                )
+                row = cursor.fetchone()
+                if row:
+                    self._indexTerms(cursor, row[0], row[1], row[2], 1)
+
+            if {"sentiment", "source", "date"} & set(updates):
+                self._markLiveStatsDirty(cursor)
+            self._markMutation(cursor)
+
+        self._bumpGeneration()
+        return True
+
+    # ---------------- LABELS ----------------
+
+    def _relabelArticles(self, cursor: sqlite3.Cursor, only_missing: bool = False) -> int:
+        """Etiketleri merkezi eşiklerle tek UPDATE'te yeniden yazar"""
+        query = f"UPDATE articles SET sentiment_label = {label_case_sql()}"
+        if only_missing:
+            query += " WHERE sentiment_label IS NULL"
+        cursor.execute(query, LABEL_CASE_PARAMS)
+        changed = cursor.rowcount
+
+        cursor.execute(
+            "INSERT INTO meta (key, value) VALUES ('label_version', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (LABEL_VERSION,)
+        )
+        self._markMutation(cursor)
+        return changed
+
+    def dbRelabelArticles(self) -> int:
+        """Tüm etiketleri yeniden hesaplar (ör. eşikler elle değiştirildiğinde)"""
+        with self.dbConnection() as conn:
+            changed = self._relabelArticles(conn.cursor())
+        self._bumpGeneration()
+        return changed
+
+    def dbGetLabelCounts(self, filters: Optional[ArticleFilter] = None) -> Dict[str, int]:
+        """Etiket dağılımı; idx_label_date üzerinden sayılır"""
+        if filters is not None and filters.isEmpty():
+            filters = None
+        return self._cachedQuery(
+            "dbGetLabelCounts", (filters,), lambda: self._loadLabelCounts(filters)
+        )
+
+    def _loadLabelCounts(self, filters: Optional[ArticleFilter]) -> Dict[str, int]:
+        query, params = "SELECT sentiment_label, COUNT(*) FROM articles", []
+        if filters is not None:
+            where, params = filters.toSql()
+            query += f" WHERE {where}"
+
+        with self.dbConnection() as conn:
+            rows = conn.execute(query + " GROUP BY sentiment_label", params).fetchall()
+
+        counts = {label: 0 for label in SENTIMENT_LABELS}
+        counts.update({row[0]: row[1] for row in rows if row[0] is not None})
+        return counts
+
+    # ---------------- BACKFILL ----------------
+
+    def dbGetRescoreChunk(
+        self, after_id: int, chunk_size: int, model_version: str
+    ) -> List[tuple]:
+        """after_id'den sonraki, model_version ile skorlanmamış (id, title) satırları"""
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, title FROM articles
+                WHERE id > ?
+                  AND (sentiment_model_version IS NULL OR sentiment_model_version != ?)
+                ORDER BY id
+                LIMIT ?
+            """, (after_id, model_version, chunk_size))
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def dbApplySentimentChunk(
+        self, job: str, model_version: str, scores: List[tuple], last_id: int
+    ) -> int:
+        """(id, sentiment) listesini ve checkpoint'i tek transaction'da yazar"""
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE articles SET sentiment = ?, sentiment_model_version = ?, sentiment_label = ? "
+                "WHERE id = ?",
+                [(score, model_version, label_for(score), article_id) for article_id, score in scores]
+            )
+            cursor.execute("""
+                INSERT INTO backfill_checkpoints (job, model_version, last_id, rows_done, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(job) DO UPDATE SET
+                    model_version = excluded.model_version,
+                    last_id = excluded.last_id,
+                    rows_done = CASE
+                        WHEN backfill_checkpoints.model_version = excluded.model_version
+                        THEN backfill_checkpoints.rows_done + excluded.rows_done
+                        ELSE excluded.rows_done
+                    END,
+                    updated_at = excluded.updated_at
+            """, (job, model_version, last_id, len(scores), datetime.now()))
+            self._markLiveStatsDirty(cursor)
+            self._markMutation(cursor)
+
+        self._bumpGeneration()
+        return len(scores)
+
+    def dbGetBackfillCheckpoint(self, job: str) -> Optional[Dict]:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM backfill_checkpoints WHERE job = ?", (job,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def dbResetBackfillCheckpoint(self, job: str) -> bool:
+        with self.dbConnection() as conn:
+            conn.execute("DELETE FROM backfill_checkpoints WHERE job = ?", (job,))
             return True
 
+    # ---------------- TERM INDEX ----------------
+
+    @staticmethod
+    def _termDay(value) -> str:
+        return str(value)[:10] if value else date.today().isoformat()
+
+    def _indexTerms(self, cursor: sqlite3.Cursor, title: str, source: str, when, sign: int):
+        counts = Counter(tokenize(title))
+        if not counts:
+            return
+
+        day = self._termDay(when)
+        cursor.executemany("""
+            INSERT INTO term_counts (term, day, source, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(term, day, source) DO UPDATE SET count = count + excluded.count
+        """, [(term, day, source, sign * n) for term, n in counts.items()])
+        cursor.executemany("""
+            INSERT INTO term_totals (term, source, count) VALUES (?, ?, ?)
+            ON CONFLICT(term, source) DO UPDATE SET count = count + excluded.count
+        """, [(term, source, sign * n) for term, n in counts.items()])
+
+        if sign < 0:
+            # Yalnızca az önce azaltılan anahtarlar; tablo taraması yapılmaz
+            cursor.executemany(
+                "DELETE FROM term_counts WHERE term = ? AND day = ? AND source = ? AND count <= 0",
+                [(term, day, source) for term in counts]
+            )
+            cursor.executemany(
+                "DELETE FROM term_totals WHERE term = ? AND source = ? AND count <= 0",
+                [(term, source) for term in counts]
+            )
+
+    def _unindexArticles(self, cursor: sqlite3.Cursor, where: str, params: tuple):
+        cursor.execute(f"SELECT title, source, date FROM articles {where}", params)
+        for title, source, when in cursor.fetchall():
+            self._indexTerms(cursor, title, source, when, -1)
+
+    def _rebuildTermIndex(self, cursor: sqlite3.Cursor) -> int:
+        counts: Counter = Counter()
+        rows = cursor.execute("SELECT title, source, date FROM articles")
+        for title, source, when in rows:
+            day = self._termDay(when)
+            for term in tokenize(title):
+                counts[(term, day, source)] += 1
+
+        totals: Counter = Counter()
+        for (term, _, source), n in counts.items():
+            totals[(term, source)] += n
+
+        cursor.execute("DELETE FROM term_counts")
+        cursor.execute("DELETE FROM term_totals")
+        cursor.executemany(
+            "INSERT INTO term_counts (term, day, source, count) VALUES (?, ?, ?, ?)",
+            [(term, day, source, n) for (term, day, source), n in counts.items()]
+        )
+        cursor.executemany(
+            "INSERT INTO term_totals (term, source, count) VALUES (?, ?, ?)",
+            [(term, source, n) for (term, source), n in totals.items()]
+        )
+        return len(counts)
+
+    def dbRebuildTermIndex(self) -> int:
+        """Terim indeksini articles tablosundan baştan üretir"""
+        with self.dbConnection() as conn:
+            rows = self._rebuildTermIndex(conn.cursor())
+
+        self._bumpGeneration()
+        return rows
+
+    def dbGetTrendingTerms(
+        self,
+        window_days: Optional[int] = 7,
+        source: Optional[str] = None,
+        top_n: int = 20
+    ) -> List[Tuple[str, int]]:
+        """Son window_days günün (None ise tüm geçmişin) en sık terimleri"""
+        return self._cachedQuery(
+            "dbGetTrendingTerms", (window_days, source, top_n),
+            lambda: self._loadTrendingTerms(window_days, source, top_n)
+        )
+
+    def _loadTrendingTerms(
+        self, window_days: Optional[int], source: Optional[str], top_n: int
+    ) -> List[Tuple[str, int]]:
+        conditions, params = [], []
+        table = "term_totals" if window_days is None else "term_counts"
+
+        if window_days is not None:
+            conditions.append("day >= ?")
+            params.append((date.today() - timedelta(days=window_days - 1)).isoformat())
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT term, SUM(count) AS total
+                FROM {table}
+                {where}
+                GROUP BY term
+                ORDER BY total DESC, term
+                LIMIT ?
+            """, (*params, top_n))
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    # ---------------- LIVE STATS ----------------
+    # Her insert'te kaynak ve genel durum okunup O(1) güncellenir. EWMA geri
+    # alınamadığı için silme, skor/kaynak/tarih güncellemesi ve backfill
+    # istatistikleri kirli işaretler; sonraki okuma bir kez yeniden üretir.
+
+    @staticmethod
+    def _markLiveStatsDirty(cursor: sqlite3.Cursor):
+        cursor.execute(
+            "INSERT INTO meta (key, value) VALUES ('live_stats_dirty', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = 1"
+        )
+
+    @staticmethod
+    def _upsertLiveState(cursor: sqlite3.Cursor, key: Optional[str], stats: OnlineStats, now: datetime):
+        # key None ise genel satır
+        if key is None:
+            cursor.execute("""
+                INSERT INTO sentiment_overall (id, state, updated_at) VALUES (1, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET state = excluded.state,
+                                              updated_at = excluded.updated_at
+            """, (json.dumps(stats.to_state()), now))
+        else:
+            cursor.execute("""
+                INSERT INTO sentiment_stats (key, state, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET state = excluded.state,
+                                               updated_at = excluded.updated_at
+            """, (key, json.dumps(stats.to_state()), now))
+
+    def _updateLiveStats(self, cursor: sqlite3.Cursor, source: str, score, when):
+        # NaN/sonsuz skor EWMA'yı kalıcı olarak NaN yapar
+        score = finite_score(score)
+        if score is None:
+            return
+
+        now = datetime.now()
+        cursor.execute("SELECT state FROM sentiment_stats WHERE key = ?", (source,))
+        row = cursor.fetchone()
+        stats = OnlineStats.from_state(json.loads(row[0])) if row else OnlineStats()
+        self._upsertLiveState(cursor, source, stats.update(score, when), now)
+
+        cursor.execute("SELECT state FROM sentiment_overall WHERE id = 1")
+        row = cursor.fetchone()
+        overall = OnlineStats.from_state(json.loads(row[0])) if row else OnlineStats()
+        self._upsertLiveState(cursor, None, overall.update(score, when), now)
+
+    def _rebuildLiveStats(self, cursor: sqlite3.Cursor) -> int:
+        cursor.execute("DELETE FROM sentiment_stats")
+        cursor.execute(
+            "SELECT source, sentiment, date FROM articles ORDER BY date, id"
+        )
+        aggregator = SentimentAggregator()
+        rows = 0
+        for source, sentiment, when in cursor.fetchall():
+            aggregator.update(source, sentiment, when)
+            rows += 1
+
+        now = datetime.now()
+        cursor.executemany(
+            "INSERT INTO sentiment_stats (key, state, updated_at) VALUES (?, ?, ?)",
+            [(key, json.dumps(stats.to_state()), now) for key, stats in aggregator.stats.items()]
+        )
+        self._upsertLiveState(cursor, None, aggregator.overall, now)
+        cursor.execute("DELETE FROM meta WHERE key = 'live_stats_dirty'")
+        return rows
+
+    def dbRebuildLiveStats(self) -> int:
+        """Canlı istatistikleri articles tablosundan tarih sırasıyla yeniden üretir"""
+        with self.dbConnection() as conn:
+            rows = self._rebuildLiveStats(conn.cursor())
+
+        self._bumpGeneration()
+        return rows
+
+    def dbGetLiveSentiment(self, source: Optional[str] = None) -> Dict:
+        """
+        Tablo taraması olmadan canlı sentiment özeti. source verilirse tek
+        kaynağın özeti, verilmezse {"overall": özet, "sources": {kaynak: özet}}.
+        """
+        return self._cachedQuery(
+            "dbGetLiveSentiment", (source,),
+            lambda: self._loadLiveSentiment(source)
+        )
+
+    def _loadLiveSentiment(self, source: Optional[str]) -> Dict:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM meta WHERE key = 'live_stats_dirty')")
+            if cursor.fetchone()[0]:
+                self._rebuildLiveStats(cursor)
+
+            if source is not None:
+                cursor.execute("SELECT key, state FROM sentiment_stats WHERE key = ?", (source,))
+            else:
+                cursor.execute("SELECT key, state FROM sentiment_stats ORDER BY key")
+            snapshots = {
+                row[0]: OnlineStats.from_state(json.loads(row[1])).snapshot()
+                for row in cursor.fetchall()
+            }
+            if source is not None:
+                return snapshots.get(source, {})
+
+            cursor.execute("SELECT state FROM sentiment_overall WHERE id = 1")
+            row = cursor.fetchone()
+            overall = OnlineStats.from_state(json.loads(row[0])) if row else None
+
+        return {
+            "overall": overall.snapshot() if overall and overall.count else {},
+            "sources": snapshots,
+        }
+
+    # ---------------- ALERTS ----------------
+    # Dedektör durumu kaynak başına tek satırdır; her haberde yalnızca o
+    # satır okunup yazılır, geçmiş büyüdükçe maliyet artmaz.
+
+    def _detectSpikes(self, cursor: sqlite3.Cursor, article_id, source: str, score, when):
+        cursor.execute("SELECT state FROM alert_state WHERE source = ?", (source,))
+        row = cursor.fetchone()
+        detector = SpikeDetector(**self.alert_options)
+        if row:
+            detector.load_state(json.loads(row[0]))
+
+        now = datetime.now()
+        for alert in detector.observe(score, when):
+            cursor.execute("""
+                INSERT INTO alerts (source, kind, detector, score, value, baseline,
+                                    article_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (source, alert["kind"], alert["detector"], alert["score"],
+                  alert["value"], alert["baseline"], article_id, when or now))
+
+        cursor.execute("""
+            INSERT INTO alert_state (source, state, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(source) DO UPDATE SET state = excluded.state,
+                                              updated_at = excluded.updated_at
+        """, (source, json.dumps(detector.to_state()), now))
+
+    def _rebuildAlertState(self, cursor: sqlite3.Cursor) -> int:
+        # Geçmiş haberlerle taban çizgileri ısıtılır; geçmiş için uyarı yazılmaz
+        cursor.execute("DELETE FROM alert_state")
+        cursor.execute("SELECT source, sentiment, date FROM articles ORDER BY date, id")
+        detectors: Dict[str, SpikeDetector] = {}
+        rows = 0
+        for source, sentiment, when in cursor.fetchall():
+            if source not in detectors:
+                detectors[source] = SpikeDetector(**self.alert_options)
+            detectors[source].observe(sentiment, when)
+            rows += 1
+
+        now = datetime.now()
+        cursor.executemany(
+            "INSERT INTO alert_state (source, state, updated_at) VALUES (?, ?, ?)",
+            [(source, json.dumps(d.to_state()), now) for source, d in detectors.items()]
+        )
+        return rows
+
+    def dbRebuildAlertState(self) -> int:
+        """Dedektör taban çizgilerini articles tablosundan yeniden üretir"""
+        with self.dbConnection() as conn:
+            rows = self._rebuildAlertState(conn.cursor())
+
+        self._bumpGeneration()
+        return rows
+
+    def dbGetAlerts(
+        self, limit: int = 20, source: Optional[str] = None, include_acknowledged: bool = False
+    ) -> List[Dict]:
+        """En yeni uyarılar (created_at indeksiyle, tablo taraması olmadan)"""
+        return self._cachedQuery(
+            "dbGetAlerts", (limit, source, include_acknowledged),
+            lambda: self._loadAlerts(limit, source, include_acknowledged)
+        )
+
+    def _loadAlerts(
+        self, limit: int, source: Optional[str], include_acknowledged: bool
+    ) -> List[Dict]:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            query = "SELECT * FROM alerts"
+            clauses, params = [], []
+
+            if source:
+                clauses.append("source = ?")
+                params.append(source)
+            if not include_acknowledged:
+                clauses.append("acknowledged = 0")
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
+
+            query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+            cursor.execute(query, (*params, limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def dbAcknowledgeAlert(self, alert_id: int) -> bool:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE alerts SET acknowledged = 1 WHERE id = ?", (alert_id,))
+            updated = cursor.rowcount > 0
+
+        self._bumpGeneration()
+        return updated
+
     # ---------------- DELETE ----------------
 
     def dbDeleteArticle(self, article_id: int) -> bool:
         with self.dbConnection() as conn:
             cursor = conn.cursor()
+            self._unindexArticles(cursor, "WHERE id = ?", (article_id,))
             cursor.execute("DELETE FROM articles WHERE id = ?", (article_id,))
-            return True
+            self._markLiveStatsDirty(cursor)
+            self._markMutation(cursor)
+
+        self._bumpGeneration()
+        return True
+
+    def dbDeleteArchivedArticles(self, article_ids: Iterable[int]) -> int:
+        """
+        Arşive taşınan haberleri siler. term_counts/term_totals tüm geçmişi
+        kapsadığı için bilerek azaltılmaz; canlı istatistikler kirli işaretlenir.
+        """
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS archived_ids (id INTEGER PRIMARY KEY)")
+            cursor.execute("DELETE FROM archived_ids")
+            cursor.executemany("INSERT INTO archived_ids (id) VALUES (?)", ((int(i),) for i in article_ids))
+            cursor.execute("DELETE FROM articles WHERE id IN (SELECT id FROM archived_ids)")
+            deleted = cursor.rowcount
+            cursor.execute("DROP TABLE archived_ids")
+            if deleted:
+                self._markLiveStatsDirty(cursor)
+                self._markMutation(cursor)
+
+        if deleted:
+            self._bumpGeneration()
+        return deleted
 
     def dbDeleteAllArticles(self) -> bool:
         with self.dbConnection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM articles")
-            return True
+            cursor.execute("DELETE FROM term_counts")
+            cursor.execute("DELETE FROM term_totals")
+            cursor.execute("DELETE FROM sentiment_stats")
+            cursor.execute("DELETE FROM sentiment_overall")
+            cursor.execute("DELETE FROM meta WHERE key = 'live_stats_dirty'")
+            cursor.execute("DELETE FROM alert_state")
+            cursor.execute("DELETE FROM alerts")
+            self._markMutation(cursor)
+
+        self._bumpGeneration()
+        return True
+
+    # ---------------- MAINTENANCE ----------------
+
+    def _fileSize(self) -> int:
+        return os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+
+    def dbVacuum(self) -> Dict[str, int]:
+        """Dosyayı yeniden yazarak boş sayfaları geri verir"""
+        before = self._fileSize()
+        with self.dbConnection() as conn:
+            conn.execute("VACUUM")
+        return {"bytes_before": before, "bytes_after": self._fileSize()}
+
+    def dbAnalyze(self) -> Dict[str, int]:
+        """Sorgu planlayıcısı için indeks istatistiklerini günceller"""
+        with self.dbConnection() as conn:
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA optimize")
+            # Boş veritabanında ANALYZE sqlite_stat1 oluşturmayabilir
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            indexes = conn.execute("SELECT COUNT(DISTINCT idx) FROM sqlite_stat1").fetchone()[0] if has_stats else 0
+        return {"indexes": indexes}
 
     # ---------------- EXTRA ----------------
 
-    def dbSearchArticles(self, keyword: str, limit: int = 50) -> pd.DataFrame:
+    def dbSearchArticles(self, keyword: str, limit: int = 50, compact: bool = True) -> pd.DataFrame:
+        return self._cachedQuery(
+            "dbSearchArticles", (keyword, limit, compact),
+            lambda: self._loadSearchArticles(keyword, limit, compact)
+        )
+
+    def _loadSearchArticles(self, keyword: str, limit: int, compact: bool = True) -> pd.DataFrame:
         with self.dbConnection() as conn:
             query = """
                 SELECT * FROM articles
@@ -168,11 +1069,60 @@ class DatabaseManager:
             )
 
             if not df.empty:
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
+                df["date"] = self._parseDates(df["date"])
+
+            return self._compactFrame(df) if compact else df
 
-            return df
+    def dbGetFilterOptions(self) -> Dict:
+        """Sidebar seçenekleri: kaynak listesi ve tarih aralığı (indeks üzerinden okunur)"""
+        return self._cachedQuery("dbGetFilterOptions", (), self._loadFilterOptions)
+
+    def _loadFilterOptions(self) -> Dict:
+        with self.dbConnection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT DISTINCT source FROM articles ORDER BY source")
+            sources = [row[0] for row in cursor.fetchall()]
+
+            # MIN/MAX idx_date'ten tek adımda okunur
+            cursor.execute("SELECT MIN(date) FROM articles")
+            min_date = cursor.fetchone()[0]
+            cursor.execute("SELECT MAX(date) FROM articles")
+            max_date = cursor.fetchone()[0]
+
+            return {
+                "sources": sources,
+                "min_date": pd.to_datetime(min_date).date() if min_date else None,
+                "max_date": pd.to_datetime(max_date).date() if max_date else None,
+            }
+
+    def dbGetSentimentTimeline(self, filters: Optional[ArticleFilter] = None) -> pd.DataFrame:
+        """Günlük ortalama sentiment ve haber sayısı (day, avg_sentiment, count); SQL'de gruplanır"""
+        if filters is not None and filters.isEmpty():
+            filters = None
+        return self._cachedQuery(
+            "dbGetSentimentTimeline", (filters,), lambda: self._loadSentimentTimeline(filters)
+        )
+
+    def _loadSentimentTimeline(self, filters: Optional[ArticleFilter]) -> pd.DataFrame:
+        # date metni 'YYYY-MM-DD ...' olduğu için ilk 10 karakter gün anahtarıdır
+        query = "SELECT substr(date, 1, 10) AS day, AVG(sentiment) AS avg_sentiment, COUNT(*) AS count " \
+                "FROM articles WHERE date IS NOT NULL"
+        params: List = []
+        if filters is not None:
+            where, params = filters.toSql()
+            query += f" AND {where}"
+
+        with self.dbConnection() as conn:
+            df = pd.read_sql_query(query + " GROUP BY day ORDER BY day", conn, params=params)
+
+        df["day"] = pd.to_datetime(df["day"], errors="coerce")
+        return df.dropna(subset=["day"]).reset_index(drop=True)
 
     def dbGetStatistics(self) -> Dict:
+        return self._cachedQuery("dbGetStatistics", (), self._loadStatistics)
+
+    def _loadStatistics(self) -> Dict:
         with self.dbConnection() as conn:
             cursor = conn.cursor()
 
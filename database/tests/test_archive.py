@@ -0,0 +1,133 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from database.repository import DatabaseManager
+from database.archive import ArticleArchive
+
+
+class TestArticleArchive(unittest.TestCase):
+    """Parquet arşiv katmanı testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        self.archive = ArticleArchive(self.db, max_age_days=30, retention_days=365)
+
+        now = datetime.now()
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Old BBC story', 'url': 'u1', 'source': 'BBC News',
+             'sentiment': 0.5, 'date': now - timedelta(days=90)},
+            {'title': 'Old CNN story', 'url': 'u2', 'source': 'CNN',
+             'sentiment': -0.3, 'date': now - timedelta(days=60)},
+            {'title': 'Ancient story', 'url': 'u3', 'source': 'CNN',
+             'sentiment': 0.0, 'date': now - timedelta(days=400)},
+            {'title': 'Fresh story', 'url': 'u4', 'source': 'BBC News',
+             'sentiment': 0.1, 'date': now},
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_archive_moves_old_rows(self):
+        """Eski haberler SQLite'dan silinip Parquet'e yazılmalı"""
+        result = self.archive.archiveOldArticles()
+
+        self.assertEqual(result['archived'], 3)
+        self.assertEqual(result['partitions'], 3)
+        self.assertEqual(len(self.db.dbGetAllArticles()), 1)
+        self.assertEqual(len(self.archive.archivedDays()), 3)
+
+    def test_archive_keeps_bookkeeping_consistent(self):
+        """Arşivleme silme tarafı gibi canlı istatistikleri geçersiz kılar, terim sayılarını korur"""
+        terms = self.db.dbGetTrendingTerms(window_days=None)
+        generation = self.db.dbWriteGeneration()
+        self.db.dbGetLiveSentiment()
+
+        self.archive.archiveOldArticles()
+
+        self.assertGreater(self.db.dbWriteGeneration(), generation)
+        self.assertEqual(self.db.dbGetTrendingTerms(window_days=None), terms)
+        after_archive = self.db.dbGetLiveSentiment()
+        self.assertEqual(after_archive['overall']['count'], 1)
+        self.db.dbRebuildLiveStats()
+        self.assertEqual(self.db.dbGetLiveSentiment(), after_archive)
+
+    def test_read_unions_hot_and_cold(self):
+        """Okuyucu sıcak ve soğuk veriyi birleştirmeli"""
+        self.archive.archiveOldArticles()
+
+        df = self.archive.readArticles()
+        self.assertEqual(len(df), 4)
+        self.assertEqual(df['title'].iloc[0], 'Fresh story')
+        self.assertTrue(df['date'].is_monotonic_decreasing)
+
+    def test_read_prunes_by_date_and_source(self):
+        """Tarih ve kaynak filtreleri iki tarafta da uygulanmalı"""
+        self.archive.archiveOldArticles()
+
+        since = datetime.now() - timedelta(days=100)
+        df = self.archive.readArticles(start=since, sources=['BBC News'],
+                                       columns=['title', 'sentiment'])
+
+        self.assertEqual(list(df.columns), ['title', 'sentiment'])
+        self.assertEqual(sorted(df['title']), ['Fresh story', 'Old BBC story'])
+
+    def test_retention_purges_expired_days(self):
+        """Saklama süresini aşan gün bölümleri silinmeli"""
+        result = self.archive.runRetention()
+
+        self.assertEqual(result['purged'], 1)
+        titles = set(self.archive.readArticles()['title'])
+        self.assertNotIn('Ancient story', titles)
+
+    def test_mixed_date_formats_are_not_lost(self):
+        """Gece yarısı satırları NaT olmamalı; okunamayan tarih SQLite'ta kalmalı"""
+        midnight = (datetime.now() - timedelta(days=70)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.db.dbInsertArticle({'title': 'Midnight story', 'url': 'u5', 'source': 'CNN',
+                                 'sentiment': 0.2, 'date': midnight})
+        with self.db.dbConnection() as conn:
+            conn.execute("INSERT INTO articles (title, url, source, sentiment, date) "
+                         "VALUES ('Broken date', 'u6', 'CNN', 0.0, '0000-bad')")
+
+        result = self.archive.archiveOldArticles()
+
+        self.assertEqual(result['archived'], 4)
+        self.assertEqual(sorted(self.db.dbGetAllArticles()['title']), ['Broken date', 'Fresh story'])
+        self.assertIn('Midnight story', set(self.archive.readArticles(include_hot=False)['title']))
+
+    def test_archived_rows_keep_label(self):
+        """Arşive taşınan satırlar kayıtlı etiketiyle okunmalı; eski dosyalarda etiket türetilmeli"""
+        self.archive.archiveOldArticles()
+        cold = self.archive.readArticles(columns=['title', 'sentiment_label'], include_hot=False)
+        self.assertEqual(dict(zip(cold['title'], cold['sentiment_label'])),
+                         {'Old BBC story': 'Positive', 'Old CNN story': 'Negative', 'Ancient story': 'Neutral'})
+
+        # Etiket kolonu olmadan yazılmış eski bir bölüm dosyası
+        legacy_dir = os.path.join(self.archive.archive_dir, 'day=2020-01-01', 'source=NPR')
+        os.makedirs(legacy_dir)
+        pq.write_table(pa.table({
+            'id': pa.array([999], pa.int64()), 'title': ['Legacy story'], 'url': ['u999'],
+            'sentiment': [-0.8], 'date': pa.array([datetime(2020, 1, 1)], pa.timestamp('us')),
+            'sentiment_model_version': pa.array([None], pa.string()),
+        }), os.path.join(legacy_dir, 'part-legacy-0.parquet'))
+
+        legacy = self.archive.readArticles(sources=['NPR'], columns=['sentiment_label'], include_hot=False)
+        self.assertEqual(legacy['sentiment_label'].tolist(), ['Negative'])
+
+    def test_unknown_column_rejected(self):
+        """Bilinmeyen kolon istenirse hata verilmeli"""
+        with self.assertRaises(ValueError):
+            self.archive.readArticles(columns=['title', 'nope'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
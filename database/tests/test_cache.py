@@ -0,0 +1,105 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.repository import DatabaseManager
+from database.cache import LRUCache
+
+
+class TestQueryCache(unittest.TestCase):
+    """Yazma nesli ile geçersizlenen sorgu önbelleği testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        self.db.dbInsertArticle({'title': 'First headline', 'url': 'u1',
+                                 'source': 'BBC', 'sentiment': 0.2})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_repeated_reads_hit_cache(self):
+        """Aynı sorgu ikinci kez SQLite'a gitmemeli"""
+        self.db.dbGetAllArticles(limit=1000)
+        self.db.dbGetAllArticles(limit=1000)
+
+        stats = self.db.dbCacheStats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_cache_shared_between_managers(self):
+        """Aynı dosyayı kullanan DatabaseManager'lar önbelleği paylaşmalı"""
+        self.db.dbGetAllArticles(limit=1000)
+        other = DatabaseManager(self.db_path)
+        other.dbGetAllArticles(limit=1000)
+
+        self.assertEqual(other.dbCacheStats()['hits'], 1)
+
+    def test_returned_frame_is_a_copy(self):
+        """Çağıranın değişiklikleri önbelleğe sızmamalı"""
+        df = self.db.dbGetAllArticles()
+        df['extra'] = 1
+        self.assertNotIn('extra', self.db.dbGetAllArticles().columns)
+
+    def test_local_write_invalidates(self):
+        """Bu süreçteki yazmalar önbelleği geçersiz kılmalı"""
+        self.assertEqual(len(self.db.dbGetAllArticles()), 1)
+        self.db.dbInsertArticle({'title': 'Second headline', 'url': 'u2',
+                                 'source': 'BBC', 'sentiment': 0.0})
+        self.assertEqual(len(self.db.dbGetAllArticles()), 2)
+
+        self.db.dbDeleteAllArticles()
+        self.assertEqual(self.db.dbGetStatistics()['total_articles'], 0)
+
+    def test_external_write_detected_by_data_version(self):
+        """Başka bir bağlantının yazması data_version ile yakalanmalı"""
+        self.assertEqual(len(self.db.dbGetAllArticles()), 1)
+        generation = self.db.dbWriteGeneration()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO articles (title, url, source, sentiment) "
+                     "VALUES ('External', 'u3', 'CNN', 0.1)")
+        conn.commit()
+        conn.close()
+
+        self.assertGreater(self.db.dbWriteGeneration(), generation)
+        self.assertEqual(len(self.db.dbGetAllArticles()), 2)
+
+    def test_none_results_are_cached(self):
+        """Bulunamayan kayıt sonucu da önbelleğe alınmalı"""
+        self.assertIsNone(self.db.dbGetArticleById(999))
+        self.assertIsNone(self.db.dbGetArticleById(999))
+        self.assertEqual(self.db.dbCacheStats()['hits'], 1)
+
+
+class TestLRUCache(unittest.TestCase):
+    """LRU sınırları"""
+
+    def test_entry_limit_evicts_oldest(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_byte_limit(self):
+        cache = LRUCache(max_entries=10, max_bytes=200)
+        cache.put('a', 'x' * 100)
+        cache.put('b', 'y' * 100)
+
+        self.assertLessEqual(cache.stats()['bytes'], 200)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.filters import ArticleFilter
+from database.repository import DatabaseManager
+
+
+class TestArticlesSince(unittest.TestCase):
+    """dbGetArticlesSince deltası ve değişiklik sayacı"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        self.start = datetime(2026, 3, 1, 8)
+        self._insert(range(20))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _insert(self, numbers):
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Headline {i}', 'url': f'u{i}', 'source': ['BBC', 'CNN'][i % 2],
+             'sentiment': [-0.4, 0.0, 0.3][i % 3], 'date': self.start + timedelta(hours=i)}
+            for i in numbers
+        ])
+
+    def test_returns_only_newer_rows_in_id_order(self):
+        state = self.db.dbGetDeltaState()
+        self.assertEqual(state['max_id'], 20)
+
+        self._insert(range(20, 25))
+        delta = self.db.dbGetArticlesSince(state['max_id'])
+
+        self.assertEqual(list(delta['id']), [21, 22, 23, 24, 25])
+        self.assertEqual(str(delta['source'].dtype), 'category')
+        self.assertEqual(list(delta['sentiment_label'].astype(str)),
+                         ['Positive', 'Negative', 'Neutral', 'Positive', 'Negative'])
+        self.assertTrue(self.db.dbGetArticlesSince(25).empty)
+
+    def test_mixed_date_precision_is_parsed(self):
+        """Mikrosaniyeli ve mikrosaniyesiz tarih metinleri birlikte okunmalı"""
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Precise', 'url': 'p1', 'source': 'BBC', 'sentiment': 0.1,
+             'date': datetime(2026, 4, 1, 12, 0, 0, 123456)},
+            {'title': 'Midnight', 'url': 'p2', 'source': 'BBC', 'sentiment': 0.1,
+             'date': datetime(2026, 4, 2)},
+        ])
+        delta = self.db.dbGetArticlesSince(20)
+        self.assertEqual(list(delta['date']), [datetime(2026, 4, 1, 12, 0, 0, 123456), datetime(2026, 4, 2)])
+        self.assertFalse(self.db.dbGetAllArticles()['date'].isna().any())
+
+    def test_columns_filters_and_limit(self):
+        delta = self.db.dbGetArticlesSince(
+            10, columns=['id', 'source'], filters=ArticleFilter(sources=('CNN',)), limit=3
+        )
+        self.assertEqual(list(delta.columns), ['id', 'source'])
+        self.assertEqual(list(delta['id']), [12, 14, 16])
+
+        with self.assertRaises(ValueError):
+            self.db.dbGetArticlesSince(0, columns=['id', 'body'])
+
+    def test_inserts_do_not_count_as_mutations(self):
+        before = self.db.dbGetDeltaState()['mutations']
+        self._insert(range(20, 22))
+        self.assertEqual(self.db.dbGetDeltaState()['mutations'], before)
+
+        self.db.dbUpdateArticle(3, {'sentiment': 0.9})
+        after_update = self.db.dbGetDeltaState()['mutations']
+        self.assertGreater(after_update, before)
+
+        self.db.dbDeleteArticle(4)
+        self.assertGreater(self.db.dbGetDeltaState()['mutations'], after_update)
+
+    def test_delete_all_resets_max_id(self):
+        self.db.dbDeleteAllArticles()
+        state = self.db.dbGetDeltaState()
+        self.assertEqual(state['max_id'], 0)
+        self.assertGreater(state['mutations'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,91 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.sentiment import NewsAnalyzer
+from database.filters import ArticleFilter
+from database.repository import DatabaseManager
+
+
+class TestFilterPushdown(unittest.TestCase):
+    """ArticleFilter'ın SQL WHERE'e derlenmesi ve sonuçların pandas ile eşitliği"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+
+        start = datetime(2026, 1, 1, 6)
+        sources = ['BBC', 'CNN', "Reuter's"]
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Headline {i}', 'url': f'u{i}', 'source': sources[i % 3],
+             'sentiment': [-0.5, -0.1, 0.0, 0.1, 0.4][i % 5], 'date': start + timedelta(hours=6 * i)}
+            for i in range(600)
+        ])
+        self.all = NewsAnalyzer().analyze_batch(self.db.dbGetAllArticles(limit=10_000))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _expected(self, sources=(), date_from=None, date_to=None, labels=()):
+        df = self.all
+        if sources:
+            df = df[df['source'].isin(sources)]
+        if date_from:
+            df = df[df['date'].dt.date >= date_from]
+        if date_to:
+            df = df[df['date'].dt.date <= date_to]
+        if labels:
+            df = df[df['sentiment_label'].isin(labels)]
+        return sorted(df['id'])
+
+    def test_filters_match_pandas_on_full_table(self):
+        cases = [
+            dict(sources=("Reuter's",)),
+            dict(date_from=date(2026, 1, 3), date_to=date(2026, 1, 10)),
+            dict(labels=('Neutral',)),
+            dict(sources=('BBC', 'CNN'), labels=('Positive', 'Negative'), date_to=date(2026, 2, 1)),
+        ]
+        for case in cases:
+            filters = ArticleFilter(**case)
+            df = self.db.dbGetAllArticles(limit=10_000, filters=filters)
+            self.assertEqual(sorted(df['id']), self._expected(**case), case)
+
+    def test_limit_applies_after_filter(self):
+        """Eski tarih aralığı son 100 haberin dışında kalsa da eksiksiz dönmeli"""
+        filters = ArticleFilter(date_to=date(2026, 1, 5))
+        df = self.db.dbGetAllArticles(limit=100, filters=filters)
+        self.assertEqual(sorted(df['id']), self._expected(date_to=date(2026, 1, 5)))
+        self.assertTrue(self.db.dbGetAllArticles(limit=100)['date'].min() > datetime(2026, 1, 5))
+
+    def test_sql_is_parameterized_and_indexed(self):
+        where, params = ArticleFilter(sources=('CNN',), date_from=date(2026, 1, 2)).toSql()
+        self.assertNotIn('CNN', where)
+        self.assertEqual(params, ['CNN', '2026-01-02'])
+
+        conn = sqlite3.connect(self.db_path)
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM articles WHERE {where} ORDER BY date DESC LIMIT 10", params
+        ).fetchall()
+        conn.close()
+        self.assertIn('USING INDEX', ' '.join(row[-1] for row in plan))
+
+        self.assertTrue(ArticleFilter(labels=('Positive', 'Neutral', 'Negative')).isEmpty())
+        with self.assertRaises(ValueError):
+            ArticleFilter(labels=('Happy',))
+
+    def test_filter_options_from_metadata(self):
+        options = self.db.dbGetFilterOptions()
+        self.assertEqual(options['sources'], ['BBC', 'CNN', "Reuter's"])
+        self.assertEqual(options['min_date'], date(2026, 1, 1))
+        self.assertEqual(options['max_date'], self.all['date'].max().date())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,52 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.repository import DatabaseManager
+from analyzer.benchmarks import bench_page_memory
+
+
+class TestCompactFrames(unittest.TestCase):
+    """Categorical/float32 DataFrame ve kolon projeksiyonu testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Markets rally', 'url': 'u1', 'source': 'BBC', 'sentiment': 0.1},
+            {'title': 'Storm hits coast', 'url': 'u2', 'source': 'CNN', 'sentiment': -0.25},
+            {'title': 'Talks resume', 'url': 'u3', 'source': 'BBC', 'sentiment': 0.0},
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_compact_dtypes(self):
+        df = self.db.dbGetAllArticles()
+        self.assertIsInstance(df['source'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['sentiment'].dtype, 'float32')
+        self.assertEqual(sorted(df['source'].cat.categories), ['BBC', 'CNN'])
+
+    def test_column_projection(self):
+        df = self.db.dbGetAllArticles(columns=['source', 'sentiment'])
+        self.assertEqual(list(df.columns), ['source', 'sentiment'])
+        self.assertEqual(len(df), 3)
+
+        with self.assertRaises(ValueError):
+            self.db.dbGetAllArticles(columns=['title; DROP TABLE articles'])
+
+    def test_projected_pages_use_less_memory(self):
+        """Sadece sayısal kolon okuyan sayfalar belleği yarıdan fazla azaltmalı"""
+        results = {r['page']: r for r in bench_page_memory(n_rows=2000, limit=1000)}
+        self.assertGreater(results['1_Genel_Bakış']['reduction'], 0.5)
+        self.assertGreater(results['MainPage']['reduction'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from analyzer.labels import LABEL_VERSION, label_for
+from analyzer.sentiment import NewsAnalyzer
+from database.filters import ArticleFilter
+from database.repository import DatabaseManager
+from models.News import News
+
+SCORES = [-0.5, -0.1, -0.099, 0.0, 0.1, 0.101, 0.8, None]
+
+
+class TestStoredLabels(unittest.TestCase):
+    """Kalıcı sentiment_label kolonu ve merkezi eşik testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        start = datetime(2026, 1, 1)
+        self.db.dbInsertArticlesBulk([
+            {'title': f'Headline {i}', 'url': f'u{i}', 'source': ['BBC', 'CNN'][i % 2],
+             'sentiment': SCORES[i % len(SCORES)], 'date': start + timedelta(hours=i)}
+            for i in range(80)
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _rows(self):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT id, sentiment, sentiment_label FROM articles ORDER BY id").fetchall()
+        conn.close()
+        return rows
+
+    def test_labels_follow_central_thresholds(self):
+        for _, score, label in self._rows():
+            self.assertEqual(label, label_for(score), score)
+
+        df = self.db.dbGetAllArticles(limit=1000)
+        recomputed = NewsAnalyzer().label_scores(df['sentiment'])
+        self.assertEqual(df['sentiment_label'].tolist(), recomputed.tolist())
+
+        article = News(title='t', url='', source='X', sentiment=0.1)
+        article.sentimentCategorizer()
+        self.assertEqual(article.sentiment_type, 'Neutral')
+
+    def test_updates_keep_label_in_sync(self):
+        self.db.dbUpdateArticle(1, {'sentiment': 0.9})
+        self.db.dbApplySentimentChunk('job', 'v2', [(2, -0.7)], last_id=2)
+        labels = {row[0]: row[2] for row in self._rows()}
+        self.assertEqual((labels[1], labels[2]), ('Positive', 'Negative'))
+
+    def test_recompute_on_threshold_change_and_old_schema(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE meta SET value = 'old' WHERE key = 'label_version'")
+        conn.execute("UPDATE articles SET sentiment_label = 'Positive'")
+        conn.commit()
+        conn.close()
+
+        DatabaseManager(self.db_path, use_cache=False)
+        for _, score, label in self._rows():
+            self.assertEqual(label, label_for(score))
+
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT value FROM meta").fetchone()[0], LABEL_VERSION)
+        conn.execute("UPDATE articles SET sentiment_label = NULL WHERE id <= 10")
+        conn.commit()
+        conn.close()
+
+        DatabaseManager(self.db_path, use_cache=False)
+        self.assertTrue(all(label is not None for _, _, label in self._rows()))
+
+    def test_label_counts_and_filter_run_in_sql(self):
+        df = NewsAnalyzer().analyze_batch(self.db.dbGetAllArticles(limit=1000))
+        expected = NewsAnalyzer().get_sentiment_distribution(df)
+        self.assertEqual(self.db.dbGetLabelCounts(), expected)
+
+        bbc = self.db.dbGetLabelCounts(ArticleFilter(sources=('BBC',)))
+        self.assertEqual(sum(bbc.values()), (df['source'] == 'BBC').sum())
+
+        where, params = ArticleFilter(labels=('Negative',)).toSql()
+        conn = sqlite3.connect(self.db_path)
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM articles WHERE {where}", params
+        ).fetchall()
+        conn.close()
+        self.assertIn('idx_label_date', ' '.join(row[-1] for row in plan))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
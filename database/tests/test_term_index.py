@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+import random
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.repository import DatabaseManager
+from analyzer.sentiment import NewsAnalyzer
+
+
+class TestTermIndex(unittest.TestCase):
+    """Kalıcı terim frekans indeksi testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "news.db")
+        self.db = DatabaseManager(self.db_path)
+        self.db.dbInsertArticlesBulk([
+            {'title': 'Markets rally as markets reopen', 'url': 'u1',
+             'source': 'BBC', 'sentiment': 0.3},
+            {'title': 'Storm hits coast, markets steady', 'url': 'u2',
+             'source': 'CNN', 'sentiment': -0.2},
+            {'title': 'Old storm report from archive', 'url': 'u3', 'source': 'CNN',
+             'sentiment': 0.0, 'date': datetime.now() - timedelta(days=40)},
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_matches_extract_keywords(self):
+        """İndeks NewsAnalyzer ile aynı tokenizer kurallarını kullanmalı"""
+        df = self.db.dbGetAllArticles()
+        expected = NewsAnalyzer().get_trending_topics(df, top_n=50)
+
+        self.assertEqual(dict(self.db.dbGetTrendingTerms(window_days=None, top_n=50)),
+                         dict(expected))
+
+    def test_window_and_source_filters(self):
+        trending = dict(self.db.dbGetTrendingTerms(window_days=7))
+        self.assertEqual(trending['markets'], 3)
+        self.assertEqual(trending['storm'], 1)
+
+        cnn = dict(self.db.dbGetTrendingTerms(window_days=None, source='CNN'))
+        self.assertEqual(cnn['storm'], 2)
+        self.assertNotIn('rally', cnn)
+
+    def test_delete_and_update_keep_index_in_sync(self):
+        """Silme ve başlık güncellemesi sayıları düzeltmeli"""
+        df = self.db.dbGetAllArticles()
+        first_id = int(df.loc[df['url'] == 'u1', 'id'].iloc[0])
+
+        self.db.dbUpdateArticle(first_id, {'title': 'Rally continues today'})
+        trending = dict(self.db.dbGetTrendingTerms(window_days=None))
+        self.assertEqual(trending['markets'], 1)
+        self.assertEqual(trending['rally'], 1)
+
+        self.db.dbDeleteArticle(first_id)
+        self.assertNotIn('rally', dict(self.db.dbGetTrendingTerms(window_days=None)))
+
+        self.db.dbDeleteAllArticles()
+        self.assertEqual(self.db.dbGetTrendingTerms(window_days=None), [])
+
+    def test_delete_prunes_only_touched_keys(self):
+        """Sıfırlanan anahtarlar silinmeli; silme birincil anahtarla aranmalı"""
+        df = self.db.dbGetAllArticles()
+        self.db.dbDeleteArticle(int(df.loc[df['url'] == 'u2', 'id'].iloc[0]))
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM term_counts WHERE count <= 0").fetchone()[0], 0)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM term_totals WHERE count <= 0").fetchone()[0], 0)
+            self.assertIsNone(conn.execute("SELECT 1 FROM term_totals WHERE term = 'coast'").fetchone())
+
+            plans = [
+                conn.execute("EXPLAIN QUERY PLAN DELETE FROM term_counts WHERE term = 'a' AND day = 'b' "
+                             "AND source = 'c' AND count <= 0").fetchall(),
+                conn.execute("EXPLAIN QUERY PLAN DELETE FROM term_totals WHERE term = 'a' AND source = 'c' "
+                             "AND count <= 0").fetchall(),
+            ]
+        finally:
+            conn.close()
+        for plan in plans:
+            self.assertTrue(all('SCAN' not in row[-1] for row in plan), plan)
+
+    def test_existing_database_is_indexed_on_open(self):
+        """İndeksten önce oluşturulmuş veritabanı açılışta indekslenmeli"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM term_counts")
+        conn.commit()
+        conn.close()
+
+        reopened = DatabaseManager(self.db_path, use_cache=False)
+        self.assertEqual(dict(reopened.dbGetTrendingTerms(window_days=None))['markets'], 3)
+
+    def test_full_history_query_is_fast(self):
+        """Tüm geçmiş üzerinden trend sorgusu 50ms altında kalmalı"""
+        rng = random.Random(1)
+        vocab = [f'word{i:04d}' for i in range(3000)]
+        sources = [f'Source {i}' for i in range(12)]
+        start = datetime.now() - timedelta(days=365)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT INTO articles (title, url, source, sentiment, date) VALUES (?, ?, ?, 0, ?)",
+            [(' '.join(rng.choices(vocab, k=8)), f'bulk{i}', rng.choice(sources),
+              start + timedelta(minutes=10 * i)) for i in range(50000)]
+        )
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(self.db_path, use_cache=False)
+        db.dbRebuildTermIndex()
+
+        started = time.perf_counter()
+        db.dbGetTrendingTerms(window_days=None, top_n=20)
+        db.dbGetTrendingTerms(window_days=None, source='Source 3', top_n=10)
+        elapsed = (time.perf_counter() - started) / 2
+
+        self.assertLess(elapsed, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
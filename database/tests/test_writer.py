@@ -0,0 +1,108 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.repository import DatabaseManager
+
+
+def make_article(i, source='TestSource'):
+    return {'title': f'Headline number {i}', 'url': f'https://test.com/{i}',
+            'source': source, 'sentiment': 0.0}
+
+
+class TestWriterService(unittest.TestCase):
+    """Tek yazıcılı kuyruk testleri"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(
+            os.path.join(self.tmp_dir, "news.db"),
+            use_writer=True,
+            writer_options={'batch_size': 50, 'flush_interval': 0.05}
+        )
+
+    def tearDown(self):
+        self.db.stopWriter()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_submit_returns_future(self):
+        """dbSubmitArticle commit sonrası id döndürmeli"""
+        article_id = self.db.dbSubmitArticle(make_article(1)).result(timeout=5)
+        self.assertIsNotNone(article_id)
+        self.assertEqual(self.db.dbGetArticleById(article_id)['title'], 'Headline number 1')
+
+    def test_duplicate_resolves_to_none(self):
+        """Duplicate haber Future'ı None ile sonuçlanmalı"""
+        self.db.dbSubmitArticle(make_article(1)).result(timeout=5)
+        self.assertIsNone(self.db.dbSubmitArticle(make_article(1)).result(timeout=5))
+
+    def test_concurrent_writers_are_batched(self):
+        """Eşzamanlı yazarlar kilit hatası almadan batch halinde yazmalı"""
+        def ingest(offset):
+            return self.db.dbInsertArticlesBulk(
+                [make_article(offset * 100 + i) for i in range(100)]
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(ingest, range(4)))
+
+        self.assertEqual(sum(r['saved'] for r in results), 400)
+        self.assertEqual(self.db.dbGetStatistics()['total_articles'], 400)
+
+        metrics = self.db.dbWriterMetrics()
+        self.assertEqual(metrics['completed'], 400)
+        self.assertLess(metrics['batches'], 400)
+        self.assertEqual(metrics['queue_depth'], 0)
+
+    def test_stop_drains_queue(self):
+        """stopWriter kuyruktaki işleri yazmadan çıkmamalı"""
+        futures = [self.db.dbSubmitArticle(make_article(i)) for i in range(30)]
+        self.db.stopWriter()
+
+        self.assertTrue(all(f.done() for f in futures))
+        self.assertFalse(self.db.dbWriterMetrics()['running'])
+
+    def test_failed_item_is_rolled_back(self):
+        """Yarıda hata veren kayıt hiçbir tabloya yazılmamalı; yeniden denenebilmeli"""
+        original = self.db._updateLiveStats
+
+        def flaky(cursor, source, score, when):
+            if source == 'Broken':
+                raise RuntimeError('boom')
+            return original(cursor, source, score, when)
+
+        with patch.object(self.db, '_updateLiveStats', side_effect=flaky):
+            ok = self.db.dbSubmitArticle(make_article(1))
+            bad = self.db.dbSubmitArticle(make_article(2, source='Broken'))
+            self.assertIsNotNone(ok.result(timeout=5))
+            with self.assertRaises(RuntimeError):
+                bad.result(timeout=5)
+
+        with self.db.dbConnection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM articles WHERE source = 'Broken'").fetchone()[0], 0)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM term_counts WHERE source = 'Broken'").fetchone()[0], 0)
+
+        self.assertIsNotNone(self.db.dbSubmitArticle(make_article(2, source='Broken')).result(timeout=5))
+
+    def test_cancelled_future_does_not_kill_writer(self):
+        """İptal edilen Future atlanmalı, diğer istekler sonuçlanmalı"""
+        futures = [self.db.dbSubmitArticle(make_article(i)) for i in range(20)]
+        cancelled = [f for f in futures if f.cancel()]
+        later = self.db.dbSubmitArticle(make_article(99))
+
+        self.assertIsNotNone(later.result(timeout=5))
+        self.assertTrue(self.db.dbWriterMetrics()['running'])
+        for future in futures:
+            if future not in cancelled:
+                self.assertIsNotNone(future.result(timeout=5))
+        self.assertEqual(self.db.dbGetStatistics()['total_articles'], 21 - len(cancelled))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
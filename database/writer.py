@@ -0,0 +1,204 @@
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class WriterService:
+    """
+    Yazma bağlantısının sahibi olan tek bir arka plan thread'i.
+
+    İstekler sınırlı bir kuyruğa alınır; thread kuyruğu boşaltıp
+    batch_size dolunca ya da flush_interval süresi geçince tek bir
+    transaction ile commit eder. Her çağıran commit sonrası sonuçlanan
+    bir Future alır.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        write_fn: Callable[[sqlite3.Cursor, Dict], Optional[int]],
+        batch_size: int = 100,
+        flush_interval: float = 0.2,
+        max_queue: int = 10000
+    ):
+        self.db_path = db_path
+        self.write_fn = write_fn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._batches = 0
+        self._latencies = deque(maxlen=1000)
+
+    # ---------------- LIFECYCLE ----------------
+
+    def start(self):
+        if self.is_running:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="news-db-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Kuyruktaki tüm işleri yazıp thread'i durdurur"""
+        if not self.is_running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        # Zaman aşımında thread hâlâ kuyruğu boşaltıyor olabilir; referans korunur
+        if not self._thread.is_alive():
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ---------------- SUBMIT ----------------
+
+    def submit(self, data: Dict, timeout: Optional[float] = None) -> Future:
+        """Yazma isteğini kuyruğa ekler; kuyruk doluysa bekler (backpressure)"""
+        if not self.is_running:
+            raise RuntimeError("Writer servisi çalışmıyor")
+
+        future: Future = Future()
+        self._queue.put((data, future), timeout=timeout)
+        with self._lock:
+            self._submitted += 1
+        return future
+
+    # ---------------- WORKER ----------------
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                try:
+                    self._commitBatch(conn, batch)
+                except Exception as e:
+                    # Beklenmeyen hata thread'i öldürmesin; bekleyen Future'lar askıda kalmasın
+                    logger.exception(f"Writer batch hatası: {e}")
+                    self._failPending(batch, e)
+        finally:
+            conn.close()
+
+    def _commitBatch(self, conn: sqlite3.Connection, batch):
+        started = time.perf_counter()
+        results = []
+        cursor = conn.cursor()
+
+        # İptal edilmiş Future'lar yazılmaz; kalanlar RUNNING durumuna geçer
+        batch = [(data, future) for data, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        # Açık transaction: en dıştaki RELEASE commit yerine geçmesin
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+
+        for data, future in batch:
+            # Her kayıt birden çok tabloya yazar (articles, term_counts,
+            # sentiment_stats, alerts); savepoint hatalı kaydın yarım
+            # kalan adımlarını geri alır, batch'in geri kalanı etkilenmez
+            cursor.execute("SAVEPOINT item")
+            try:
+                results.append((future, self.write_fn(cursor, data), None))
+                cursor.execute("RELEASE item")
+            except Exception as e:
+                cursor.execute("ROLLBACK TO item")
+                cursor.execute("RELEASE item")
+                results.append((future, None, e))
+
+        try:
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Writer commit hatası: {e}")
+            results = [(future, None, e) for future, _, _ in results]
+
+        elapsed = time.perf_counter() - started
+        failed = 0
+        for future, value, error in results:
+            if error is not None:
+                failed += 1
+                future.set_exception(error)
+            else:
+                future.set_result(value)
+
+        with self._lock:
+            self._batches += 1
+            self._completed += len(results) - failed
+            self._failed += failed
+            self._latencies.append(elapsed)
+
+    @staticmethod
+    def _failPending(batch, error: Exception):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    # ---------------- METRICS ----------------
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            metrics = {
+                "running": self.is_running,
+                "queue_depth": self._queue.qsize(),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "batches": self._batches,
+                "avg_batch_size": round(
+                    (self._completed + self._failed) / self._batches, 2
+                ) if self._batches else 0.0,
+            }
+
+        if latencies:
+            metrics["commit_latency_ms"] = {
+                "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+                "p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3),
+            }
+        else:
+            metrics["commit_latency_ms"] = {"p50": 0.0, "p99": 0.0, "max": 0.0}
+
+        return metrics
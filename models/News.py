@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from analyzer.labels import label_for
+
 
 @dataclass
 class News:
@@ -12,15 +14,11 @@ class News:
     sentiment: float
     date: datetime = field(default_factory=datetime.now)
     sentiment_type: Optional[str] = None
+    sentiment_model_version: Optional[str] = None
 
     def sentimentCategorizer(self) -> None:
 
-        if self.sentiment > 0.1:
-            self.sentiment_type = "Positive"
-        elif self.sentiment < -0.1:
-            self.sentiment_type = "Negative"
-        else:
-            self.sentiment_type = "Neutral"
+        self.sentiment_type = label_for(self.sentiment)
 
     def dictConverter(self) -> dict:
 
@@ -30,7 +28,8 @@ class News:
             "source": self.source,
             "sentiment": self.sentiment,
             "date": self.date,
-            "sentimentType": self.sentiment_type
+            "sentimentType": self.sentiment_type,
+            "sentiment_model_version": self.sentiment_model_version
         }
 
     def __str__(self) -> str:
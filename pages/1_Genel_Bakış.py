@@ -4,11 +4,13 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.repository import DatabaseManager
-from analyzer.sentiment import NewsAnalyzer
-from dashboard.components import DashboardUI
+from dashboard.data import (
+    finish_rerun, get_analyzer, get_db, get_ui, live_articles, load_alerts,
+    load_live_sentiment, render_auto_refresh, start_rerun
+)
 
 st.set_page_config(page_title="Genel Bakış", page_icon="📊", layout="wide")
+start_rerun("1_Genel_Bakış")
 
 st.markdown("""
     <style>
@@ -27,13 +29,14 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-db = DatabaseManager('news.db')
-analyzer = NewsAnalyzer()
-ui = DashboardUI()
+db = get_db()
+analyzer = get_analyzer()
+ui = get_ui()
+render_auto_refresh()
 
-df = db.dbGetAllArticles(limit=1000)
-if not df.empty:
-    df = analyzer.analyze_batch(df)
+# Grafikler başlık ve URL kullanmaz; sayısal kolonlar ve kayıtlı etiket okunur
+live = live_articles(limit=1000, columns=['id', 'source', 'sentiment', 'sentiment_label', 'date'])
+df = live.refresh()
 
 st.markdown("""
     <div style='text-align: center; padding: 20px; background: rgba(102, 126, 234, 0.1); border-radius: 15px; margin-bottom: 20px; border: 2px solid rgba(102, 126, 234, 0.3);'>
@@ -46,7 +49,43 @@ if df.empty:
     st.warning("⚠️ Henüz veri yok! Ana sayfadan haber çekin.")
     st.stop()
 
-ui.render_metrics(df)
+ui.render_metrics(df, live.summary())
+
+# Canlı metrikler insert sırasında güncellenen özetlerden okunur, tablo taranmaz
+live_sentiment = load_live_sentiment()
+overall, live_sources = live_sentiment['overall'], live_sentiment['sources']
+if overall:
+    st.subheader("⚡ Canlı Duygu")
+    st.caption(f"Son {overall['window_size']} haberin kayan ortalaması ve EWMA")
+    cols = st.columns(min(len(live_sources), 4) + 1)
+    with cols[0]:
+        st.metric("Genel (EWMA)", f"{overall['ewma_mean']:.3f}",
+                  delta=f"{overall['ewma_mean'] - overall['rolling_mean']:+.3f}")
+    for idx, (source, snap) in enumerate(sorted(live_sources.items())[:len(cols) - 1]):
+        with cols[idx + 1]:
+            st.metric(source, f"{snap['ewma_mean']:.3f}",
+                      delta=f"{snap['ewma_mean'] - snap['rolling_mean']:+.3f}")
+
+alert_labels = {
+    "sentiment_drop": "📉 Negatif dalga",
+    "sentiment_rise": "📈 Pozitif dalga",
+    "volume_spike": "📢 Hacim sıçraması",
+}
+alerts = load_alerts(limit=5)
+if alerts:
+    st.subheader("🚨 Uyarılar")
+    for alert in alerts:
+        col1, col2 = st.columns([6, 1])
+        with col1:
+            st.warning(
+                f"**{alert_labels.get(alert['kind'], alert['kind'])}** · {alert['source']} · "
+                f"değer {alert['value']:.3f}, taban {alert['baseline']:.3f} "
+                f"({alert['detector']} {alert['score']:.1f}) · {alert['created_at']}"
+            )
+        with col2:
+            if st.button("✔️ Okundu", key=f"ack_{alert['id']}"):
+                db.dbAcknowledgeAlert(alert['id'])
+                st.rerun()
 
 st.markdown("---")
 
@@ -67,11 +106,13 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📈 Özet İstatistikler")
-    stats = analyzer.get_summary_statistics(df)
+    stats = analyzer.cached('get_summary_statistics', df)
     st.json(stats)
 
 with col2:
     st.subheader("📊 Kaynak Bazında İstatistikler")
-    source_stats = analyzer.sentiment_by_source(df)
+    source_stats = analyzer.cached('sentiment_by_source', df)
     if not source_stats.empty:
-        st.dataframe(source_stats, use_container_width=True)
\ No newline at end of file
+        st.dataframe(source_stats, use_container_width=True)
+
+finish_rerun()
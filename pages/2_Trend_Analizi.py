@@ -6,11 +6,10 @@ import plotly.express as px
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.repository import DatabaseManager
-from analyzer.sentiment import NewsAnalyzer
-from dashboard.components import DashboardUI
+from dashboard.data import finish_rerun, get_analytics, get_analyzer, get_ui, load_articles, load_history, start_rerun
 
 st.set_page_config(page_title="Trend Analizi", page_icon="📈", layout="wide")
+start_rerun("2_Trend_Analizi")
 
 st.markdown("""
     <style>
@@ -29,13 +28,11 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-db = DatabaseManager('news.db')
-analyzer = NewsAnalyzer()
-ui = DashboardUI()
+analyzer = get_analyzer()
+ui = get_ui()
 
-df = db.dbGetAllArticles(limit=1000)
-if not df.empty:
-    df = analyzer.analyze_batch(df)
+# Grafikler başlık ve URL kullanmaz; sayısal kolonlar ve kayıtlı etiket okunur
+df = load_articles(limit=1000, columns=['id', 'source', 'sentiment', 'sentiment_label', 'date'])
 
 st.markdown("""
     <div style='text-align: center; padding: 20px; background: rgba(102, 126, 234, 0.1); border-radius: 15px; margin-bottom: 20px; border: 2px solid rgba(102, 126, 234, 0.3);'>
@@ -75,6 +72,28 @@ with col2:
     st.plotly_chart(fig, use_container_width=True)
 
 st.subheader("📊 Kaynak Performansı")
-source_stats = analyzer.sentiment_by_source(df)
+source_stats = analyzer.cached('sentiment_by_source', df)
 if not source_stats.empty:
-    st.dataframe(source_stats, use_container_width=True)
\ No newline at end of file
+    st.dataframe(source_stats, use_container_width=True)
+
+# Son 1000 haber yerine arşiv dahil tüm geçmiş; NEWS_ANALYTICS_ENGINE=off ile kapanır
+history_timeline = load_history('timeline')
+if history_timeline is not None and not history_timeline.empty:
+    st.markdown("---")
+    st.subheader("🗄️ Tüm Geçmiş (arşiv dahil)")
+    st.caption(f"Agregasyon motoru: {get_analytics().engine}")
+
+    # Motorlar yuvarlamaz (toplama sırası farkı 3. hanede sapma yaratır); gösterimde yuvarlanır
+    ui.plot_daily_timeline(history_timeline.round({'sentiment': 3}).rename(
+        columns={'sentiment': 'avg_sentiment', 'article_count': 'count'}
+    ))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Kaynak bazında duygu**")
+        st.dataframe(load_history('sentiment_by_source').round(3), use_container_width=True, hide_index=True)
+    with col2:
+        st.markdown("**Kaynak bazında çeyrekler**")
+        st.dataframe(load_history('quantiles'), use_container_width=True, hide_index=True)
+
+finish_rerun()
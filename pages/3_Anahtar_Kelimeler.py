@@ -4,10 +4,12 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.repository import DatabaseManager
-from analyzer.sentiment import NewsAnalyzer
+from dashboard.data import (
+    finish_rerun, get_analyzer, load_articles, load_statistics, load_trending_terms, start_rerun
+)
 
 st.set_page_config(page_title="Anahtar Kelimeler", page_icon="🔑", layout="wide")
+start_rerun("3_Anahtar_Kelimeler")
 
 st.markdown("""
     <style>
@@ -26,12 +28,8 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-db = DatabaseManager('news.db')
-analyzer = NewsAnalyzer()
-
-df = db.dbGetAllArticles(limit=1000)
-if not df.empty:
-    df = analyzer.analyze_batch(df)
+analyzer = get_analyzer()
+stats = load_statistics()
 
 st.markdown("""
     <div style='text-align: center; padding: 20px; background: rgba(102, 126, 234, 0.1); border-radius: 15px; margin-bottom: 20px; border: 2px solid rgba(102, 126, 234, 0.3);'>
@@ -40,12 +38,18 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-if df.empty:
+if stats['total_articles'] == 0:
     st.warning("⚠️ Henüz veri yok!")
     st.stop()
 
+windows = {"Tüm Geçmiş": None, "Son 30 Gün": 30, "Son 7 Gün": 7, "Bugün": 1}
+window = windows[st.sidebar.selectbox("📅 Zaman Aralığı", list(windows))]
+
 st.subheader("🔥 Trending Konular")
-trending = analyzer.get_trending_topics(df, top_n=15)
+trending = load_trending_terms(window_days=window, top_n=15)
+
+if not trending:
+    st.info("Seçilen aralıkta anahtar kelime yok.")
 
 col1, col2, col3 = st.columns(3)
 
@@ -58,16 +62,51 @@ for idx, (topic, count) in enumerate(trending):
 
 st.markdown("---")
 
-st.subheader("📊 Kaynak Bazında Anahtar Kelimeler")
+st.subheader("🚀 Yükselen Konular")
+st.caption("Son günün frekansı önceki 7 günün taban çizgisiyle karşılaştırılır")
+
+recent_df = load_articles(limit=20000, labeled=False)
+bursts = analyzer.cached('get_burst_topics', recent_df, top_n=10)
+
+if bursts.empty:
+    st.info("Yükselen konu tespit edilmedi.")
+else:
+    cols = st.columns(5)
+    for idx, row in bursts.iterrows():
+        with cols[idx % 5]:
+            st.metric(label=row['term'], value=f"{row['recent']}x",
+                      delta=f"z={row['score']:.1f}")
+
+st.markdown("---")
+
+st.subheader("📊 Grup Bazında Anahtar Kelimeler")
 
-sources = df['source'].unique()
+groupings = {"Kaynak": "source", "Gün": "day", "Duygu": "sentiment_label"}
+group_by = groupings[st.radio("Gruplama", list(groupings), horizontal=True)]
 
-for source in sources:
-    with st.expander(f"📰 {source}"):
-        source_df = df[df['source'] == source]
-        keywords = analyzer.extract_keywords(' '.join(source_df['title'].tolist()), top_n=10)
-        
+if group_by == "source":
+    # Kaynak kırılımı kalıcı terim indeksinden okunur
+    groups = [
+        (source, load_trending_terms(window_days=window, source=source, top_n=10))
+        for source in sorted(stats['sources'])
+    ]
+else:
+    # Diğer kırılımlar tek geçişte, son haberler üzerinden hesaplanır
+    grouped = analyzer.cached('keywords_by_group', recent_df, by=group_by, top_n=10)
+    if group_by == "day":
+        grouped = grouped[grouped['day'].isin(sorted(grouped['day'].unique())[-7:])]
+    groups = [
+        (str(key), list(zip(part['term'], part['count'])))
+        for key, part in grouped.groupby(group_by, sort=True)
+    ]
+    if group_by == "day":
+        groups.reverse()
+
+for name, keywords in groups:
+    with st.expander(f"📰 {name}"):
         cols = st.columns(5)
         for idx, (word, freq) in enumerate(keywords):
             with cols[idx % 5]:
-                st.info(f"**{word}**\n{freq}x")
\ No newline at end of file
+                st.info(f"**{word}**\n{freq}x")
+
+finish_rerun()
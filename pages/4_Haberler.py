@@ -4,10 +4,10 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.repository import DatabaseManager
-from analyzer.sentiment import NewsAnalyzer
+from dashboard.data import finish_rerun, get_ui, load_articles, start_rerun
 
 st.set_page_config(page_title="🏠 Ana Sayfa", page_icon="🏠", layout="wide")
+start_rerun("4_Haberler")
 
 st.markdown("""
     <style>
@@ -26,12 +26,8 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-db = DatabaseManager('news.db')
-analyzer = NewsAnalyzer()
-
-df = db.dbGetAllArticles(limit=1000)
-if not df.empty:
-    df = analyzer.analyze_batch(df)
+ui = get_ui()
+df = load_articles(limit=1000)
 
 st.markdown("""
     <div style='text-align: center; padding: 20px; background: rgba(102, 126, 234, 0.1); border-radius: 15px; margin-bottom: 20px; border: 2px solid rgba(102, 126, 234, 0.3);'>
@@ -54,7 +50,8 @@ if "↑" in sort_by:
 else:
     df = df.sort_values('sentiment', ascending=True)
 
-page_size = 20
+# Liste tek tablo olarak çizildiği için büyük sayfalar da sabit eleman sayısıyla gelir
+page_size = st.sidebar.selectbox("Sayfa başına", [20, 50, 100, 500], index=0)
 total_pages = len(df) // page_size + (1 if len(df) % page_size > 0 else 0)
 page = st.sidebar.number_input("Sayfa", min_value=1, max_value=max(1, total_pages), value=1)
 
@@ -63,20 +60,7 @@ end_idx = start_idx + page_size
 
 st.info(f"📄 Sayfa {page}/{total_pages} | Toplam: {len(df)} haber")
 
-for idx, row in df.iloc[start_idx:end_idx].iterrows():
-    sentiment_color = "🟢" if row['sentiment'] > 0.2 else "🔴" if row['sentiment'] < -0.2 else "🟡"
-    
-    with st.container():
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            st.markdown(f"### {sentiment_color} {row['title']}")
-            st.caption(f"📰 {row['source']} | 📅 {row['date']}")
-            if row['url']:
-                st.markdown(f"[🔗 Haberi Oku]({row['url']})")
-        
-        with col2:
-            st.metric("Sentiment", f"{row['sentiment']:.3f}")
-            st.caption(row.get('sentiment_label', 'Neutral'))
-        
-        st.markdown("---")
\ No newline at end of file
+# Renk, veritabanında merkezi eşiklerle saklanan etiketten gelir
+ui.render_news_list(df.iloc[start_idx:end_idx], sort_by=None, limit=page_size)
+
+finish_rerun()
@@ -0,0 +1,131 @@
+import streamlit as st
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analyzer.result_cache import shared_analysis_cache
+from dashboard.figures import shared_figure_cache
+from dashboard.data import clear_data_cache, get_db, rerun_stats
+
+st.set_page_config(page_title="Sistem Durumu", page_icon="⚙️", layout="wide")
+
+st.markdown("""
+    <style>
+    .main { background: white; }
+    h1, h2, h3 { color: #555 !important; }
+    [data-testid="stSidebar"] { background-color: #f8f9fa; }
+    [data-testid="stSidebar"] .stMarkdown { color: #333; }
+    [data-testid="stSidebar"] > div:first-child { padding-top: 2rem; }
+    [data-testid="stSidebar"] > div:first-child::before {
+        content: "📰 News Analyzer"; display: block; font-size: 1.5rem;
+        font-weight: 700; color: #667eea; text-align: center;
+        padding: 1rem 0; border-bottom: 2px solid #e0e0e0;
+        margin-bottom: 1.5rem; position: absolute; top: 0;
+        left: 0; right: 0; background: #f8f9fa; z-index: 999;
+    }
+    </style>
+""", unsafe_allow_html=True)
+
+db = get_db()
+
+st.markdown("""
+    <div style='text-align: center; padding: 20px; background: rgba(102, 126, 234, 0.1); border-radius: 15px; margin-bottom: 20px; border: 2px solid rgba(102, 126, 234, 0.3);'>
+        <h1 style='margin:0; font-size: 3em; color: #667eea;'>⚙️ Sistem Durumu</h1>
+        <p style='color: #555; font-size: 1.2em; margin: 10px 0 0 0;'>Sorgu önbelleği ve yazma kuyruğu metrikleri</p>
+    </div>
+""", unsafe_allow_html=True)
+
+st.subheader("🗄️ Sorgu Önbelleği")
+cache_stats = db.dbCacheStats()
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("Hit Oranı", f"{cache_stats['hit_rate'] * 100:.1f}%")
+
+with col2:
+    st.metric("Hit / Miss", f"{cache_stats['hits']} / {cache_stats['misses']}")
+
+with col3:
+    st.metric("Kayıt", f"{cache_stats['entries']} / {cache_stats['max_entries']}")
+
+with col4:
+    st.metric("Bellek", f"{cache_stats['bytes'] / 1024 / 1024:.2f} MB")
+
+st.caption(
+    f"Yazma nesli: {db.dbWriteGeneration()} | "
+    f"Geçersizleme: {cache_stats['invalidations']} | "
+    f"Tahliye (LRU): {cache_stats['evictions']}"
+)
+
+if st.button("🧹 Önbelleği Temizle"):
+    db.cache.clear()
+    clear_data_cache()
+    st.rerun()
+
+st.markdown("---")
+
+st.subheader("🧠 Analiz Önbelleği")
+analysis_cache = shared_analysis_cache()
+analysis_stats = analysis_cache.stats()
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("Hit Oranı", f"{analysis_stats['hit_rate'] * 100:.1f}%")
+
+with col2:
+    st.metric("Hit / Miss", f"{analysis_stats['hits']} / {analysis_stats['misses']}")
+
+with col3:
+    st.metric("Kayıt", f"{analysis_stats['entries']} / {analysis_stats['max_entries']}")
+
+with col4:
+    st.metric("Bellek", f"{analysis_stats['bytes'] / 1024 / 1024:.2f} MB")
+
+st.caption(f"TTL: {analysis_stats['ttl']:.0f} sn | Tahliye (LRU): {analysis_stats['evictions']}")
+
+if st.button("🧹 Analiz Önbelleğini Temizle"):
+    analysis_cache.clear()
+    st.rerun()
+
+st.markdown("---")
+
+st.subheader("🖼️ Figür Önbelleği")
+st.caption("Grafikler küçük özetlerinin hash'iyle JSON olarak saklanır")
+figure_cache = shared_figure_cache()
+figure_stats = figure_cache.stats()
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("Hit Oranı", f"{figure_stats['hit_rate'] * 100:.1f}%")
+
+with col2:
+    st.metric("Hit / Miss", f"{figure_stats['hits']} / {figure_stats['misses']}")
+
+with col3:
+    st.metric("Kayıt", f"{figure_stats['entries']} / {figure_stats['max_entries']}")
+
+with col4:
+    st.metric("Bellek", f"{figure_stats['bytes'] / 1024 / 1024:.2f} MB")
+
+if st.button("🧹 Figür Önbelleğini Temizle"):
+    figure_cache.clear()
+    st.rerun()
+
+st.markdown("---")
+
+st.subheader("⏱️ Sayfa Rerun Süreleri")
+st.caption("Veri katmanı önbelleği yazma nesli değişene kadar SQLite'a gitmez")
+reruns = rerun_stats()
+if reruns.empty:
+    st.info("Henüz ölçüm yok; sayfalar açıldıkça dolar.")
+else:
+    st.dataframe(reruns, use_container_width=True, hide_index=True)
+
+st.markdown("---")
+
+st.subheader("✍️ Yazma Kuyruğu")
+st.json(db.dbWriterMetrics())
@@ -0,0 +1,139 @@
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RUNNING = "running"
+SAVING = "saving"
+DONE = "done"
+FAILED = "failed"
+
+
+class ScrapeJob:
+    """Tek bir arka plan scrape işinin durumu; tüm okumalar snapshot() üzerinden"""
+
+    def __init__(self, job_id: int, sources: List[str]):
+        self.id = job_id
+        self.state = RUNNING
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.sources: Dict[str, Dict] = {
+            source: {"state": "pending", "count": 0, "error": None} for source in sources
+        }
+        self.totals = {"scraped": 0, "saved": 0, "duplicate": 0, "failed": 0}
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return not self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def update_source(self, source: str, **fields):
+        with self._lock:
+            self.sources.setdefault(source, {"state": "pending", "count": 0, "error": None})
+            self.sources[source].update(fields)
+
+    def update_totals(self, state: Optional[str] = None, **totals):
+        with self._lock:
+            if state:
+                self.state = state
+            self.totals.update(totals)
+
+    def finish(self, state: str, error: Optional[str] = None):
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.finished_at = datetime.now()
+        self._done.set()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            end = self.finished_at or datetime.now()
+            return {
+                "id": self.id,
+                "state": self.state,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "elapsed_sec": round((end - self.started_at).total_seconds(), 1),
+                "sources": {name: dict(info) for name, info in self.sources.items()},
+                "totals": dict(self.totals),
+                "error": self.error,
+            }
+
+
+class ScrapeJobManager:
+    """
+    Süreç genelinde tek scrape işinin sahibi.
+
+    submit() işi bir daemon thread'de başlatır ve hemen döner; iş sürerken
+    yapılan ikinci submit() yeni scrape başlatmaz, mevcut işi döndürür.
+    Kaynak bazlı ilerleme scraper.scrape_all'ın progress geri çağrısıyla gelir.
+    """
+
+    def __init__(self, scraper, db_manager, history: int = 10):
+        self.scraper = scraper
+        self.db = db_manager
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._current: Optional[ScrapeJob] = None
+        self._history: deque = deque(maxlen=history)
+
+    def submit(self) -> ScrapeJob:
+        with self._lock:
+            if self._current is not None and self._current.is_running:
+                return self._current
+
+            job = ScrapeJob(next(self._ids), list(getattr(self.scraper, "SOURCES", {})))
+            self._current = job
+            self._history.appendleft(job)
+
+        threading.Thread(
+            target=self._run, args=(job,), name=f"scrape-job-{job.id}", daemon=True
+        ).start()
+        return job
+
+    def current(self) -> Optional[ScrapeJob]:
+        """Son başlatılan iş (bitmiş olabilir)"""
+        with self._lock:
+            return self._current
+
+    def get(self, job_id: int) -> Optional[ScrapeJob]:
+        with self._lock:
+            return next((job for job in self._history if job.id == job_id), None)
+
+    def history(self) -> List[Dict]:
+        with self._lock:
+            jobs = list(self._history)
+        return [job.snapshot() for job in jobs]
+
+    def _run(self, job: ScrapeJob):
+        started = time.perf_counter()
+        try:
+            articles = self.scraper.scrape_all(
+                db_manager=self.db,
+                progress=lambda source, info: job.update_source(source, **info)
+            )
+            job.update_totals(SAVING, scraped=len(articles))
+
+            result = self.db.dbInsertArticlesBulk(articles)
+            job.update_totals(
+                saved=result.get("saved", 0),
+                duplicate=result.get("duplicate", 0),
+                failed=result.get("failed", 0)
+            )
+            job.finish(DONE)
+            logger.info(
+                f"Scrape işi {job.id} bitti: {job.totals} ({time.perf_counter() - started:.1f} sn)"
+            )
+        except Exception as e:
+            logger.error(f"Scrape işi {job.id} başarısız: {e}")
+            job.finish(FAILED, str(e))
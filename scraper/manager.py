@@ -2,11 +2,11 @@ import requests
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from textblob import TextBlob
-from typing import List
+from typing import Callable, Dict, List, Optional
 import logging
 import random
 from models.News import News
+from analyzer.scorers import SentimentScorer, get_scorer
 
 # Logging ayarla
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +31,14 @@ class NewsScraper:
         "world", "business", "science", "technology", "health"
     ]
 
+    # scrape_all'ın çalıştırdığı kaynaklar (ilerleme anahtarı -> metot)
+    SOURCES = {
+        'BBC': 'scrape_bbc',
+        'CNN': 'scrape_cnn',
+        'Al Jazeera': 'scrape_aljazeera',
+        'NPR': 'scrape_npr',
+    }
+
     # Her kaynak için kategori indexi (Streamlit session_state ile tutulabilir)
     category_indices = {
         'bbc': 0,
@@ -39,8 +47,10 @@ class NewsScraper:
         'npr': 0
     }
 
-    def __init__(self, max_workers=4):
+    def __init__(self, max_workers=4, scorer: str = None):
         self.max_workers = max_workers
+        # Skorlayıcı registry'den seçilir (None: NEWS_SENTIMENT_SCORER / textblob)
+        self.scorer: SentimentScorer = get_scorer(scorer)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -69,7 +79,18 @@ class NewsScraper:
             return cat
         return None
 
-    def scrape_bbc(self) -> List[News]:
+    def score_articles(self, articles: List[News]) -> List[News]:
+        """Haberleri tek score_many çağrısıyla skorlar ve model sürümünü yazar"""
+        if not articles:
+            return articles
+
+        scores = self.scorer.score_many([article.title for article in articles])
+        for article, polarity in zip(articles, scores.polarity):
+            article.sentiment = float(polarity)
+            article.sentiment_model_version = self.scorer.version
+        return articles
+
+    def scrape_bbc(self, score: bool = True) -> List[News]:
         """BBC News'den kategori bazlı haber çek"""
         category = self.get_next_category('bbc')
         url = f"https://www.bbc.com/news/{category}"
@@ -93,7 +114,6 @@ class NewsScraper:
                     continue
                 seen_titles.add(title)
                 
-                sentiment = TextBlob(title).sentiment.polarity
                 link_tag = tag.find_parent('a')
                 url_path = ''
                 if link_tag and link_tag.get('href'):
@@ -107,7 +127,7 @@ class NewsScraper:
                         title=title,
                         url=url_path,
                         source='BBC News',
-                        sentiment=sentiment,
+                        sentiment=0.0,
                         date=datetime.now()
                     )
                     articles.append(article)
@@ -117,9 +137,9 @@ class NewsScraper:
             logger.info(f"BBC: {len(articles)} haber çekildi ({category})")
         except Exception as e:
             logger.error(f"BBC hatası: {e}")
-        return articles
+        return self.score_articles(articles) if score else articles
 
-    def scrape_cnn(self) -> List[News]:
+    def scrape_cnn(self, score: bool = True) -> List[News]:
         """CNN'den haber çek"""
         articles = []
         seen_titles = set()
@@ -146,8 +166,6 @@ class NewsScraper:
                     continue
                 seen_titles.add(title)
 
-                sentiment = TextBlob(title).sentiment.polarity
-
                 parent = headline.find_parent('a')
                 url_path = ''
                 if parent and parent.get('href'):
@@ -163,7 +181,7 @@ class NewsScraper:
                         title=title,
                         url=url_path,
                         source='CNN',
-                        sentiment=sentiment,
+                        sentiment=0.0,
                         date=datetime.now()
                     )
                     articles.append(article)
@@ -176,9 +194,9 @@ class NewsScraper:
         except Exception as e:
             logger.error(f"CNN hatası: {e}")
 
-        return articles
+        return self.score_articles(articles) if score else articles
 
-    def scrape_aljazeera(self) -> List[News]:
+    def scrape_aljazeera(self, score: bool = True) -> List[News]:
         """Al Jazeera'dan haber çek"""
         articles = []
         seen_titles = set()
@@ -209,8 +227,6 @@ class NewsScraper:
                     continue
                 seen_titles.add(title)
 
-                sentiment = TextBlob(title).sentiment.polarity
-
                 url_path = link.get('href', '')
                 if url_path and not url_path.startswith('http'):
                     url_path = 'https://www.aljazeera.com' + url_path
@@ -221,7 +237,7 @@ class NewsScraper:
                         title=title,
                         url=url_path,
                         source='Al Jazeera',
-                        sentiment=sentiment,
+                        sentiment=0.0,
                         date=datetime.now()
                     )
                     articles.append(article)
@@ -237,9 +253,9 @@ class NewsScraper:
         except Exception as e:
             logger.error(f"Al Jazeera hatası: {e}")
 
-        return articles
+        return self.score_articles(articles) if score else articles
 
-    def scrape_npr(self) -> List[News]:
+    def scrape_npr(self, score: bool = True) -> List[News]:
         """NPR'den haber çek"""
         articles = []
         seen_titles = set()
@@ -281,8 +297,6 @@ class NewsScraper:
                         continue
                     seen_titles.add(title)
 
-                    sentiment = TextBlob(title).sentiment.polarity
-
                     if url_path and not url_path.startswith('http'):
                         url_path = 'https://www.npr.org' + url_path
 
@@ -292,7 +306,7 @@ class NewsScraper:
                             title=title,
                             url=url_path,
                             source='NPR',
-                            sentiment=sentiment,
+                            sentiment=0.0,
                             date=datetime.now()
                         )
                         articles.append(article)
@@ -309,43 +323,45 @@ class NewsScraper:
         except Exception as e:
             logger.error(f"NPR hatası: {e}")
 
-        return articles
+        return self.score_articles(articles) if score else articles
 
-    def scrape_all(self, db_manager=None) -> List[News]:
+    def scrape_all(
+        self, db_manager=None, progress: Optional[Callable[[str, Dict], None]] = None
+    ) -> List[News]:
         """
         Tüm kaynaklardan paralel olarak haber çek
         Threading kullanarak performansı artırır
         
         Args:
             db_manager: Database manager instance (duplicate kontrolü için)
+            progress: Kaynak durumu değiştikçe (kaynak, {'state', 'count', 'error'}) ile çağrılır
 
         Returns:
             List[News]: Toplanan tüm haberler (News nesneleri)
         """
         logger.info("Paralel scraping başlatılıyor...")
 
-        # Tüm scraping fonksiyonları
-        scraping_functions = [
-            self.scrape_bbc,
-            self.scrape_cnn,
-            self.scrape_aljazeera,
-            self.scrape_npr
-        ]
-
+        report = progress or (lambda source, info: None)
         all_articles_by_source = []
 
         # ThreadPoolExecutor ile paralel çalıştır
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Tüm fonksiyonları submit et
-            futures = [executor.submit(func) for func in scraping_functions]
+            # Skorlama seçilen haberler için en sonda tek batch halinde yapılır
+            futures = {}
+            for source, method in self.SOURCES.items():
+                futures[source] = executor.submit(getattr(self, method), False)
+                report(source, {"state": "running"})
 
             # Sonuçları kaynak bazında topla
-            for future in futures:
+            for source, future in futures.items():
                 try:
                     articles = future.result(timeout=30)
+                    report(source, {"state": "done", "count": len(articles)})
                     if articles:
                         all_articles_by_source.append(articles)
                 except Exception as e:
+                    report(source, {"state": "failed", "error": str(e) or type(e).__name__})
                     logger.error(f"Thread hatası: {e}")
 
         # Bugün database'de olan başlıkları al (duplicate kontrolü için)
@@ -403,4 +419,4 @@ class NewsScraper:
         selected_articles = guaranteed + rest
         
         logger.info(f"Toplam {len(selected_articles)} haber seçildi (her kaynaktan min 1)")
-        return selected_articles
\ No newline at end of file
+        return self.score_articles(selected_articles)
\ No newline at end of file
@@ -0,0 +1,111 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from database.repository import DatabaseManager
+from models.News import News
+from scraper.jobs import DONE, FAILED, ScrapeJobManager
+from scraper.manager import NewsScraper
+
+
+class BlockingScraper:
+    """scrape_all'ı test kontrol edene kadar bekleten sahte scraper"""
+
+    SOURCES = {'BBC': None, 'CNN': None}
+
+    def __init__(self, fail: bool = False):
+        self.release = threading.Event()
+        self.calls = 0
+        self.fail = fail
+
+    def scrape_all(self, db_manager=None, progress=None):
+        self.calls += 1
+        progress('BBC', {'state': 'done', 'count': 2})
+        progress('CNN', {'state': 'running'})
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError('network down')
+        progress('CNN', {'state': 'failed', 'error': 'timeout'})
+        return [News(title=f'Job headline {i}', url=f'j{i}', source='BBC', sentiment=0.2) for i in range(2)]
+
+
+class TestScrapeJobs(unittest.TestCase):
+    """Arka plan scrape işi, ilerleme ve tekrar tıklamada işe katılma"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir, "news.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_second_submit_joins_running_job(self):
+        scraper = BlockingScraper()
+        jobs = ScrapeJobManager(scraper, self.db)
+
+        first = jobs.submit()
+        second = jobs.submit()
+        self.assertIs(first, second)
+        self.assertTrue(first.is_running)
+
+        snapshot = first.snapshot()
+        self.assertEqual(snapshot['sources']['BBC'], {'state': 'done', 'count': 2, 'error': None})
+
+        scraper.release.set()
+        self.assertTrue(first.wait(5))
+        snapshot = first.snapshot()
+        self.assertEqual(snapshot['state'], DONE)
+        self.assertEqual(snapshot['totals']['saved'], 2)
+        self.assertEqual(snapshot['sources']['CNN']['error'], 'timeout')
+        self.assertEqual(scraper.calls, 1)
+        self.assertEqual(self.db.dbGetStatistics()['total_articles'], 2)
+
+        # Bitmiş işten sonra yeni tıklama yeni iş başlatır
+        third = jobs.submit()
+        self.assertNotEqual(third.id, first.id)
+        self.assertTrue(third.wait(5))
+        self.assertEqual(jobs.get(first.id).id, first.id)
+        self.assertEqual(len(jobs.history()), 2)
+
+    def test_failure_is_reported(self):
+        scraper = BlockingScraper(fail=True)
+        scraper.release.set()
+        job = ScrapeJobManager(scraper, self.db).submit()
+        self.assertTrue(job.wait(5))
+        self.assertEqual(job.snapshot()['state'], FAILED)
+        self.assertIn('network down', job.snapshot()['error'])
+
+    def test_scrape_all_reports_each_source(self):
+        scraper = NewsScraper(max_workers=2)
+        events = []
+        articles = {
+            'scrape_bbc': [News(title='Bbc story', url='b', source='BBC', sentiment=0.0)],
+            'scrape_cnn': [],
+            'scrape_aljazeera': [News(title='Aj story', url='a', source='Al Jazeera', sentiment=0.0)],
+        }
+
+        def fake(method):
+            def run(score=True):
+                if method == 'scrape_npr':
+                    raise ConnectionError('npr down')
+                return list(articles[method])
+            return run
+
+        with patch.multiple(scraper, **{m: fake(m) for m in NewsScraper.SOURCES.values()}):
+            selected = scraper.scrape_all(progress=lambda source, info: events.append((source, info)))
+
+        final = {source: info for source, info in events if info['state'] != 'running'}
+        self.assertEqual(final['BBC'], {'state': 'done', 'count': 1})
+        self.assertEqual(final['CNN'], {'state': 'done', 'count': 0})
+        self.assertEqual(final['NPR']['state'], 'failed')
+        self.assertEqual(len(selected), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)